@@ -10,3 +10,7 @@ class AuthConfig:
     user_confirm_key: str = "user_confirm_{token}"
     access_token_name: str = "access_token"
     refresh_token_name: str = "refresh_token"
+    hash_workers: int = 4
+    principal_cache_ttl: int = 30
+    principal_cache_size: int = 10_000
+    token_cache_size: int = 10_000
@@ -5,6 +5,7 @@ from src.api.handlers.user import auth_router, user_router
 from src.api.handlers.vacancy.vacancy import vacancy_router
 from src.api.handlers.work_experience.work_experience import work_experience_router
 from src.api.handlers.response.response import response_router
+from src.api.handlers.metrics.metrics import metrics_router
 
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "resume_router",
     "work_experience_router",
     "vacancy_router",
-    "response_router"
+    "response_router",
+    "metrics_router"
 ]
 
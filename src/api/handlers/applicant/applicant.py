@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 from src.api.handlers.applicant.requests.applicant import UpdateApplicantRequest
+from src.api.handlers.applicant.requests.saved_search import CreateSavedSearchRequest
 from src.api.handlers.applicant.response.applicant import ApplicantOut
+from src.api.handlers.applicant.response.recommendation import RecommendedVacancyResponse
+from src.api.handlers.applicant.response.saved_search import SavedSearchResponse
 from src.api.handlers.user.response.user import UserOut
 from src.api.permissions import applicant_required
 from src.api.providers.abstract.services import applicant_service_provider
 from src.api.providers.auth import TokenAuthDep
 from src.dto.services.applicant.applicant import UpdateApplicantDTO
+from src.dto.services.applicant.saved_search import CreateSavedSearchDTO
 from src.services.applicant.applicant import ApplicantService
 
 
@@ -40,6 +44,45 @@ async def update_applicant(
     return {"detail": "Applicant has been updated"}
 
 
+@applicant_router.get(
+    "/me/recommendations",
+    status_code=status.HTTP_200_OK,
+    response_model=list[RecommendedVacancyResponse],
+    responses={
+        200: {"description": "Vacancies recommended for applicant, best first"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Applicant access required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@applicant_required
+async def get_recommended_vacancies(
+        auth: TokenAuthDep,
+        limit: int = Query(20, ge=1, le=50),
+        applicant_service: ApplicantService = Depends(applicant_service_provider)
+):
+    recommendations = await applicant_service.get_recommended_vacancies(auth.request.state.user.user_id, limit)
+
+    return [
+        RecommendedVacancyResponse(
+            vacancy_id=item.vacancy.vacancy_id,
+            title=item.vacancy.title,
+            profession=item.vacancy.profession,
+            company_id=item.vacancy.company.user.user_id,
+            company_name=item.vacancy.company.company_name,
+            address=item.vacancy.company.address,
+            location=item.vacancy.location,
+            salary_min=item.vacancy.salary_min,
+            salary_max=item.vacancy.salary_max,
+            salary_currency=item.vacancy.salary_currency,
+            experience_start=item.vacancy.experience_start,
+            experience_end=item.vacancy.experience_end,
+            score=item.score
+        )
+        for item in recommendations
+    ]
+
+
 @applicant_router.get(
     "/{applicant_id}",
     status_code=status.HTTP_200_OK,
@@ -69,3 +112,78 @@ async def get_applicant(
         is_confirmed=applicant_data.is_confirmed,
         level_education=applicant_data.level_education
     )
+
+
+@applicant_router.post(
+    "/me/saved_searches",
+    status_code=status.HTTP_201_CREATED,
+    response_model=SavedSearchResponse,
+    responses={
+        201: {"description": "Search saved, new vacancies which match it are sent by email"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Applicant access required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@applicant_required
+async def create_saved_search(
+        saved_search_data: CreateSavedSearchRequest,
+        auth: TokenAuthDep,
+        applicant_service: ApplicantService = Depends(applicant_service_provider)
+):
+    """
+    New published vacancies are matched as by search of vacancies: salary bounds are compared in base
+    currency with vacancies in any currency, currency without bounds means salary in this currency,
+    location is a substring. Profession is matched by words: all words of it must be among words of
+    vacancy profession, while search of vacancies looks for a substring.
+    """
+    saved_search = await applicant_service.create_saved_search(
+        CreateSavedSearchDTO(
+            applicant_id=auth.request.state.user.user_id,
+            **saved_search_data.__dict__
+        )
+    )
+
+    return SavedSearchResponse(**saved_search.__dict__)
+
+
+@applicant_router.get(
+    "/me/saved_searches",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SavedSearchResponse],
+    responses={
+        200: {"description": "Saved searches of applicant"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Applicant access required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@applicant_required
+async def get_saved_searches(
+        auth: TokenAuthDep,
+        applicant_service: ApplicantService = Depends(applicant_service_provider)
+):
+    saved_searches = await applicant_service.get_saved_searches(auth.request.state.user.user_id)
+
+    return [SavedSearchResponse(**saved_search.__dict__) for saved_search in saved_searches]
+
+
+@applicant_router.delete(
+    "/me/saved_searches/{saved_search_id}",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {"description": "Saved search deleted"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Applicant access required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@applicant_required
+async def delete_saved_search(
+        saved_search_id: int,
+        auth: TokenAuthDep,
+        applicant_service: ApplicantService = Depends(applicant_service_provider)
+):
+    await applicant_service.delete_saved_search(saved_search_id, auth.request.state.user.user_id)
+
+    return {"detail": "Saved search deleted"}
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+from src.core.enums import Currency, EmploymentType
+
+
+class CreateSavedSearchRequest(BaseModel):
+    name: str = Field(..., max_length=50)
+    profession: str | None = Field(None, max_length=30)
+    location: str | None = Field(None, max_length=100)
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
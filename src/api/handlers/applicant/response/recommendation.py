@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from src.core.enums import Currency
+
+
+class RecommendedVacancyResponse(BaseModel):
+    vacancy_id: int
+    title: str
+    profession: str
+    company_id: int
+    company_name: str
+    score: float
+    address: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    experience_start: int | None = None
+    experience_end: int | None = None
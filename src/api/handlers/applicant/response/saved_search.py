@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.core.enums import Currency, EmploymentType
+
+
+class SavedSearchResponse(BaseModel):
+    saved_search_id: int
+    name: str
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
+    created_at: datetime | None = None
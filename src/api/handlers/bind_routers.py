@@ -10,13 +10,15 @@ from src.api.handlers import (
     resume_router,
     work_experience_router,
     vacancy_router,
-    respond_on_vacancy_router
+    respond_on_vacancy_router,
+    metrics_router
 )
 
 from src.api.handlers.exceptions import (
     auth_exception_handler,
     validation_exception_handler,
     request_validation_exception_handler,
+    search_exception_handler,
     user_exception_handler,
     applicant_exception_handler,
     company_exception_handler,
@@ -36,12 +38,14 @@ from src.exceptions.infrascructure.company.company import BaseCompanyException
 from src.exceptions.infrascructure.respond_on_vacancy.respond_on_vacancy import BaseRespondOnVacancyException
 from src.exceptions.infrascructure.vacancy.vacancy import BaseVacancyException
 from src.exceptions.services.auth import AuthException
+from src.exceptions.services.search import SearchException
 
 
 def bind_exceptions_handlers(app: FastAPI):
     app.add_exception_handler(AuthException, auth_exception_handler)  # type: ignore
     app.add_exception_handler(ValidationError, validation_exception_handler)  # type: ignore
     app.add_exception_handler(RequestValidationError, request_validation_exception_handler)  # type: ignore
+    app.add_exception_handler(SearchException, search_exception_handler)  # type: ignore
 
     """
     Подправить те, которые идут снизу, чтобы не из инфры были exceptions, а из сервисов!
@@ -65,6 +69,7 @@ def bind_routers():
     api_routers.include_router(work_experience_router)
     api_routers.include_router(vacancy_router)
     api_routers.include_router(respond_on_vacancy_router)
+    api_routers.include_router(metrics_router)
 
     return api_routers
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, status, Response
 
 from src.api.handlers.company.requests.company import UpdateCompanyRequest, SearchCompanyRequest
 from src.api.handlers.company.response.company import CompanyOut, CompanyDataResponse
@@ -8,6 +8,7 @@ from src.api.providers.abstract.services import company_service_provider
 from src.api.providers.auth import TokenAuthDep
 from src.dto.services.company.company import UpdateCompanyDTO, SearchDTO
 from src.services.company.company import CompanyService
+from src.utils.cursor import encode_cursor
 
 
 company_router = APIRouter(prefix="/companies", tags=["Companies"])
@@ -77,12 +78,17 @@ async def get_company(
     }
 )
 async def search_company(
+        response: Response,
         search_company_data: SearchCompanyRequest = Depends(),
         company_service: CompanyService = Depends(company_service_provider)
 ):
     search_dto = SearchDTO(**search_company_data.__dict__)
     companies = await company_service.search_companies(search_dto)
 
+    if companies and len(companies) == search_company_data.limit:
+        last = companies[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.company_name, last.company_id)
+
     return [
         CompanyDataResponse(**company.__dict__)
         for company in companies
@@ -11,3 +11,4 @@ class SearchCompanyRequest(BaseModel):
     company_name: str | None = None
     offset: int = 0
     limit: int = 100
+    cursor: str | None = None
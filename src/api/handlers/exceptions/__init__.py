@@ -1,7 +1,8 @@
 from src.api.handlers.exceptions.common_exc_handlers import (
     auth_exception_handler,
     validation_exception_handler,
-    request_validation_exception_handler
+    request_validation_exception_handler,
+    search_exception_handler
 )
 from src.api.handlers.exceptions.response_exc_handlers import response_exception_handler
 from src.api.handlers.exceptions.resume_exc_handlers import resume_exception_handler
@@ -16,6 +17,7 @@ __all__ = [
     "auth_exception_handler",
     "validation_exception_handler",
     "request_validation_exception_handler",
+    "search_exception_handler",
     "user_exception_handler",
     "applicant_exception_handler",
     "company_exception_handler",
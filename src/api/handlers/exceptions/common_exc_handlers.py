@@ -6,12 +6,17 @@ from pydantic import ValidationError
 
 from src.exceptions.base import BaseExceptions
 from src.exceptions.services.auth import AuthException
+from src.exceptions.services.search import SearchException
 
 
 async def auth_exception_handler(_, exc: AuthException):
     return JSONResponse(status_code=401, content={"message": exc.message()})
 
 
+async def search_exception_handler(_, exc: SearchException):
+    return JSONResponse(status_code=400, content={"message": exc.message()})
+
+
 async def db_exception_handler(_, exc: BaseExceptions):
     return JSONResponse(status_code=401, content={"message": exc.message()})
 
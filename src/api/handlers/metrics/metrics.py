@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.api.handlers.metrics.response.metrics import SearchCacheStatsResponse, PoolStatsResponse, HasherStatsResponse
+from src.api.permissions import admin_required
+from src.api.providers.abstract.services import metrics_service_provider
+from src.api.providers.auth import TokenAuthDep
+from src.services.metrics.metrics import MetricsService
+
+
+metrics_router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/search-cache",
+    status_code=status.HTTP_200_OK,
+    response_model=list[SearchCacheStatsResponse],
+    responses={
+        200: {"description": "Hits and misses of search cache per scope"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@admin_required
+async def get_search_cache_stats(
+        auth: TokenAuthDep,
+        metrics_service: MetricsService = Depends(metrics_service_provider)
+):
+    stats = await metrics_service.get_search_cache_stats()
+
+    return [
+        SearchCacheStatsResponse(
+            scope=s.scope,
+            hits=s.hits,
+            misses=s.misses,
+            generation=s.generation
+        )
+        for s in stats
+    ]
+
+
+@metrics_router.get(
+    "/pools",
+    status_code=status.HTTP_200_OK,
+    response_model=list[PoolStatsResponse],
+    responses={
+        200: {"description": "Connections of database and Redis pools shared by requests, checkout waits of database pool"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@admin_required
+async def get_pool_stats(
+        auth: TokenAuthDep,
+        metrics_service: MetricsService = Depends(metrics_service_provider)
+):
+    stats = await metrics_service.get_pool_stats()
+
+    return [
+        PoolStatsResponse(
+            name=s.name,
+            size=s.size,
+            in_use=s.in_use,
+            idle=s.idle,
+            overflow=s.overflow,
+            checkouts=s.checkouts,
+            checkout_wait_avg_ms=s.checkout_wait_avg_ms,
+            checkout_wait_max_ms=s.checkout_wait_max_ms,
+            overflow_checkouts=s.overflow_checkouts,
+            checkout_timeouts=s.checkout_timeouts
+        )
+        for s in stats
+    ]
+
+
+@metrics_router.get(
+    "/hasher",
+    status_code=status.HTTP_200_OK,
+    response_model=HasherStatsResponse,
+    responses={
+        200: {"description": "Password hashes running in the pool and waiting in its queue"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Admin access required"},
+        404: {"description": "Hasher is not provided"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@admin_required
+async def get_hasher_stats(
+        auth: TokenAuthDep,
+        metrics_service: MetricsService = Depends(metrics_service_provider)
+):
+    stats = await metrics_service.get_hasher_stats()
+    if stats is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Hasher is not provided")
+
+    return HasherStatsResponse(
+        max_workers=stats.max_workers,
+        running=stats.running,
+        queued=stats.queued
+    )
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class SearchCacheStatsResponse(BaseModel):
+    scope: str
+    hits: int
+    misses: int
+    generation: int
+
+
+class PoolStatsResponse(BaseModel):
+    name: str
+    size: int
+    in_use: int
+    idle: int
+    overflow: int
+    checkouts: int
+    checkout_wait_avg_ms: float
+    checkout_wait_max_ms: float
+    overflow_checkouts: int
+    checkout_timeouts: int
+
+
+class HasherStatsResponse(BaseModel):
+    max_workers: int
+    running: int
+    queued: int
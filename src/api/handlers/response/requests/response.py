@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+from src.core.enums import StatusRespond
+
+
+class ChangeStatusResponsesRequest(BaseModel):
+    response_ids: list[int] = Field(..., min_length=1, max_length=100)
+    status_response: StatusRespond
+    message: str | None = None
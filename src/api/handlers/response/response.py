@@ -1,10 +1,15 @@
 from fastapi import APIRouter, Depends, status, Body
 
+from src.api.handlers.response.requests.response import ChangeStatusResponsesRequest
 from src.api.permissions import company_required, applicant_required, login_required
 from src.api.providers.abstract.services import response_service_provider
 from src.api.providers.auth import TokenAuthDep
 from src.core.enums import ActorType, StatusRespond
-from src.dto.services.response.response import CreateResponseDTO, ChangeStatusResponseDTO
+from src.dto.services.response.response import (
+    CreateResponseDTO,
+    ChangeStatusResponseDTO,
+    ChangeStatusResponsesDTO
+)
 from src.services.response.response import ResponseService
 
 
@@ -103,3 +108,32 @@ async def change_status_respond(
     )
     await respond_service.change_status_response(respond_dto)
     return {"detail": f"Status changed on {status_response}"}
+
+
+@response_router.patch(
+    "/change_status",
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        202: {"description": "Responds changed"},
+        400: {"description": "You cannot change one of these responses"},
+        403: {"description": "Login required"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@login_required
+async def change_status_responds(
+        auth: TokenAuthDep,
+        change_request: ChangeStatusResponsesRequest,
+        respond_service: ResponseService = Depends(response_service_provider)
+):
+    responder_type = ActorType.COMPANY if auth.request.state.user.type == "company" else ActorType.APPLICANT
+
+    respond_dto = ChangeStatusResponsesDTO(
+        user_id=auth.request.state.user.user_id,
+        response_ids=change_request.response_ids,
+        message=change_request.message,
+        responder_type=responder_type,
+        status=change_request.status_response
+    )
+    await respond_service.change_status_responses(respond_dto)
+    return {"detail": f"Status of {len(change_request.response_ids)} responds changed on {change_request.status_response}"}
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 
-from src.core.enums import Currency, EmploymentType, GenderEnum
+from src.core.enums import Currency, EmploymentType, GenderEnum, SkillsMatch
 
 
 class CreateResumeRequest(BaseModel):
@@ -37,5 +37,7 @@ class SearchResumeRequest(BaseModel):
     max_age: int | None = None
     start_experience_years: int | None = None
     end_experience_years: int | None = None
+    skills_match: SkillsMatch = SkillsMatch.ALL
     offset: int | None = None
     limit: int | None = None
+    cursor: str | None = None
@@ -4,7 +4,7 @@ from pydantic import BaseModel
 
 from src.api.handlers.applicant.response.applicant import ApplicantOut
 from src.api.handlers.work_experience.response.work_experience import WorkExperienceResponse
-from src.core.enums import Currency, EmploymentType
+from src.core.enums import Currency, EmploymentType, GenderEnum, ExperienceBucket
 
 
 class ResumeOutResponse(BaseModel):
@@ -46,3 +46,15 @@ class ResumeSearchOutResponse(BaseModel):
     location: str | None = None
     total_months: int | None = None
     work_experiences: list[WorkExperienceResponse] | None = None
+
+
+class ResumeFacetsResponse(BaseModel):
+    type_of_employment: dict[EmploymentType, int]
+    salary_currency: dict[Currency, int]
+    gender: dict[GenderEnum, int]
+    experience: dict[ExperienceBucket, int]
+
+
+class ResumeSearchWithFacetsResponse(BaseModel):
+    resumes: list[ResumeSearchOutResponse]
+    facets: ResumeFacetsResponse
@@ -1,8 +1,14 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, status, Query, Response
 
 from src.api.handlers.applicant.response.applicant import ApplicantOut
 from src.api.handlers.resume.requests.resume import CreateResumeRequest, UpdateResumeRequest, SearchResumeRequest
-from src.api.handlers.resume.response.resume import ResumeOutResponse, ResumeResponse, ResumeSearchOutResponse
+from src.api.handlers.resume.response.resume import (
+    ResumeOutResponse,
+    ResumeResponse,
+    ResumeSearchOutResponse,
+    ResumeSearchWithFacetsResponse,
+    ResumeFacetsResponse
+)
 from src.api.handlers.user.response.user import UserOut
 from src.api.handlers.work_experience.response.work_experience import WorkExperienceResponse
 from src.api.permissions import applicant_required
@@ -11,6 +17,7 @@ from src.api.providers.auth import TokenAuthDep
 from src.dto.services.resume.resume import CreateResumeDTO, UpdateResumeDTO, SearchResumeDTO
 from src.core.enums import EmploymentType
 from src.services.resume.resume import ResumeService
+from src.utils.cursor import encode_cursor
 
 
 resume_router = APIRouter(
@@ -73,81 +80,32 @@ async def update_resume(
     return {"detail": "Resume updated"}
 
 
-@resume_router.get(
-    "/{resume_id}",
-    status_code=status.HTTP_200_OK,
-    response_model=ResumeResponse,
-    responses={
-        200: {"description": "Resume"},
-        404: {"description": "Resume not found"},
-        500: {"description": "Internal Server Error"}
-    }
-
-)
-async def get_resume_by_id(
-        resume_id: int,
-        resume_service: ResumeService = Depends(resume_service_provider)
-):
-    resume_data = await resume_service.get_resume_by_id(resume_id)
-
-    return ResumeResponse(
-        resume_id=resume_data.resume_id,
-        name_resume=resume_data.name_resume,
-        profession=resume_data.profession,
-        key_skills=resume_data.key_skills,
-        salary_min=resume_data.salary_min,
-        salary_max=resume_data.salary_max,
-        salary_currency=resume_data.salary_currency,
-        location=resume_data.location,
-        applicant=ApplicantOut(
-            user=UserOut(
-                user_id=resume_data.applicant.applicant_id,
-                last_name=resume_data.applicant.user.last_name,
-                first_name=resume_data.applicant.user.first_name,
-                email=resume_data.applicant.user.email
-            ),
-            description_applicant=resume_data.applicant.description_applicant,
-            gender=resume_data.applicant.gender,
-            address=resume_data.applicant.address,
-            is_confirmed=resume_data.applicant.is_confirmed,
-            level_education=resume_data.applicant.level_education,
-        ),
-        type_of_employment=resume_data.type_of_employment,
-        work_experience=[
-            WorkExperienceResponse(
-                work_experience_id=we.work_experience_id,
-                resume_id=we.resume_id,
-                company_name=we.company_name,
-                start_date=we.start_date,
-                end_date=we.end_date,
-                description_work=we.description_work,
-            )
-            for we in resume_data.work_experience
-        ]
-    )
-
-
 @resume_router.get(
     "/search",
     status_code=status.HTTP_200_OK,
-    response_model=list[ResumeSearchOutResponse],
+    response_model=list[ResumeSearchOutResponse] | ResumeSearchWithFacetsResponse,
     responses={
-        200: {"description": "Resumes"},
+        200: {"description": "Resumes, with facets=true also count of found resumes per filter value"},
         404: {"description": "Resume not found"},
         500: {"description": "Internal Server Error"}
     }
 
 )
 async def search_resumes(
+        response: Response,
         search: SearchResumeRequest = Depends(),
         type_of_employment: list[EmploymentType] | None = Query(None),
+        skills: list[str] | None = Query(None),
+        facets: bool = Query(False),
         resume_service: ResumeService = Depends(resume_service_provider)
 ):
     search_dto = SearchResumeDTO(
         type_of_employment=type_of_employment,
+        skills=skills,
         **search.__dict__
     )
-    resumes = await resume_service.search_resumes(search_dto)
+    search_result = await resume_service.search_resumes(search_dto, facets=facets)
+    resumes = search_result.resumes
 
     responses: list[ResumeSearchOutResponse] = []
 
@@ -195,9 +153,78 @@ async def search_resumes(
             )
         )
 
+    if resumes and search.limit is not None and len(resumes) == search.limit:
+        last = resumes[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.name_resume, last.resume_id)
+
+    if search_result.facets is not None:
+        return ResumeSearchWithFacetsResponse(
+            resumes=responses,
+            facets=ResumeFacetsResponse(
+                type_of_employment=search_result.facets.type_of_employment,
+                salary_currency=search_result.facets.salary_currency,
+                gender=search_result.facets.gender,
+                experience=search_result.facets.experience
+            )
+        )
+
     return responses
 
 
+@resume_router.get(
+    "/{resume_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=ResumeResponse,
+    responses={
+        200: {"description": "Resume"},
+        404: {"description": "Resume not found"},
+        500: {"description": "Internal Server Error"}
+    }
+
+)
+async def get_resume_by_id(
+        resume_id: int,
+        resume_service: ResumeService = Depends(resume_service_provider)
+):
+    resume_data = await resume_service.get_resume_by_id(resume_id)
+
+    return ResumeResponse(
+        resume_id=resume_data.resume_id,
+        name_resume=resume_data.name_resume,
+        profession=resume_data.profession,
+        key_skills=resume_data.key_skills,
+        salary_min=resume_data.salary_min,
+        salary_max=resume_data.salary_max,
+        salary_currency=resume_data.salary_currency,
+        location=resume_data.location,
+        applicant=ApplicantOut(
+            user=UserOut(
+                user_id=resume_data.applicant.applicant_id,
+                last_name=resume_data.applicant.user.last_name,
+                first_name=resume_data.applicant.user.first_name,
+                email=resume_data.applicant.user.email
+            ),
+            description_applicant=resume_data.applicant.description_applicant,
+            gender=resume_data.applicant.gender,
+            address=resume_data.applicant.address,
+            is_confirmed=resume_data.applicant.is_confirmed,
+            level_education=resume_data.applicant.level_education,
+        ),
+        type_of_employment=resume_data.type_of_employment,
+        work_experience=[
+            WorkExperienceResponse(
+                work_experience_id=we.work_experience_id,
+                resume_id=we.resume_id,
+                company_name=we.company_name,
+                start_date=we.start_date,
+                end_date=we.end_date,
+                description_work=we.description_work,
+            )
+            for we in resume_data.work_experience
+        ]
+    )
+
+
 @resume_router.delete(
     "/{resume_id}",
     status_code=status.HTTP_202_ACCEPTED,
@@ -169,6 +169,9 @@ async def logout(auth: TokenAuthDep):
     "/refresh",
     status_code=status.HTTP_200_OK
 )
-async def refresh_access_token(auth: TokenAuthDep):
-    await auth.refresh_access_token()
+async def refresh_access_token(
+        auth: TokenAuthDep,
+        auth_service: AuthService = Depends(services.auth_service_provider),
+):
+    await auth_service.refresh_access_token(auth)
     return {"detail": "Access token has been refresh"}
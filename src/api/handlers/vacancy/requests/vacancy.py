@@ -5,7 +5,8 @@ from src.core.enums import (
     Currency,
     EmploymentType,
     WorkScheduleType,
-    VacancyDuration
+    VacancyDuration,
+    SkillsMatch
 )
 
 
@@ -39,3 +40,17 @@ class UpdateVacancyRequest(BaseModel):
     experience_end: int | None = Field(None, ge=0)
     type_of_employment: list[EmploymentType] | None = None
     type_work_schedule: list[WorkScheduleType] | None = None
+
+
+class SearchVacancyRequest(BaseModel):
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    experience_start: int | None = Field(None, ge=0)
+    experience_end: int | None = Field(None, ge=0)
+    skills_match: SkillsMatch = SkillsMatch.ALL
+    offset: int = Field(0, ge=0)
+    limit: int = Field(25, ge=1, le=100)
+    cursor: str | None = None
@@ -0,0 +1,5 @@
+from src.api.handlers.resume.response.resume import ResumeSearchOutResponse
+
+
+class ShortlistResumeResponse(ResumeSearchOutResponse):
+    score: float
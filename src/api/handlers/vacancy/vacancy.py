@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, status, Body
+from fastapi import APIRouter, Depends, status, Body, Query, Response
 
+from src.api.handlers.applicant.response.applicant import ApplicantOut
 from src.api.handlers.company.response.company import CompanyOut
 from src.api.handlers.user.response.user import UserOut
-from src.api.handlers.vacancy.requests.vacancy import CreateVacancyRequest, UpdateVacancyRequest
+from src.api.handlers.work_experience.response.work_experience import WorkExperienceResponse
+from src.api.handlers.vacancy.requests.vacancy import (
+    CreateVacancyRequest,
+    UpdateVacancyRequest,
+    SearchVacancyRequest
+)
+from src.api.handlers.vacancy.response.shortlist import ShortlistResumeResponse
 from src.api.handlers.vacancy.response.vacancy import VacancyResponse, VacancyTimeResponse, VacancyLikedResponse
 from src.api.handlers.vacancy.response.vacancy_access import VacancyAccessResponse
 from src.api.handlers.vacancy.response.vacancy_type import VacancyTypeResponse
@@ -11,9 +18,11 @@ from src.api.providers.abstract.services import vacancy_service_provider
 from src.api.providers.auth import TokenAuthDep
 from src.dto.services.company.company import BaseCompanyDTO
 from src.dto.services.user.user import BaseUserDTO
-from src.dto.services.vacancy.vacancy import CreateVacancyDTO, UpdateVacancyDTO
+from src.dto.services.vacancy.vacancy import CreateVacancyDTO, UpdateVacancyDTO, SearchVacancyDTO
 from src.dto.services.vacancy.vacancy_type import CreateVacancyType
+from src.core.enums import EmploymentType, WorkScheduleType
 from src.services.vacancy.vacancy import VacancyService
+from src.utils.cursor import encode_cursor
 
 
 vacancy_router = APIRouter(
@@ -128,6 +137,68 @@ async def update_vacancy(
     return {"detail": "Vacancy updated"}
 
 
+@vacancy_router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=list[VacancyResponse],
+    responses={
+        200: {"description": "Vacancies"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+async def search_vacancy(
+        response: Response,
+        search: SearchVacancyRequest = Depends(),
+        type_of_employment: list[EmploymentType] | None = Query(None),
+        type_work_schedule: list[WorkScheduleType] | None = Query(None),
+        skills: list[str] | None = Query(None),
+        vacancy_service: VacancyService = Depends(vacancy_service_provider)
+):
+    search_dto = SearchVacancyDTO(
+        type_of_employment=type_of_employment,
+        type_work_schedule=type_work_schedule,
+        skills=skills,
+        **search.__dict__
+    )
+    vacancies = await vacancy_service.search_vacancy(search_dto)
+
+    if vacancies and len(vacancies) == search.limit:
+        last = vacancies[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.rank_score, last.vacancy_id)
+
+    return [
+        VacancyResponse(
+            vacancy_id=vacancy.vacancy_id,
+            title=vacancy.title,
+            location=vacancy.location,
+            key_skills=vacancy.key_skills,
+            profession=vacancy.profession,
+            salary_min=vacancy.salary_min,
+            salary_max=vacancy.salary_max,
+            salary_currency=vacancy.salary_currency,
+            type_of_employment=vacancy.type_of_employment,
+            type_work_schedule=vacancy.type_work_schedule,
+            updated_at=vacancy.updated_at,
+            is_published=vacancy.is_published,
+            experience_start=vacancy.experience_start,
+            experience_end=vacancy.experience_end,
+            company=CompanyOut(
+                company_name=vacancy.company.company_name,
+                address=vacancy.company.address,
+                company_is_confirmed=None,
+                description_company=None,
+                user=UserOut(
+                    user_id=vacancy.company.user.user_id,
+                    email=None,
+                    first_name=None,
+                    last_name=None,
+                )
+            )
+        )
+        for vacancy in vacancies
+    ]
+
+
 @vacancy_router.get(
     "/{vacancy_id}",
     status_code=status.HTTP_200_OK,
@@ -186,24 +257,6 @@ async def get_vacancy_by_id(
     )
 
 
-@vacancy_router.get(
-    "/search",
-    status_code=status.HTTP_200_OK,
-    responses={
-        200: {"description": ""},
-        403: {"description": "Company access required"},
-        500: {"description": "Internal Server Error"}
-    }
-)
-async def search_vacancy(
-        vacancy_service: VacancyService = Depends(vacancy_service_provider)
-):
-    """
-    Add the search feature a bit latter!
-    """
-    return
-
-
 @vacancy_router.delete(
     "/{vacancy_id}",
     status_code=status.HTTP_202_ACCEPTED,
@@ -268,6 +321,74 @@ async def raise_vacancy_in_search(
     )
 
 
+@vacancy_router.get(
+    "/{vacancy_id}/shortlist",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ShortlistResumeResponse],
+    responses={
+        200: {"description": "Resumes which fit the vacancy, best first"},
+        403: {"description": "Company access required"},
+        404: {"description": "Vacancy not found"},
+        500: {"description": "Internal Server Error"}
+    }
+)
+@company_required
+async def get_vacancy_shortlist(
+        vacancy_id: int,
+        auth: TokenAuthDep,
+        offset: int = Query(0, ge=0),
+        limit: int = Query(20, ge=1, le=100),
+        vacancy_service: VacancyService = Depends(vacancy_service_provider)
+):
+    shortlist = await vacancy_service.get_vacancy_shortlist(
+        vacancy_id,
+        auth.request.state.user.user_id,
+        offset,
+        limit
+    )
+
+    return [
+        ShortlistResumeResponse(
+            resume_id=item.resume.resume_id,
+            applicant=ApplicantOut(
+                address=item.resume.applicant.address,
+                level_education=item.resume.applicant.level_education,
+                date_born=item.resume.applicant.date_born,
+                gender=item.resume.applicant.gender,
+                user=UserOut(
+                    user_id=item.resume.applicant.applicant_id,
+                    email=item.resume.applicant.user.email,
+                    first_name=item.resume.applicant.user.first_name,
+                    last_name=item.resume.applicant.user.last_name,
+                    phone_number=item.resume.applicant.user.phone_number,
+                    image_url=item.resume.applicant.user.image_url,
+                ),
+            ),
+            name_resume=item.resume.name_resume,
+            profession=item.resume.profession,
+            key_skills=item.resume.key_skills,
+            salary_min=item.resume.salary_min,
+            salary_max=item.resume.salary_max,
+            salary_currency=item.resume.salary_currency,
+            location=item.resume.location,
+            total_months=item.resume.total_months,
+            work_experiences=[
+                WorkExperienceResponse(
+                    resume_id=w.resume_id,
+                    work_experience_id=w.work_experience_id,
+                    company_name=w.company_name,
+                    start_date=w.start_date,
+                    end_date=w.end_date,
+                    description_work=w.description_work,
+                )
+                for w in item.resume.work_experiences
+            ],
+            score=item.score
+        )
+        for item in shortlist
+    ]
+
+
 @vacancy_liked_router.patch(
     "/{vacancy_id}/like",
     status_code=status.HTTP_200_OK,
@@ -1,12 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.api.handlers.bind_routers import bind_exceptions_handlers, bind_routes
 from src.api.providers.init_providers import bind_providers
 from src.core.config import Config
+from src.infrastructure.resources import AppResources
+
+
+def bind_lifespan(app: FastAPI, resources: AppResources):
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        yield
+        await resources.close()
+
+    app.router.lifespan_context = lifespan
 
 
 def init_app(app: FastAPI, config: Config) -> FastAPI:
-    bind_providers(app, config)
+    resources = AppResources(config)
+
+    bind_lifespan(app, resources)
+    bind_providers(app, config, resources)
     bind_exceptions_handlers(app)
     bind_routes(app, config.api)
 
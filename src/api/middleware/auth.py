@@ -1,34 +1,50 @@
-from fastapi import Depends
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from src.api.providers.auth import get_jwt_token_auth
+from src.api.providers.auth import get_jwt_provider
 from src.core.config_reader import config
 from src.dto.web.auth import AnonymousUser, ActiveUser
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
+def read_cookie(headers: list[tuple[bytes, bytes]], name: str) -> str | None:
+    """
+    Value of one cookie straight from the raw headers, the other cookies are not parsed.
+    """
+    for header, value in headers:
+        if header != b"cookie":
+            continue
+
+        for cookie in value.decode("latin-1").split(";"):
+            key, _, cookie_value = cookie.partition("=")
+            if key.strip() == name:
+                return cookie_value.strip()
+
+
+class AuthenticationMiddleware:
     """
     Middleware that injects the authenticated user into `request.state.user`.
     If no valid access token is found, the user is treated as anonymous.
+
+    Plain ASGI middleware: the request goes to the app as is, without the task and the
+    streams of BaseHTTPMiddleware.
     """
 
-    def __init__(self, app):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    async def dispatch(
-            self,
-            request: Request,
-            call_next: RequestResponseEndpoint,
-    ) -> Response:
-        jwt_auth = await get_jwt_token_auth(request=request)
-        access_token_data = await jwt_auth.read_token(config.auth.access_token_name)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        # token is only read here, JWTAuth of handler is built by its dependency
+        access_token_data = get_jwt_provider().read_token(
+            read_cookie(scope["headers"], config.auth.access_token_name)
+        )
 
         if access_token_data is None:
-            request.state.user = AnonymousUser()
+            user = AnonymousUser()
         else:
-            request.state.user = ActiveUser(
+            user = ActiveUser(
                 user_id=access_token_data.get("user_id"),
                 first_name=access_token_data.get("first_name"),
                 last_name=access_token_data.get("last_name"),
@@ -37,5 +53,6 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 is_superuser=access_token_data.get("is_superuser"),
                 type=access_token_data.get("type")
             )
-        response = await call_next(request)
-        return response
+
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
@@ -76,3 +76,30 @@ def company_required(func):
 
         return await func(*args, **kwargs)
     return wrapper
+
+
+def admin_required(func):
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        auth = kwargs.get("auth")
+        if auth is None:
+            for arg in args:
+                if hasattr(arg, "request"):
+                    auth = arg
+                    break
+
+        user = getattr(auth.request.state, "user", None) if auth else None
+        if user is None or getattr(user, "user_id", None) is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Not authenticated"
+            )
+
+        if not (getattr(user, "is_admin", False) or getattr(user, "is_superuser", False)):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Admin access required"
+            )
+
+        return await func(*args, **kwargs)
+    return wrapper
@@ -30,3 +30,23 @@ def fm_provider():
 
 def notification_email_provider():
     raise NotImplementedError
+
+
+def search_cache_provider():
+    raise NotImplementedError
+
+
+def shortlist_cache_provider():
+    raise NotImplementedError
+
+
+def vacancy_alerts_provider():
+    raise NotImplementedError
+
+
+def resources_provider():
+    raise NotImplementedError
+
+
+def principal_cache_provider():
+    raise NotImplementedError
@@ -32,3 +32,7 @@ def vacancy_service_provider():
 
 def respond_vacancy_provider():
     raise NotImplementedError
+
+
+def metrics_service_provider():
+    raise NotImplementedError
@@ -6,12 +6,21 @@ from starlette.requests import HTTPConnection
 from starlette.responses import Response
 
 
-from src.infrastructure.auth.jwt import JWTAuth
+from src.api.providers.lifecycle import Scope, scoped
+from src.core.config_reader import config
+from src.infrastructure.auth.jwt import JWTAuth, JWTProvider
+from src.infrastructure.auth.token_cache import VerifiedTokenCache
 from src.interfaces.services.auth import IJWTAuth
 
 
+@scoped(Scope.APP)
+def get_jwt_provider() -> JWTProvider:
+    return JWTProvider(token_cache=VerifiedTokenCache(max_size=config.auth.token_cache_size))
+
+
+@scoped(Scope.REQUEST)
 async def get_jwt_token_auth(request: HTTPConnection = None, response: Response = None) -> JWTAuth:
-    return JWTAuth(request=request, response=response)
+    return JWTAuth(request=request, response=response, jwt_provider=get_jwt_provider())
 
 
 TokenAuthDep = Annotated[IJWTAuth, Depends(get_jwt_token_auth)]
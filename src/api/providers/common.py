@@ -7,38 +7,74 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.providers.abstract.common import session_provider, redis_pool_provider, redis_db_provider
 from src.api.providers.build_files_manager import build_fm
 from src.core.config import Config
-from src.infrastructure.connections import get_db_connection, get_redis_connections
 from src.api.providers.build_transaction_manager import build_tm
+from src.api.providers.lifecycle import Scope, scoped
+from src.infrastructure.auth.principal_cache import PrincipalCache
 from src.infrastructure.hasher import Hasher
-from src.infrastructure.notifications.email import EmailNotifications
+from src.infrastructure.notifications.outbox import OutboxNotifications
+from src.infrastructure.notifications.vacancy_alerts import CeleryVacancyAlerts
 from src.infrastructure.redis_db.redis_db import RedisDB
+from src.infrastructure.redis_db.search_cache import SearchCache
+from src.infrastructure.redis_db.shortlist_cache import ShortlistCache
+from src.infrastructure.resources import AppResources
 from src.interfaces.infrastructure.notifications import AbstractNotifications
+from src.interfaces.infrastructure.principal_cache import IPrincipalCache
 from src.interfaces.infrastructure.redis_db import IRedisDB
+from src.interfaces.infrastructure.resources import IResources
+from src.interfaces.infrastructure.search_cache import ISearchCache
+from src.interfaces.infrastructure.shortlist_cache import IShortlistCache
+from src.interfaces.infrastructure.vacancy_alerts import IVacancyAlerts
 
 
-def db_session(config: Config):
-    sessionmaker = get_db_connection(config.db)
-
+def db_session(resources: AppResources):
     async def get_db_session() -> AsyncSession:
-        async with sessionmaker() as session:
+        async with resources.session_maker() as session:
             yield session
 
     return get_db_session
 
 
-def redis_pool_getter(config: Config):
-    def get_pool_redis():
-        return get_redis_connections(redis_config=config.redis)
+def redis_pool_getter(resources: AppResources):
+    """
+    Client of the pool created with the app, requests don't open pools of their own.
+    """
+    def get_pool_redis() -> Redis:
+        return resources.redis
 
     return get_pool_redis
 
 
+def resources_getter(resources: AppResources):
+    def get_resources() -> IResources:
+        return resources
+
+    return get_resources
+
+
 def redis_db_getter(
         redis: Redis = Depends(redis_pool_provider)
 ) -> IRedisDB:
     return RedisDB(redis=redis)
 
 
+def search_cache_getter(config: Config):
+    def get_search_cache(
+            redis_db: IRedisDB = Depends(redis_db_provider)
+    ) -> ISearchCache:
+        return SearchCache(redis_db=redis_db, ttl=config.redis.search_cache_ttl)
+
+    return get_search_cache
+
+
+def shortlist_cache_getter(config: Config):
+    def get_shortlist_cache(
+            redis_db: IRedisDB = Depends(redis_db_provider)
+    ) -> IShortlistCache:
+        return ShortlistCache(redis_db=redis_db, ttl=config.redis.shortlist_cache_ttl)
+
+    return get_shortlist_cache
+
+
 def tm_getter(
         session: AsyncSession = Depends(session_provider),
 ):
@@ -50,6 +86,7 @@ def tm_getter(
 
 
 def fm_getter(config: Config):
+    @scoped(Scope.APP)
     def _build_fm():
         return build_fm(
             base_dir=Path(config.files_work.url_save_file),
@@ -58,9 +95,34 @@ def fm_getter(config: Config):
     return _build_fm
 
 
-def hasher_getter() -> Hasher:
-    return Hasher()
+def principal_cache_getter(config: Config):
+    @scoped(Scope.APP)
+    def get_principal_cache() -> IPrincipalCache:
+        return PrincipalCache(ttl=config.auth.principal_cache_ttl, max_size=config.auth.principal_cache_size)
+
+    return get_principal_cache
+
+
+def hasher_getter(resources: AppResources):
+    """
+    Hasher of the app, its thread pool is shut down with the other resources.
+    """
+    def get_hasher() -> Hasher:
+        return resources.hasher
+
+    return get_hasher
+
+
+@scoped(Scope.REQUEST)
+def notification_email_getter(
+        session: AsyncSession = Depends(session_provider),
+) -> AbstractNotifications:
+    """
+    Session is the same as of transaction manager, notifications are committed with the change.
+    """
+    return OutboxNotifications(session)
 
 
-def notification_email_getter() -> AbstractNotifications:
-    return EmailNotifications()
+@scoped(Scope.APP)
+def vacancy_alerts_getter() -> IVacancyAlerts:
+    return CeleryVacancyAlerts()
@@ -5,18 +5,24 @@ from src.api.middleware.auth import AuthenticationMiddleware
 from src.api.providers import abstract
 
 from src.core.config import Config
+from src.infrastructure.resources import AppResources
 from src.api.providers import common as common_provide
 from src.api.providers import services
 
 
-def bind_common(app: FastAPI, config: Config):
-    app.dependency_overrides[abstract.common.session_provider] = common_provide.db_session(config)
-    app.dependency_overrides[abstract.common.redis_pool_provider] = common_provide.redis_pool_getter(config)
-    app.dependency_overrides[abstract.common.hasher_provider] = common_provide.hasher_getter
+def bind_common(app: FastAPI, config: Config, resources: AppResources):
+    app.dependency_overrides[abstract.common.resources_provider] = common_provide.resources_getter(resources)
+    app.dependency_overrides[abstract.common.session_provider] = common_provide.db_session(resources)
+    app.dependency_overrides[abstract.common.redis_pool_provider] = common_provide.redis_pool_getter(resources)
+    app.dependency_overrides[abstract.common.hasher_provider] = common_provide.hasher_getter(resources)
+    app.dependency_overrides[abstract.common.principal_cache_provider] = common_provide.principal_cache_getter(config)
     app.dependency_overrides[abstract.common.tm_provider] = common_provide.tm_getter
     app.dependency_overrides[abstract.common.fm_provider] = common_provide.fm_getter(config)
     app.dependency_overrides[abstract.common.redis_db_provider] = common_provide.redis_db_getter
+    app.dependency_overrides[abstract.common.search_cache_provider] = common_provide.search_cache_getter(config)
+    app.dependency_overrides[abstract.common.shortlist_cache_provider] = common_provide.shortlist_cache_getter(config)
     app.dependency_overrides[abstract.common.notification_email_provider] = common_provide.notification_email_getter
+    app.dependency_overrides[abstract.common.vacancy_alerts_provider] = common_provide.vacancy_alerts_getter
 
 
 # def bind_auth(app: FastAPI):
@@ -33,6 +39,7 @@ def bind_services(app: FastAPI):
     app.dependency_overrides[abstract.services.files_work_service_provider] = services.files_work_service_getter  # type: ignore
     app.dependency_overrides[abstract.services.vacancy_service_provider] = services.vacancy_service_getter  # type: ignore
     app.dependency_overrides[abstract.services.respond_vacancy_provider] = services.respond_vacancy_getter  # type: ignore
+    app.dependency_overrides[abstract.services.metrics_service_provider] = services.metrics_service_getter  # type: ignore
 
 
 def bind_middlewares(app: FastAPI):
@@ -46,8 +53,8 @@ def bind_middlewares(app: FastAPI):
     )
 
 
-def bind_providers(app: FastAPI, config: Config):
-    bind_common(app, config)
+def bind_providers(app: FastAPI, config: Config, resources: AppResources):
+    bind_common(app, config, resources)
     bind_middlewares(app)
     # bind_auth(app)
     bind_services(app)
@@ -0,0 +1,43 @@
+"""
+Scopes of provided objects:
+
+    APP        one object per process, built on the first resolution. Only for stateless and
+               thread-safe objects: Hasher, JWTProvider, FilesManager, Celery clients.
+    REQUEST    one object per request. FastAPI caches result of dependency inside a request, so it is
+               the scope of plain providers: sessions, transaction managers, services. The provider is
+               left as is, the decorator only marks the scope for the reader.
+"""
+import enum
+import threading
+from functools import wraps
+from typing import Callable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class Scope(enum.Enum):
+    APP = "app"
+    REQUEST = "request"
+
+
+def scoped(scope: Scope) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorator(factory: Callable[..., T]) -> Callable[..., T]:
+        if scope is Scope.REQUEST:
+            return factory
+
+        instance: list[T] = []
+        lock = threading.Lock()
+
+        @wraps(factory)
+        def get_instance() -> T:
+            if not instance:
+                with lock:
+                    if not instance:
+                        instance.append(factory())
+            return instance[0]
+
+        get_instance.scope = scope
+        return get_instance
+
+    return decorator
@@ -1,16 +1,23 @@
 from fastapi import Depends
 
 from src.api.providers.abstract.common import tm_provider, hasher_provider, fm_provider, notification_email_provider, \
-    redis_db_provider
+    redis_db_provider, search_cache_provider, shortlist_cache_provider, vacancy_alerts_provider, resources_provider, \
+    principal_cache_provider
 from src.infrastructure.notifications.email import EmailNotifications
 from src.interfaces.infrastructure.notifications import AbstractNotifications
+from src.interfaces.infrastructure.principal_cache import IPrincipalCache
 from src.interfaces.infrastructure.redis_db import IRedisDB
+from src.interfaces.infrastructure.resources import IResources
+from src.interfaces.infrastructure.search_cache import ISearchCache
+from src.interfaces.infrastructure.shortlist_cache import IShortlistCache
+from src.interfaces.infrastructure.vacancy_alerts import IVacancyAlerts
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 from src.infrastructure.hasher import Hasher
 from src.services.applicant.applicant import ApplicantService
 from src.services.company.company import CompanyService
 from src.services.files_work.files_manager import FilesManager
 from src.services.files_work.files_work import FilesWorkService
+from src.services.metrics.metrics import MetricsService
 from src.services.respond_on_vacancy.respond_on_vacancy import RespondOnVacancyService
 from src.services.resume.resume import ResumeService
 from src.services.user.auth import AuthService
@@ -22,16 +29,18 @@ from src.services.work_experience.work_experience import WorkExperienceService
 def auth_service_getter(
         tm: IBaseTransactionManager = Depends(tm_provider),
         hasher: Hasher = Depends(hasher_provider),
-        redis_db: IRedisDB = Depends(redis_db_provider)
+        redis_db: IRedisDB = Depends(redis_db_provider),
+        principal_cache: IPrincipalCache = Depends(principal_cache_provider)
 ):
-    return AuthService(tm=tm, hasher=hasher, redis_db=redis_db)
+    return AuthService(tm=tm, hasher=hasher, redis_db=redis_db, principal_cache=principal_cache)
 
 
 def user_service_getter(
         tm: IBaseTransactionManager = Depends(tm_provider),
-        hasher: Hasher = Depends(hasher_provider)
+        hasher: Hasher = Depends(hasher_provider),
+        principal_cache: IPrincipalCache = Depends(principal_cache_provider)
 ):
-    return UserService(tm=tm, hasher=hasher)
+    return UserService(tm=tm, hasher=hasher, principal_cache=principal_cache)
 
 
 def applicant_service_getter(
@@ -47,21 +56,26 @@ def company_service_getter(
         tm: IBaseTransactionManager = Depends(tm_provider),
         hasher: Hasher = Depends(hasher_provider),
         notifications: AbstractNotifications = Depends(notification_email_provider),
-        redis_db: IRedisDB = Depends(redis_db_provider)
+        redis_db: IRedisDB = Depends(redis_db_provider),
+        search_cache: ISearchCache = Depends(search_cache_provider)
 ):
-    return CompanyService(tm=tm, hasher=hasher, notifications=notifications, redis_db=redis_db)
+    return CompanyService(
+        tm=tm, hasher=hasher, notifications=notifications, redis_db=redis_db, search_cache=search_cache
+    )
 
 
 def resume_service_getter(
         tm: IBaseTransactionManager = Depends(tm_provider),
+        search_cache: ISearchCache = Depends(search_cache_provider)
 ):
-    return ResumeService(tm=tm)
+    return ResumeService(tm=tm, search_cache=search_cache)
 
 
 def work_experience_getter(
-        tm: IBaseTransactionManager = Depends(tm_provider)
+        tm: IBaseTransactionManager = Depends(tm_provider),
+        search_cache: ISearchCache = Depends(search_cache_provider)
 ):
-    return WorkExperienceService(tm=tm)
+    return WorkExperienceService(tm=tm, search_cache=search_cache)
 
 
 def files_work_service_getter(
@@ -71,9 +85,11 @@ def files_work_service_getter(
 
 
 def vacancy_service_getter(
-        tm: IBaseTransactionManager = Depends(tm_provider)
+        tm: IBaseTransactionManager = Depends(tm_provider),
+        shortlist_cache: IShortlistCache = Depends(shortlist_cache_provider),
+        vacancy_alerts: IVacancyAlerts = Depends(vacancy_alerts_provider)
 ):
-    return VacancyService(tm=tm)
+    return VacancyService(tm=tm, shortlist_cache=shortlist_cache, vacancy_alerts=vacancy_alerts)
 
 
 def respond_vacancy_getter(
@@ -81,3 +97,11 @@ def respond_vacancy_getter(
         notifications: AbstractNotifications = Depends(notification_email_provider),
 ):
     return RespondOnVacancyService(tm=tm, notifications=notifications)
+
+
+def metrics_service_getter(
+        search_cache: ISearchCache = Depends(search_cache_provider),
+        resources: IResources = Depends(resources_provider),
+        hasher: Hasher = Depends(hasher_provider)
+):
+    return MetricsService(search_cache=search_cache, resources=resources, hasher=hasher)
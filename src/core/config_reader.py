@@ -21,7 +21,15 @@ def config_loader() -> Config:
             password=os.getenv("DB_PASSWORD"),
             port=int(os.getenv("DB_PORT", 5432)),
             driver=os.getenv("DB_DRIVER"),
-            db_name=os.getenv("DB_NAME")
+            db_name=os.getenv("DB_NAME"),
+            pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", 30)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800)),
+            pool_pre_ping=os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100)),
+            statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0)),
+            echo=os.getenv("DB_ECHO", "false").lower() == "true"
         ),
         api=APIConfig(
             port=int(os.getenv("WEB_PORT", 8000)),
@@ -34,19 +42,37 @@ def config_loader() -> Config:
         auth=AuthConfig(
             secret_key=os.getenv("AUTH_SECRET_KEY"),
             algorithm=os.getenv("AUTH_ALGORITHM"),
+            hash_workers=int(os.getenv("HASH_WORKERS", 4)),
+            principal_cache_ttl=int(os.getenv("PRINCIPAL_CACHE_TTL", 30)),
+            principal_cache_size=int(os.getenv("PRINCIPAL_CACHE_SIZE", 10_000)),
+            token_cache_size=int(os.getenv("TOKEN_CACHE_SIZE", 10_000)),
 
         ),
         redis=RedisConfig(
             host=os.getenv("REDIS_HOST", "127.0.0.1"),
             port=int(os.getenv("REDIS_PORT", 6379)),
-            db=int(os.getenv("REDIS_DB", 0))
+            db=int(os.getenv("REDIS_DB", 0)),
+            search_cache_ttl=int(os.getenv("SEARCH_CACHE_TTL", 30)),
+            shortlist_cache_ttl=int(os.getenv("SHORTLIST_CACHE_TTL", 600)),
+            max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", 50)),
+            pool_timeout=int(os.getenv("REDIS_POOL_TIMEOUT", 5))
         ),
         mail=NotificationConfig(
             smtp_server=os.getenv("SMTP_SERVER"),
             smtp_port=int(os.getenv("SMTP_PORT", 465)),
             smtp_user=os.getenv("SMTP_USER"),
             smtp_password=os.getenv("SMTP_PASSWORD"),
-            mail_from=os.getenv("MAIL_FROM")
+            mail_from=os.getenv("MAIL_FROM"),
+            smtp_use_ssl=os.getenv("SMTP_USE_SSL", "true").lower() == "true",
+            smtp_timeout=int(os.getenv("SMTP_TIMEOUT", 30)),
+            smtp_pool_size=int(os.getenv("SMTP_POOL_SIZE", 2)),
+            smtp_max_idle_seconds=int(os.getenv("SMTP_MAX_IDLE_SECONDS", 60)),
+            smtp_batch_size=int(os.getenv("SMTP_BATCH_SIZE", 100)),
+            outbox_batch_size=int(os.getenv("OUTBOX_BATCH_SIZE", 100)),
+            outbox_max_attempts=int(os.getenv("OUTBOX_MAX_ATTEMPTS", 10)),
+            outbox_retry_base_seconds=int(os.getenv("OUTBOX_RETRY_BASE_SECONDS", 5)),
+            outbox_retry_max_seconds=int(os.getenv("OUTBOX_RETRY_MAX_SECONDS", 3600)),
+            digest_window_seconds=int(os.getenv("NOTIFICATION_DIGEST_WINDOW", 300))
         ),
         files_work=FilesWorkConfig(
             url_save_file=os.getenv("URL_SAVE_FILE"),
@@ -82,3 +82,15 @@ class StatusRespond(enum.Enum):
 class ActorType(enum.Enum):
     APPLICANT = "APPLICANT"
     COMPANY = "COMPANY"
+
+
+class ExperienceBucket(enum.Enum):
+    NO_EXPERIENCE = "no experience"
+    BETWEEN_1_AND_3 = "1-3 years"
+    BETWEEN_3_AND_6 = "3-6 years"
+    MORE_THAN_6 = "more than 6 years"
+
+
+class SkillsMatch(enum.Enum):
+    ALL = "all"
+    ANY = "any"
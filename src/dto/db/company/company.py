@@ -18,3 +18,4 @@ class SearchDTODAO(BaseDTO):
     company_name: str | None
     offset: int = 0
     limit: int = 0
+    cursor: str | None = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from src.dto.base_dto import BaseDTO
+
+
+@dataclass
+class OutboxNotificationDTODAO(BaseDTO):
+    destination: str
+    template: str
+    subject: str | None = None
+    body: str | None = None
+    outbox_id: int | None = None
+    attempts: int = 0
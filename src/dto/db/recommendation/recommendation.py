@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from src.dto.base_dto import BaseDTO
+
+
+@dataclass
+class MatchResumeDTODAO(BaseDTO):
+    resume_id: int
+    applicant_id: int
+    profession: str | None = None
+    location: str | None = None
+    salary_min_base: float | None = None
+    salary_max_base: float | None = None
+    total_experience_months: int = 0
+    skill_ids: list[int] | None = None
+
+
+@dataclass
+class MatchVacancyDTODAO(BaseDTO):
+    vacancy_id: int
+    profession: str | None = None
+    location: str | None = None
+    salary_min_base: float | None = None
+    salary_max_base: float | None = None
+    experience_start: int | None = None
+    experience_end: int | None = None
+    skill_ids: list[int] | None = None
+
+
+@dataclass
+class RecommendationDTODAO(BaseDTO):
+    applicant_id: int
+    vacancy_id: int
+    score: float
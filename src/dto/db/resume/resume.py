@@ -4,7 +4,7 @@ from datetime import datetime
 from src.dto.base_dto import BaseDTO
 from src.dto.db.applicant.applicant import BaseApplicantDTODAO
 from src.dto.db.work_experience.work_experience import BaseWorkExperienceDTODAO
-from src.core.enums import Currency, EmploymentType, GenderEnum
+from src.core.enums import Currency, EmploymentType, GenderEnum, ExperienceBucket, SkillsMatch
 
 
 @dataclass
@@ -39,5 +39,16 @@ class SearchDTODAO(BaseDTO):
     max_age: int | None = None
     start_experience_years: int | None = None
     end_experience_years: int | None = None
+    skills: list[str] | None = None
+    skills_match: SkillsMatch = SkillsMatch.ALL
     offset: int | None = None
     limit: int | None = None
+    cursor: str | None = None
+
+
+@dataclass
+class ResumeFacetsDTODAO(BaseDTO):
+    type_of_employment: dict[EmploymentType, int]
+    salary_currency: dict[Currency, int]
+    gender: dict[GenderEnum, int]
+    experience: dict[ExperienceBucket, int]
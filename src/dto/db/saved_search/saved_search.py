@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.dto.base_dto import BaseDTO
+from src.core.enums import Currency, EmploymentType
+
+
+@dataclass
+class SavedSearchDTODAO(BaseDTO):
+    applicant_id: int
+    name: str
+    saved_search_id: int | None = None
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
+    created_at: datetime | None = None
+    email: str | None = None
+    # rate of salary_currency (of base currency without one) to base currency, loaded for matching
+    salary_rate: float | None = None
+
+
+@dataclass
+class AlertVacancyDTODAO(BaseDTO):
+    """
+    New vacancy which is matched against saved searches.
+    """
+    vacancy_id: int
+    title: str
+    profession: str
+    company_name: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    salary_min_base: float | None = None
+    salary_max_base: float | None = None
+    type_of_employment: list[EmploymentType] | None = None
@@ -19,3 +19,18 @@ class BaseUserDTODAO(BaseDTO):
     is_admin: bool | None = None
     is_confirmed: bool | None = None
     type: str | None = None
+
+
+@dataclass
+class AuthUserDTODAO(BaseDTO):
+    """
+    Principal of user written to tokens, password is loaded only for login.
+    """
+    user_id: int
+    email: str
+    first_name: str
+    last_name: str
+    is_admin: bool
+    is_superuser: bool
+    type: str
+    password: str | None = None
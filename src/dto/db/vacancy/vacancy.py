@@ -7,7 +7,8 @@ from src.core.enums import (
     Currency,
     EmploymentType,
     WorkScheduleType,
-    VacancyDuration
+    VacancyDuration,
+    SkillsMatch
 )
 
 
@@ -51,6 +52,7 @@ class BaseVacancyDTODAO(BaseDTO):
     type_work_schedule: list[WorkScheduleType] | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    rank_score: int | None = None
     is_published: bool | None = None
     is_confirmed: bool | None = None
     experience_start: int | None = None
@@ -62,4 +64,25 @@ class BaseVacancyDTODAO(BaseDTO):
     #
 
 
+@dataclass
+class SearchDTODAO(BaseDTO):
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
+    type_work_schedule: list[WorkScheduleType] | None = None
+    experience_start: int | None = None
+    experience_end: int | None = None
+    skills: list[str] | None = None
+    skills_match: SkillsMatch = SkillsMatch.ALL
+    offset: int = 0
+    limit: int = 25
+    cursor: str | None = None
+
 
+@dataclass
+class RecommendedVacancyDTODAO(BaseDTO):
+    vacancy: BaseVacancyDTODAO
+    score: float
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.dto.base_dto import BaseDTO
+from src.core.enums import Currency, EmploymentType
+
+
+@dataclass
+class CreateSavedSearchDTO(BaseDTO):
+    applicant_id: int
+    name: str
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
+
+
+@dataclass
+class SavedSearchDTO(BaseDTO):
+    saved_search_id: int
+    name: str
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
+    created_at: datetime | None = None
@@ -50,6 +50,7 @@ class SearchDTO(BaseDTO):
     company_name: str | None
     offset: int = 0
     limit: int = 0
+    cursor: str | None = None
 
 
 @dataclass
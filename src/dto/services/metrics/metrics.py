@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from src.dto.base_dto import BaseDTO
+
+
+@dataclass
+class SearchCacheStatsDTO(BaseDTO):
+    scope: str
+    hits: int
+    misses: int
+    generation: int
+
+
+@dataclass
+class PoolStatsDTO(BaseDTO):
+    name: str
+    size: int
+    in_use: int
+    idle: int
+    overflow: int = 0
+    checkouts: int = 0
+    checkout_wait_avg_ms: float = 0.0
+    checkout_wait_max_ms: float = 0.0
+    overflow_checkouts: int = 0
+    checkout_timeouts: int = 0
+
+
+@dataclass
+class HasherStatsDTO(BaseDTO):
+    max_workers: int
+    running: int
+    queued: int
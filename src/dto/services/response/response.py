@@ -24,3 +24,11 @@ class ChangeStatusResponseDTO(BaseDTO):
     responder_type: ActorType
     message: str | None
 
+
+@dataclass
+class ChangeStatusResponsesDTO(BaseDTO):
+    user_id: int
+    response_ids: list[int]
+    status: StatusRespond
+    responder_type: ActorType
+    message: str | None
@@ -4,7 +4,7 @@ from datetime import datetime
 from src.dto.base_dto import BaseDTO
 from src.dto.services.applicant.applicant import ApplicantDTO
 from src.dto.services.work_exprerience.work_experience import WorkExperienceDTO
-from src.core.enums import Currency, EmploymentType, GenderEnum
+from src.core.enums import Currency, EmploymentType, GenderEnum, ExperienceBucket, SkillsMatch
 
 
 @dataclass
@@ -93,8 +93,11 @@ class SearchResumeDTO(BaseDTO):
     max_age: int | None = None
     start_experience_years: int | None = None
     end_experience_years: int | None = None
+    skills: list[str] | None = None
+    skills_match: SkillsMatch = SkillsMatch.ALL
     offset: int | None = None
     limit: int | None = None
+    cursor: str | None = None
 
 
 @dataclass
@@ -111,3 +114,17 @@ class ResumeSearchOutDTO(BaseDTO):
     type_of_employment: list[EmploymentType] | None = None
     total_months: int | None = None
     work_experiences: list[WorkExperienceDTO] | None = None
+
+
+@dataclass
+class ResumeFacetsDTO(BaseDTO):
+    type_of_employment: dict[EmploymentType, int]
+    salary_currency: dict[Currency, int]
+    gender: dict[GenderEnum, int]
+    experience: dict[ExperienceBucket, int]
+
+
+@dataclass
+class ResumeSearchResultDTO(BaseDTO):
+    resumes: list[ResumeSearchOutDTO]
+    facets: ResumeFacetsDTO | None = None
@@ -3,9 +3,10 @@ from datetime import datetime
 
 from src.dto.base_dto import BaseDTO
 from src.dto.services.company.company import BaseCompanyDTO
+from src.dto.services.resume.resume import ResumeSearchOutDTO
 from src.dto.services.vacancy.vacancy_access import BaseVacancyAccessDTO
 from src.dto.services.vacancy.vacancy_type import BaseVacancyTypeDTO, CreateVacancyType
-from src.core.enums import Currency, EmploymentType, WorkScheduleType
+from src.core.enums import Currency, EmploymentType, WorkScheduleType, SkillsMatch
 
 
 @dataclass
@@ -24,6 +25,7 @@ class BaseVacancyDTO(BaseDTO):
     type_work_schedule: list[WorkScheduleType] | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    rank_score: int | None = None
     is_published: bool | None = None
     is_confirmed: bool | None = None
     experience_start: int | None = None
@@ -86,3 +88,33 @@ class VacancyOutDTO(BaseDTO):
     type_work_schedule: WorkScheduleType | None = None
     created_at: datetime | None = None
     is_published: bool | None = None
+
+
+@dataclass
+class SearchVacancyDTO(BaseDTO):
+    profession: str | None = None
+    location: str | None = None
+    salary_min: float | None = None
+    salary_max: float | None = None
+    salary_currency: Currency | None = None
+    type_of_employment: list[EmploymentType] | None = None
+    type_work_schedule: list[WorkScheduleType] | None = None
+    experience_start: int | None = None
+    experience_end: int | None = None
+    skills: list[str] | None = None
+    skills_match: SkillsMatch = SkillsMatch.ALL
+    offset: int = 0
+    limit: int = 25
+    cursor: str | None = None
+
+
+@dataclass
+class RecommendedVacancyDTO(BaseDTO):
+    vacancy: BaseVacancyDTO
+    score: float
+
+
+@dataclass
+class ShortlistResumeDTO(BaseDTO):
+    resume: ResumeSearchOutDTO
+    score: float
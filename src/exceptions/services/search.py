@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from src.exceptions.base import BaseExceptions
+
+
+class SearchException(BaseExceptions):
+    ...
+
+
+@dataclass
+class InvalidCursor(SearchException):
+    cursor: str
+
+    def message(self):
+        return f"Cursor {self.cursor} is not valid, start search from the first page"
@@ -11,11 +11,15 @@ from starlette.responses import Response
 from src.core.config_reader import config
 from src.exceptions.services.auth import RefreshTokenNotValid
 from src.interfaces.services.auth import IJWTAuth
+from src.interfaces.infrastructure.token_cache import IVerifiedTokenCache
 from src.interfaces.services.token_provider import IJWTProvider
 from src.utils.datetimes import get_timezone_now
 
 
 class JWTProvider(IJWTProvider):
+    def __init__(self, token_cache: IVerifiedTokenCache | None = None):
+        self._token_cache = token_cache
+
     def _encode_jwt(self, data: dict | Any, expires_delta: int) -> str:
         to_encode = data.copy()
 
@@ -57,6 +61,11 @@ class JWTProvider(IJWTProvider):
         if token is None:
             return
 
+        if self._token_cache is not None:
+            payload = self._token_cache.get(token)
+            if payload is not None:
+                return payload
+
         try:
             payload = self.decode_token(token)
             user_id = payload.get("user_id")
@@ -65,6 +74,9 @@ class JWTProvider(IJWTProvider):
 
         except (JWTError, ValidationError):
             return
+
+        if self._token_cache is not None:
+            self._token_cache.set(token, payload)
         return payload
 
 
@@ -72,14 +84,16 @@ class JWTAuth(IJWTAuth):
     def __init__(
         self,
         request: Request | None = None,
-        response: Response | None = None
+        response: Response | None = None,
+        jwt_provider: IJWTProvider | None = None
     ):
         self.request = request
         self.response = response
-        self._jwt_provider = JWTProvider()
+        self._jwt_provider = jwt_provider or JWTProvider()
 
-    async def set_tokens(self, user: dict) -> None:
-        data = {
+    @staticmethod
+    def _token_data(user: dict) -> dict:
+        return {
             "user_id": user.get("user_id"),
             "email": user.get("email"),
             "first_name": user.get("first_name"),
@@ -89,12 +103,19 @@ class JWTAuth(IJWTAuth):
             "type": user.get("type")
         }
 
+    async def set_tokens(self, user: dict) -> None:
+        data = self._token_data(user)
+
         access_token = self._jwt_provider.create_access_token(data)
         refresh_token = self._jwt_provider.create_refresh_token(data)
 
         await self.set_token(token=access_token, token_type=config.auth.access_token_name)
         await self.set_token(token=refresh_token, token_type=config.auth.refresh_token_name)
 
+    async def set_access_token(self, user: dict) -> None:
+        access_token = self._jwt_provider.create_access_token(self._token_data(user))
+        await self.set_token(token=access_token, token_type=config.auth.access_token_name)
+
     async def set_token(self, token: str, token_type: str) -> None:
         self.response.set_cookie(key=token_type, value=token)
 
@@ -0,0 +1,45 @@
+"""
+Principals read by refresh of access token. A client refreshes its token every few minutes and
+all tabs of a browser refresh at once, the same user is loaded again and again. Principals are kept
+in the process for ttl seconds: changed name or flags of user reach tokens at most ttl seconds later.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from src.dto.db.user.user import AuthUserDTODAO
+from src.interfaces.infrastructure.principal_cache import IPrincipalCache
+
+
+class PrincipalCache(IPrincipalCache):
+    def __init__(self, ttl: float, max_size: int):
+        self._ttl = ttl
+        self._max_size = max_size
+        # user_id -> (principal, expires_at), the least recently used first
+        self._principals: OrderedDict[int, tuple[AuthUserDTODAO, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> AuthUserDTODAO | None:
+        with self._lock:
+            cached = self._principals.get(user_id)
+            if cached is None:
+                return None
+
+            principal, expires_at = cached
+            if expires_at <= time.monotonic():
+                del self._principals[user_id]
+                return None
+
+            self._principals.move_to_end(user_id)
+            return principal
+
+    def set(self, principal: AuthUserDTODAO) -> None:
+        with self._lock:
+            self._principals[principal.user_id] = (principal, time.monotonic() + self._ttl)
+            self._principals.move_to_end(principal.user_id)
+            while len(self._principals) > self._max_size:
+                self._principals.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._principals.pop(user_id, None)
@@ -0,0 +1,50 @@
+"""
+The same access token comes with every request of a client for its whole lifetime, signature of it
+is verified once per process. Tokens are kept by sha256 of token, not the token itself, and are dropped
+at their exp, tokens without exp are not cached.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from src.interfaces.infrastructure.token_cache import IVerifiedTokenCache
+
+
+class VerifiedTokenCache(IVerifiedTokenCache):
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        # sha256 of token -> (claims, exp), the least recently used first
+        self._claims: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        with self._lock:
+            cached = self._claims.get(key)
+            if cached is None:
+                return None
+
+            claims, exp = cached
+            if exp <= time.time():
+                del self._claims[key]
+                return None
+
+            self._claims.move_to_end(key)
+            return claims
+
+    def set(self, token: str, claims: dict) -> None:
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._claims[key] = (claims, exp)
+            self._claims.move_to_end(key)
+            while len(self._claims) > self._max_size:
+                self._claims.popitem(last=False)
@@ -1,4 +1,6 @@
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_process_shutdown
 
 from src.core.config_reader import config
 
@@ -8,3 +10,31 @@ celery_app = Celery(
     broker=f"redis://{config.redis.host}:{config.redis.port}/0",
     backend=f"redis://{config.redis.host}:{config.redis.port}/0"
 )
+
+celery_app.conf.beat_schedule = {
+    # open-ended jobs are counted until current_date, so the sum grows without any change of resume
+    "recalculate-total-experience-months": {
+        "task": "resumes.recalculate_total_experience_months",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    "build-vacancy-recommendations": {
+        "task": "recommendations.build_vacancy_recommendations",
+        "schedule": crontab(hour="*/6", minute=30),
+    },
+    # notifications of committed changes, each run drains the outbox
+    "relay-notification-outbox": {
+        "task": "notifications.relay_notification_outbox",
+        "schedule": 5.0,
+    },
+    # windows of coalesced notifications end at any moment, digest waits at most this longer
+    "flush-notification-digests": {
+        "task": "notifications.flush_notification_digests",
+        "schedule": 30.0,
+    },
+}
+
+
+@worker_process_shutdown.connect
+def close_smtp_connections(**kwargs):
+    from src.infrastructure.notifications.smtp_pool import close_smtp_pool
+    close_smtp_pool()
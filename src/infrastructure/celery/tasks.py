@@ -1,17 +1,326 @@
+import asyncio
+import smtplib
+
+import numpy as np
+from celery import Task
+from celery.utils.time import get_exponential_backoff_interval
+from loguru import logger
+
+from src.core.config_reader import config
 from src.infrastructure.celery.celery_app import celery_app
+from src.infrastructure.connections import get_db_connection, get_redis_connections
+from src.dto.db.recommendation.recommendation import RecommendationDTODAO
+from src.infrastructure.db.dao.notification_outbox.notification_outbox_dao import NotificationOutboxDAO
+from src.infrastructure.db.dao.recommendation.recommendation_dao import RecommendationDAO
+from src.infrastructure.db.dao.resume.resume_dao import ResumeDAO
+from src.infrastructure.db.dao.saved_search.saved_search_dao import SavedSearchDAO
 from src.infrastructure.notifications.email import EmailNotifications
+from src.infrastructure.notifications.smtp_pool import SMTPBatchInterrupted
+from src.infrastructure.redis_db.notification_digest import NotificationDigest
+from src.utils import utils
+from src.utils.matching import Vocabulary, resume_features, vacancy_features, score_matrix, top_n_by_group
+from src.utils.notification_digest import COALESCED_TEMPLATES, digest_email
+from src.utils.saved_search import alerts_by_email
+
+
+# outbox rows are sent once they are queued, delivery is retried by the tasks: the message is acked
+# after the task, errors of SMTP are retried with backoff, batch tasks retry only the unsent rest
+EMAIL_RETRY = dict(
+    autoretry_for=(smtplib.SMTPException, OSError),
+    acks_late=True,
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=10
+)
 
 
-@celery_app.task(name="email.send_confirmation_link_email")
+@celery_app.task(name="email.send_confirmation_link_email", **EMAIL_RETRY)
 def send_confirmation_link_email(destination: str, subject: str, body: str):
     EmailNotifications().send_(destination, subject, body)
 
 
-@celery_app.task(name="email.send_respond_notification")
+@celery_app.task(name="email.send_respond_notification", **EMAIL_RETRY)
 def send_respond_notification(destination: str, subject: str, body):
     EmailNotifications().send_(destination, subject, body)
 
 
-@celery_app.task(name="email.send_message_about_change_status")
+@celery_app.task(name="email.send_message_about_change_status", **EMAIL_RETRY)
 def send_message_about_change_status(destination: str, subject: str, body):
     EmailNotifications().send_(destination, subject, body)
+
+
+def _send_batch_or_retry(task: Task, emails: list[tuple[str, str, str]]) -> None:
+    """
+    Interrupted batch is retried with backoff without messages which are already delivered.
+    """
+    try:
+        EmailNotifications().send_batch(emails)
+
+    except SMTPBatchInterrupted as exc:
+        logger.bind(
+            app_name=f"{task.name}"
+        ).warning(f"{exc}, RETRY {task.request.retries + 1}\nMESSAGE: {exc.__cause__!r}")
+        countdown = get_exponential_backoff_interval(
+            factor=int(task.retry_backoff),
+            retries=task.request.retries,
+            maximum=task.retry_backoff_max,
+            full_jitter=task.retry_jitter
+        )
+        raise task.retry(args=(emails[exc.sent:],), exc=exc, countdown=countdown)
+
+
+@celery_app.task(bind=True, name="email.send_messages_about_change_status", **EMAIL_RETRY)
+def send_messages_about_change_status(self, messages: list[tuple[str, str, str]]):
+    _send_batch_or_retry(self, messages)
+
+
+@celery_app.task(bind=True, name="email.send_emails", **EMAIL_RETRY)
+def send_emails(self, emails: list[tuple[str, str, str]]):
+    _send_batch_or_retry(self, emails)
+
+
+@celery_app.task(name="email.send_saved_search_alert", **EMAIL_RETRY)
+def send_saved_search_alert(destination: str, subject: str, body: str):
+    EmailNotifications().send_(destination, subject, body)
+
+
+@celery_app.task(name="notifications.relay_notification_outbox")
+def relay_notification_outbox():
+    asyncio.run(_relay_notification_outbox())
+
+
+async def _relay_notification_outbox():
+    """
+    Batches of the outbox are put in the queue by templates, every batch is committed separately.
+    Failed templates are queued again with backoff, an email can be queued twice if commit fails after queueing.
+    Delivery of queued emails is retried by the email tasks.
+    """
+    session_maker = get_db_connection(config.db)
+    redis = get_redis_connections(config.redis)
+    notifications = EmailNotifications()
+    digest = NotificationDigest(redis, config.mail.digest_window_seconds)
+    queued, failed = 0, 0
+
+    while True:
+        async with session_maker() as session:
+            dao = NotificationOutboxDAO(session)
+            batch = await dao.get_pending_notifications(config.mail.outbox_batch_size, config.mail.outbox_max_attempts)
+            if not batch:
+                break
+
+            by_template: dict[str, list] = {}
+            for notification in batch:
+                by_template.setdefault(notification.template, []).append(notification)
+
+            sent_ids, failed_ids = [], []
+            for template, template_batch in by_template.items():
+                ids = [notification.outbox_id for notification in template_batch]
+                messages = [
+                    (notification.destination, {"subject": notification.subject, "body": notification.body})
+                    for notification in template_batch
+                ]
+                try:
+                    # not urgent notifications wait for others to the same destination
+                    if template in COALESCED_TEMPLATES and config.mail.digest_window_seconds > 0:
+                        await digest.add(template, messages)
+                    else:
+                        notifications.send_many(template, messages)
+                    sent_ids += ids
+
+                except Exception as exc:
+                    logger.bind(
+                        app_name=f"{relay_notification_outbox.__name__}"
+                    ).error(f"TEMPLATE {template} OUTBOX IDS {ids}\nMESSAGE: {exc}")
+                    failed_ids += ids
+
+            if sent_ids:
+                await dao.mark_sent(sent_ids)
+            if failed_ids:
+                await dao.mark_failed(
+                    failed_ids, config.mail.outbox_retry_base_seconds, config.mail.outbox_retry_max_seconds
+                )
+            await session.commit()
+
+        queued += len(sent_ids)
+        failed += len(failed_ids)
+        # failed rows are not pending until their next attempt, but the broker is likely down
+        if failed_ids:
+            break
+
+    await session_maker.kw["bind"].dispose()
+    await redis.aclose()
+
+    if queued or failed:
+        logger.bind(
+            app_name=f"{relay_notification_outbox.__name__}"
+        ).info(f"QUEUED {queued} NOTIFICATIONS, {failed} FAILED")
+
+
+@celery_app.task(name="notifications.flush_notification_digests")
+def flush_notification_digests(limit: int = 1000):
+    asyncio.run(_flush_notification_digests(limit))
+
+
+async def _flush_notification_digests(limit: int):
+    """
+    Notifications collected for a destination during the window are sent as one email.
+    """
+    redis = get_redis_connections(config.redis)
+    digest = NotificationDigest(redis, config.mail.digest_window_seconds)
+    notifications = EmailNotifications()
+    flushed, coalesced = 0, 0
+
+    while digests := await digest.pop_due(limit):
+        by_template: dict[str, list] = {}
+        for template, destination, items in digests:
+            by_template.setdefault(template, []).append((destination, items))
+
+        failed: dict[str, list] = {}
+        for template, template_digests in by_template.items():
+            try:
+                notifications.send_many(
+                    template,
+                    [(destination, digest_email(items)) for destination, items in template_digests]
+                )
+
+            except Exception as exc:
+                logger.bind(
+                    app_name=f"{flush_notification_digests.__name__}"
+                ).error(f"TEMPLATE {template} {len(template_digests)} DIGESTS\nMESSAGE: {exc}")
+                failed[template] = template_digests
+                continue
+
+            flushed += len(template_digests)
+            coalesced += sum(len(items) for _, items in template_digests)
+
+        # popped digests which are not sent go back to Redis and are sent after the next window
+        for template, template_digests in failed.items():
+            await digest.add(
+                template,
+                [(destination, item) for destination, items in template_digests for item in items]
+            )
+        # the broker is likely down, the next run tries again
+        if failed:
+            break
+
+    await redis.aclose()
+
+    if flushed:
+        logger.bind(
+            app_name=f"{flush_notification_digests.__name__}"
+        ).info(f"SENT {flushed} DIGESTS OF {coalesced} NOTIFICATIONS")
+
+
+@celery_app.task(name="resumes.recalculate_total_experience_months")
+def recalculate_total_experience_months():
+    asyncio.run(_recalculate_total_experience_months())
+
+
+async def _recalculate_total_experience_months():
+    session_maker = get_db_connection(config.db)
+
+    async with session_maker() as session:
+        updated = await ResumeDAO(session).recalculate_total_experience_months()
+        await session.commit()
+        await session.bind.dispose()
+
+    logger.bind(
+        app_name=f"{recalculate_total_experience_months.__name__}"
+    ).info(f"UPDATED TOTAL EXPERIENCE OF {updated} RESUMES")
+
+
+@celery_app.task(name="recommendations.build_vacancy_recommendations")
+def build_vacancy_recommendations(top_n: int = 50, applicants_chunk: int = 200):
+    asyncio.run(_build_vacancy_recommendations(top_n, applicants_chunk))
+
+
+async def _build_vacancy_recommendations(top_n: int, applicants_chunk: int):
+    session_maker = get_db_connection(config.db)
+    vocabulary = Vocabulary()
+
+    async with session_maker() as session:
+        vacancies = vacancy_features(await RecommendationDAO(session).get_vacancies_for_matching(), vocabulary)
+
+    # resumes of a chunk of applicants are scored against all vacancies in one matrix
+    applicants_count, after_applicant_id = 0, 0
+    while True:
+        async with session_maker() as session:
+            dao = RecommendationDAO(session)
+            resumes = await dao.get_resumes_for_matching(after_applicant_id, applicants_chunk)
+            if not resumes:
+                break
+
+            features = resume_features(resumes, vocabulary)
+            applicant_ids = np.array([resume.applicant_id for resume in resumes], dtype=np.int64)
+            groups, columns, scores = top_n_by_group(score_matrix(features, vacancies), applicant_ids, top_n)
+
+            chunk_applicant_ids = sorted(set(applicant_ids.tolist()))
+            await dao.replace_recommendations(
+                after_applicant_id,
+                chunk_applicant_ids,
+                [
+                    RecommendationDTODAO(applicant_id=int(applicant_id), vacancy_id=int(vacancy_id), score=float(score))
+                    for applicant_id, vacancy_id, score in zip(groups, vacancies.ids[columns], scores)
+                    if score > 0
+                ]
+            )
+            await session.commit()
+
+        applicants_count += len(chunk_applicant_ids)
+        after_applicant_id = chunk_applicant_ids[-1]
+
+    # applicants after the last chunk have no published resumes anymore
+    async with session_maker() as session:
+        await RecommendationDAO(session).delete_recommendations_after(after_applicant_id)
+        await session.commit()
+
+    await session_maker.kw["bind"].dispose()
+
+    logger.bind(
+        app_name=f"{build_vacancy_recommendations.__name__}"
+    ).info(f"BUILT RECOMMENDATIONS OF {applicants_count} APPLICANTS FROM {len(vacancies)} VACANCIES")
+
+
+@celery_app.task(name="saved_searches.match_saved_searches")
+def match_saved_searches(vacancy_id: int):
+    asyncio.run(_match_saved_searches(vacancy_id))
+
+
+async def _match_saved_searches(vacancy_id: int):
+    session_maker = get_db_connection(config.db)
+
+    async with session_maker() as session:
+        dao = SavedSearchDAO(session)
+        vacancy = await dao.get_alert_vacancy(vacancy_id)
+        # only searches found by reverse index are checked
+        candidates = await dao.get_candidate_searches(vacancy) if vacancy is not None else []
+
+    await session_maker.kw["bind"].dispose()
+
+    if vacancy is None:
+        return
+
+    alerts = alerts_by_email(candidates, vacancy)
+    # alerts are sent in batches over pooled connections
+    EmailNotifications().send_many(
+        "send_saved_search_alert",
+        [
+            (
+                email,
+                {
+                    "subject": f"Новая вакансия: {vacancy.title}",
+                    "body": (
+                        f"Вакансия «{vacancy.title}» компании {vacancy.company_name} подходит "
+                        f"под ваши сохранённые поиски: {', '.join(names)}\n"
+                        f"Ссылка на вакансию: {utils.create_company_vacancy_link(vacancy.vacancy_id)}"
+                    )
+                }
+            )
+            for email, names in alerts.items()
+        ]
+    )
+
+    logger.bind(
+        app_name=f"{match_saved_searches.__name__}"
+    ).info(f"VACANCY {vacancy_id}: {len(candidates)} CANDIDATE SEARCHES, {len(alerts)} ALERTS QUEUED")
@@ -1,13 +1,38 @@
 import redis.asyncio as redis
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine, create_async_engine
+from src.infrastructure.db.pool import MeteredQueuePool
 from src.infrastructure.db.utils.connection_string_maker import make_connection_string
 from src.infrastructure.db_config import DBConfig
 from src.infrastructure.redis_db.config import RedisConfig
 
 
+def _connect_args(db_config: DBConfig) -> dict:
+    if "asyncpg" not in (db_config.driver or ""):
+        return {}
+
+    connect_args = {"statement_cache_size": db_config.statement_cache_size}
+    if db_config.statement_timeout_ms:
+        connect_args["server_settings"] = {"statement_timeout": str(db_config.statement_timeout_ms)}
+    return connect_args
+
+
+def create_db_engine(db_config: DBConfig) -> AsyncEngine:
+    return create_async_engine(
+        make_connection_string(db_config),
+        echo=db_config.echo,
+        poolclass=MeteredQueuePool,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_timeout=db_config.pool_timeout,
+        pool_recycle=db_config.pool_recycle,
+        pool_pre_ping=db_config.pool_pre_ping,
+        connect_args=_connect_args(db_config)
+    )
+
+
 def get_db_connection(db_config: DBConfig):
-    engine = create_async_engine(make_connection_string(db_config), echo=True)
+    engine = create_db_engine(db_config)
     maker = async_sessionmaker(
         engine,
         class_=AsyncSession,
@@ -17,9 +42,12 @@ def get_db_connection(db_config: DBConfig):
 
 
 def get_redis_connections(redis_config: RedisConfig):
-    pool = redis.ConnectionPool.from_url(
+    # shared by all requests of the process: blocking pool waits for a connection instead of
+    # raising "Too many connections" on the first request over max_connections
+    pool = redis.BlockingConnectionPool.from_url(
         f"redis://{redis_config.host}:{redis_config.port}/{redis_config.db}",
-        max_connections=20,
+        max_connections=redis_config.max_connections,
+        timeout=redis_config.pool_timeout,
     )
     return redis.Redis(connection_pool=pool)
 
@@ -0,0 +1,70 @@
+"""
+Fill skills, resume_skills and vacancy_skills from key_skills of existing resumes and vacancies.
+Rows are processed in chunks ordered by id, every chunk is committed separately,
+so the command can be stopped and started again from the printed id.
+
+    python -m src.infrastructure.db.backfill_skills --chunk-size 1000
+"""
+import argparse
+import asyncio
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+from src.core.config_reader import config
+from src.infrastructure.connections import get_db_connection
+from src.infrastructure.db.dao.skill.skill_dao import SkillDAO
+
+
+async def _backfill(
+        name: str,
+        session_maker,
+        backfill_chunk: Callable[[SkillDAO, int, int], Awaitable[int | None]],
+        chunk_size: int,
+        after_id: int
+) -> None:
+    processed_chunks = 0
+    while True:
+        async with session_maker() as session:
+            last_id = await backfill_chunk(SkillDAO(session), after_id, chunk_size)
+            await session.commit()
+
+        if last_id is None:
+            break
+
+        after_id = last_id
+        processed_chunks += 1
+        logger.bind(app_name=f"backfill_skills {name}").info(
+            f"CHUNK {processed_chunks} DONE, LAST ID {after_id}"
+        )
+
+
+async def main(chunk_size: int, after_resume_id: int, after_vacancy_id: int) -> None:
+    session_maker = get_db_connection(config.db)
+
+    await _backfill(
+        "resumes",
+        session_maker,
+        lambda dao, after_id, size: dao.backfill_resume_skills(after_id, size),
+        chunk_size,
+        after_resume_id
+    )
+    await _backfill(
+        "vacancies",
+        session_maker,
+        lambda dao, after_id, size: dao.backfill_vacancy_skills(after_id, size),
+        chunk_size,
+        after_vacancy_id
+    )
+
+    await session_maker.kw["bind"].dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--after-resume-id", type=int, default=0)
+    parser.add_argument("--after-vacancy-id", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.chunk_size, args.after_resume_id, args.after_vacancy_id))
@@ -1,8 +1,10 @@
 from src.infrastructure.db.dao.applicant.applicant_dao import ApplicantDAO
 from src.infrastructure.db.dao.chat.chat_dao import ChatDAO
 from src.infrastructure.db.dao.company.company_dao import CompanyDAO
+from src.infrastructure.db.dao.notification_outbox.notification_outbox_dao import NotificationOutboxDAO
 from src.infrastructure.db.dao.response.response import ResponseDAO
 from src.infrastructure.db.dao.resume.resume_dao import ResumeDAO
+from src.infrastructure.db.dao.saved_search.saved_search_dao import SavedSearchDAO
 from src.infrastructure.db.dao.user.user_dao import UserDAO
 from src.infrastructure.db.dao.vacancy.vacancy_dao import VacancyDAO
 from src.infrastructure.db.dao.work_experience.work_experience import WorkExperienceDAO
@@ -16,5 +18,7 @@ __all__ = [
     "WorkExperienceDAO",
     "VacancyDAO",
     "ResponseDAO",
-    "ChatDAO"
+    "ChatDAO",
+    "SavedSearchDAO",
+    "NotificationOutboxDAO"
 ]
@@ -1,7 +1,7 @@
 from dataclasses import asdict
 
 from loguru import logger
-from sqlalchemy import insert, update, select, Select, asc
+from sqlalchemy import insert, update, select, Select, asc, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
@@ -14,9 +14,11 @@ from src.dto.db.user.user import BaseUserDTODAO
 from src.exceptions.base import BaseExceptions
 from src.exceptions.infrascructure.user.user import UserAlreadyExist, UserNotFoundByID
 from src.infrastructure.db.models import CompanyDB, UserDB
+from src.infrastructure.db.utils.like_pattern import contains_pattern, LIKE_ESCAPE
 from src.core.enums import TypeUser
 from src.interfaces.infrastructure.dao.company_dao import ICompanyDAO
 from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+from src.utils.cursor import decode_cursor
 
 
 class CompanyDAO(SqlAlchemyDAO, ICompanyDAO):
@@ -146,7 +148,8 @@ class CompanyDAO(SqlAlchemyDAO, ICompanyDAO):
         sql = self._query_builder.get_query(
             company_name=search_dto.company_name,
             limit=search_dto.limit,
-            offset=search_dto.offset
+            offset=search_dto.offset,
+            cursor=search_dto.cursor
         )
         result = await self._session.execute(sql)
         models = result.all()
@@ -181,15 +184,17 @@ class CompanyQueryBuilder:
             self,
             company_name: str | None,
             offset: int = 0,
-            limit: int = 0
+            limit: int = 0,
+            cursor: str | None = None
     ) -> Select:
         return (
-            self._select(offset, limit)
+            self._select(limit)
+            ._with_page(offset, cursor)
             ._with_company_name(company_name)
             ._build()
         )
 
-    def _select(self, offset: int = 0, limit: int = 0):
+    def _select(self, limit: int = 0):
         self._query = (
             select(
                 CompanyDB.company_id,
@@ -197,15 +202,27 @@ class CompanyQueryBuilder:
                 CompanyDB.address,
                 CompanyDB.description_company,
             )
-            .order_by(asc(CompanyDB.company_name))
+            .order_by(asc(CompanyDB.company_name), asc(CompanyDB.company_id))
             .limit(limit)
-            .offset(offset)
+        )
+        return self
+
+    def _with_page(self, offset: int, cursor: str | None):
+        if cursor is None:
+            self._query = self._query.offset(offset)
+            return self
+
+        company_name, company_id = decode_cursor(cursor, str, int)
+        self._query = self._query.where(
+            tuple_(CompanyDB.company_name, CompanyDB.company_id) > tuple_(company_name, company_id)
         )
         return self
 
     def _with_company_name(self, company_name: str | None):
         if company_name is not None:
-            self._query = self._query.where(CompanyDB.company_name.like(f"%{company_name}%"))
+            self._query = self._query.where(
+                CompanyDB.company_name.ilike(contains_pattern(company_name), escape=LIKE_ESCAPE)
+            )
         return self
 
     def _build(self):
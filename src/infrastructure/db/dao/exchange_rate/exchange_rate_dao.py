@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+from sqlalchemy import update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.core.enums import Currency
+from src.infrastructure.db.models import ExchangeRateDB, ResumeDB, VacancyDB
+from src.infrastructure.db.utils.salary import salary_base_values
+from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+
+
+class ExchangeRateDAO(SqlAlchemyDAO):
+    async def set_rates(self, rates: dict[Currency, Decimal]) -> list[Currency]:
+        """
+        Insert or update rates, return currencies whose rate is new or changed.
+        """
+        if not rates:
+            return []
+
+        stmt = pg_insert(ExchangeRateDB).values(
+            [{"currency": currency, "rate": rate} for currency, rate in rates.items()]
+        )
+        sql = (
+            stmt.on_conflict_do_update(
+                index_elements=[ExchangeRateDB.currency],
+                set_={"rate": stmt.excluded.rate, "updated_at": func.now()},
+                where=ExchangeRateDB.rate.is_distinct_from(stmt.excluded.rate)
+            )
+            .returning(ExchangeRateDB.currency)
+        )
+
+        return list((await self._session.execute(sql)).scalars().all())
+
+    async def recalculate_salaries_base(self, currencies: list[Currency]) -> int:
+        """
+        Recalculate salary_min_base/salary_max_base of resumes and vacancies in given currencies,
+        updated_at is kept. Return count of updated rows.
+        """
+        if not currencies:
+            return 0
+
+        updated = 0
+        for model in (ResumeDB, VacancyDB):
+            sql = (
+                update(model)
+                .where(model.salary_currency.in_(currencies))
+                .values(**salary_base_values(model), updated_at=model.updated_at)
+            )
+            updated += (await self._session.execute(sql)).rowcount
+
+        return updated
@@ -0,0 +1,57 @@
+from sqlalchemy import select, update, func, literal_column
+
+from src.dto.db.notification_outbox.notification_outbox import OutboxNotificationDTODAO
+from src.infrastructure.db.models import NotificationOutboxDB
+from src.interfaces.infrastructure.dao.notification_outbox_dao import INotificationOutboxDAO
+from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+
+
+class NotificationOutboxDAO(SqlAlchemyDAO, INotificationOutboxDAO):
+    async def get_pending_notifications(self, limit: int, max_attempts: int) -> list[OutboxNotificationDTODAO]:
+        """
+        Rows are locked until the end of transaction, other relays skip them instead of waiting.
+        """
+        sql = (
+            select(
+                NotificationOutboxDB.outbox_id,
+                NotificationOutboxDB.destination,
+                NotificationOutboxDB.template,
+                NotificationOutboxDB.subject,
+                NotificationOutboxDB.body,
+                NotificationOutboxDB.attempts
+            )
+            .where(
+                NotificationOutboxDB.sent_at.is_(None),
+                NotificationOutboxDB.next_attempt_at <= func.now(),
+                NotificationOutboxDB.attempts < max_attempts
+            )
+            .order_by(NotificationOutboxDB.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(sql)
+
+        return [OutboxNotificationDTODAO(**row._asdict()) for row in result]
+
+    async def mark_sent(self, outbox_ids: list[int]) -> None:
+        sql = (
+            update(NotificationOutboxDB)
+            .where(NotificationOutboxDB.outbox_id.in_(outbox_ids))
+            .values(sent_at=func.now())
+        )
+        await self._session.execute(sql)
+
+    async def mark_failed(self, outbox_ids: list[int], retry_base_seconds: int, retry_max_seconds: int) -> None:
+        """
+        Exponential backoff: next attempt after retry_base_seconds * 2 ^ attempts, not later than retry_max_seconds.
+        """
+        delay = func.least(retry_base_seconds * func.power(2, NotificationOutboxDB.attempts), retry_max_seconds)
+        sql = (
+            update(NotificationOutboxDB)
+            .where(NotificationOutboxDB.outbox_id.in_(outbox_ids))
+            .values(
+                attempts=NotificationOutboxDB.attempts + 1,
+                next_attempt_at=func.now() + delay * literal_column("interval '1 second'")
+            )
+        )
+        await self._session.execute(sql)
@@ -0,0 +1,84 @@
+from sqlalchemy import select, delete, insert, func
+
+from src.dto.db.recommendation.recommendation import (
+    MatchResumeDTODAO,
+    MatchVacancyDTODAO,
+    RecommendationDTODAO
+)
+from src.infrastructure.db.models import ResumeDB, VacancyDB, VacancyAccessDB, VacancyRecommendationDB
+from src.infrastructure.db.utils.matching import resume_match_select, vacancy_match_select
+from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+
+
+class RecommendationDAO(SqlAlchemyDAO):
+    """
+    Reads features for matching of resumes and vacancies and stores top vacancies of applicants.
+    """
+
+    async def get_vacancies_for_matching(self) -> list[MatchVacancyDTODAO]:
+        sql = (
+            vacancy_match_select()
+            .join(VacancyAccessDB, VacancyAccessDB.vacancy_id == VacancyDB.vacancy_id)
+            .where(
+                VacancyDB.is_published,
+                VacancyAccessDB.is_active,
+                VacancyAccessDB.end_date > func.now()
+            )
+            .order_by(VacancyDB.vacancy_id)
+        )
+        result = await self._session.execute(sql)
+
+        return [MatchVacancyDTODAO(**row._asdict()) for row in result]
+
+    async def get_resumes_for_matching(self, after_applicant_id: int, applicants_limit: int) -> list[MatchResumeDTODAO]:
+        """
+        Published resumes of next applicants_limit applicants ordered by applicant_id.
+        """
+        applicant_ids = (
+            select(ResumeDB.applicant_id)
+            .where(ResumeDB.is_published, ResumeDB.applicant_id > after_applicant_id)
+            .group_by(ResumeDB.applicant_id)
+            .order_by(ResumeDB.applicant_id)
+            .limit(applicants_limit)
+        )
+        sql = (
+            resume_match_select()
+            .where(ResumeDB.is_published, ResumeDB.applicant_id.in_(applicant_ids))
+            .order_by(ResumeDB.applicant_id, ResumeDB.resume_id)
+        )
+        result = await self._session.execute(sql)
+
+        return [MatchResumeDTODAO(**row._asdict()) for row in result]
+
+    async def replace_recommendations(
+            self,
+            after_applicant_id: int,
+            applicant_ids: list[int],
+            recommendations: list[RecommendationDTODAO]
+    ) -> None:
+        """
+        Replaces recommendations of all applicants after after_applicant_id up to the last of sorted applicant_ids,
+        so applicants between them without published resumes lose their recommendations.
+        """
+        if not applicant_ids:
+            return
+
+        await self._session.execute(
+            delete(VacancyRecommendationDB).where(
+                VacancyRecommendationDB.applicant_id > after_applicant_id,
+                VacancyRecommendationDB.applicant_id <= applicant_ids[-1]
+            )
+        )
+        if recommendations:
+            await self._session.execute(
+                insert(VacancyRecommendationDB),
+                [
+                    {"applicant_id": item.applicant_id, "vacancy_id": item.vacancy_id, "score": item.score}
+                    for item in recommendations
+                ]
+            )
+
+    async def delete_recommendations_after(self, after_applicant_id: int) -> None:
+        await self._session.execute(
+            delete(VacancyRecommendationDB).where(VacancyRecommendationDB.applicant_id > after_applicant_id)
+        )
@@ -1,7 +1,7 @@
-from datetime import datetime
+from dataclasses import replace
 
 from loguru import logger
-from sqlalchemy import insert, select, literal, cast, update, or_
+from sqlalchemy import insert, select, literal, cast, update, or_, Select
 from sqlalchemy.exc import IntegrityError
 
 from src.core.enums import ActorType, ChatType
@@ -21,9 +21,9 @@ from src.infrastructure.db.models import (
     ResponsesDB,
     MessageDB,
     CompanyDB,
-    ApplicantDB,
     VacancyDB,
-    ResumeDB
+    ResumeDB,
+    UserDB
 )
 from src.infrastructure.db.models.chat import ChatDB
 from src.infrastructure.enums_db import StatusRespondEnumDB, ActorTypeEnumDB
@@ -33,35 +33,15 @@ from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
 
 class ResponseDAO(SqlAlchemyDAO, IResponsesDAO):
     async def create_respond(self, respond: BaseResponseDTODAO) -> BaseResponseDTODAO:
-        sql_respond = (
-            insert(ResponsesDB)
-            .from_select(
-                ["responder_type", "status", "vacancy_id", "resume_id"],
-                select(
-                    cast(literal(respond.responder_type.value), ActorTypeEnumDB),
-                    cast(literal(respond.status.value), StatusRespondEnumDB),
-                    literal(respond.vacancy.vacancy_id),
-                    literal(respond.resume.resume_id),
-                ).select_from(
-                    ResumeDB if respond.responder_type == ActorType.APPLICANT else VacancyDB
-                ).where(
-                    (
-                            (ResumeDB.resume_id == respond.resume.resume_id) &
-                            (ResumeDB.applicant_id == respond.user_id)
-                    )
-                    if respond.responder_type == ActorType.APPLICANT
-                    else
-                    (
-                            (VacancyDB.vacancy_id == respond.vacancy.vacancy_id) &
-                            (VacancyDB.company_id == respond.user_id)
-                    )
-                )
-            )
-            .returning(ResponsesDB.response_id)
-        )
+        """
+        One statement: response, its chat and the first message are inserted by CTEs and
+        emails for notification are returned. Response is inserted only if resume (for applicant)
+        or vacancy (for company) belongs to user, otherwise no row is returned.
+        """
+        sql = self._create_respond_query(respond)
 
         try:
-            res = await self._session.execute(sql_respond)
+            row = (await self._session.execute(sql)).one_or_none()
 
         except IntegrityError as exc:
             logger.bind(
@@ -69,69 +49,11 @@ class ResponseDAO(SqlAlchemyDAO, IResponsesDAO):
             ).error(f"WITH DATA {respond}\nMESSAGE: {exc}")
             raise self._error_parser(respond, exc)
 
-        response_id = res.scalar_one_or_none()
-
-        if response_id is None:
+        if row is None:
             raise ResponsePermissionError()
 
-        sql_chat = (
-            insert(ChatDB)
-            .values(
-                chat_type=ChatType.RESPONSE,
-                response_id=response_id
-            )
-            .returning(ChatDB.chat_id)
-        )
-        try:
-            res_chat = await self._session.execute(sql_chat)
-        except IntegrityError as exc:
-            logger.bind(
-                app_name=f"{ResponseDAO.__name__} in {self.create_respond.__name__}"
-            ).error(f"FAILED CHAT CREATE WITH RESPONSE_ID={response_id}\nMESSAGE: {exc}")
-            raise self._error_parser(respond, exc)
-
-        chat_id = res_chat.scalar_one()
-
-        sql_message = (
-            insert(MessageDB)
-            .values(
-                chat_id=chat_id,
-                sender_id=respond.user_id,
-                sender_type=respond.responder_type,
-                message_text=respond.message
-            )
-        )
-        try:
-            await self._session.execute(sql_message)
-
-        except IntegrityError as exc:
-            logger.bind(
-                app_name=f"{ResponseDAO.__name__} in {self.create_respond.__name__}"
-            ).error(f"WITH DATA {respond} IN CREATE MESSAGE RESPOND\nMESSAGE: {exc}")
-            raise self._error_parser(respond, exc)
-
-        row = (
-            await self._session.execute(
-                select(
-                    CompanyDB.email.label("company_email"),
-                    CompanyDB.company_name.label("company_name"),
-                    ApplicantDB.email.label("applicant_email"),
-                    ApplicantDB.applicant_id.label("applicant_id"),
-                    VacancyDB.title.label("vacancy_title")
-                )
-                .select_from(ResponsesDB)
-                .join(VacancyDB, VacancyDB.vacancy_id == ResponsesDB.vacancy_id)
-                .join(CompanyDB, CompanyDB.company_id == VacancyDB.company_id)
-                .join(ResumeDB, ResumeDB.resume_id == ResponsesDB.resume_id)
-                .join(ApplicantDB, ApplicantDB.applicant_id == ResumeDB.applicant_id)
-                .where(
-                    ResponsesDB.response_id == response_id,
-                )
-            )
-        ).one()
-
-        respond.response_id = response_id
-        respond.response_date = datetime.now()
+        respond.response_id = row.response_id
+        respond.response_date = row.response_date
         respond.vacancy = BaseVacancyDTODAO(
             vacancy_id=respond.vacancy.vacancy_id,
             title=row.vacancy_title,
@@ -153,92 +75,140 @@ class ResponseDAO(SqlAlchemyDAO, IResponsesDAO):
 
         return respond
 
-    async def change_status_respond(self, respond: BaseResponseDTODAO) -> BaseResponseDTODAO:
-        sub_sql = (
-            select(ResponsesDB.response_id)
-            .join(VacancyDB, VacancyDB.vacancy_id == ResponsesDB.vacancy_id)
-            .join(CompanyDB, CompanyDB.company_id == VacancyDB.company_id)
-            .join(ResumeDB, ResumeDB.resume_id == ResponsesDB.resume_id)
-            .join(ApplicantDB, ApplicantDB.applicant_id == ResumeDB.applicant_id)
-            .where(
-                or_(
-                    CompanyDB.user_id == respond.user_id,
-                    ApplicantDB.user_id == respond.user_id,
-                ),
-                ResponsesDB.responder_type != respond.responder_type,
-                ResponsesDB.response_id == respond.response_id,
+    @staticmethod
+    def _create_respond_query(respond: BaseResponseDTODAO) -> Select:
+        if respond.responder_type == ActorType.APPLICANT:
+            owner, ownership = ResumeDB, (
+                (ResumeDB.resume_id == respond.resume.resume_id) &
+                (ResumeDB.applicant_id == respond.user_id)
+            )
+        else:
+            owner, ownership = VacancyDB, (
+                (VacancyDB.vacancy_id == respond.vacancy.vacancy_id) &
+                (VacancyDB.company_id == respond.user_id)
             )
-            .scalar_subquery()
-        )
 
-        sql = (
-            update(ResponsesDB)
-            .where(
-                ResponsesDB.response_id == sub_sql
+        new_response = (
+            insert(ResponsesDB)
+            .from_select(
+                ["responder_type", "status", "vacancy_id", "resume_id"],
+                select(
+                    cast(literal(respond.responder_type.value), ActorTypeEnumDB),
+                    cast(literal(respond.status.value), StatusRespondEnumDB),
+                    literal(respond.vacancy.vacancy_id),
+                    literal(respond.resume.resume_id),
+                ).select_from(owner).where(ownership)
             )
-            .values(
-                status=respond.status
+            .returning(
+                ResponsesDB.response_id,
+                ResponsesDB.response_date,
+                ResponsesDB.vacancy_id,
+                ResponsesDB.resume_id
+            )
+            .cte("new_response")
+        )
+        new_chat = (
+            insert(ChatDB)
+            .from_select(
+                ["chat_type", "response_id"],
+                select(cast(literal(ChatType.RESPONSE.value), ChatDB.chat_type.type), new_response.c.response_id)
+            )
+            .returning(ChatDB.chat_id)
+            .cte("new_chat")
+        )
+        new_message = (
+            insert(MessageDB)
+            .from_select(
+                ["chat_id", "sender_id", "sender_type", "message_text"],
+                select(
+                    new_chat.c.chat_id,
+                    literal(respond.user_id),
+                    cast(literal(respond.responder_type.value), ActorTypeEnumDB),
+                    literal(respond.message, MessageDB.message_text.type),
+                )
+            )
+            .returning(MessageDB.message_id)
+            .cte("new_message")
+        )
+
+        # tables without polymorphic joins of UserDB
+        vacancies, resumes, companies = VacancyDB.__table__, ResumeDB.__table__, CompanyDB.__table__
+        company_users = UserDB.__table__.alias("company_users")
+        applicant_users = UserDB.__table__.alias("applicant_users")
+
+        return (
+            select(
+                new_response.c.response_id,
+                new_response.c.response_date,
+                vacancies.c.title.label("vacancy_title"),
+                companies.c.company_name,
+                company_users.c.email.label("company_email"),
+                applicant_users.c.email.label("applicant_email"),
             )
-            .returning(ResponsesDB.response_id)
+            .select_from(new_response)
+            .join(vacancies, vacancies.c.vacancy_id == new_response.c.vacancy_id)
+            .join(companies, companies.c.company_id == vacancies.c.company_id)
+            .join(company_users, company_users.c.user_id == companies.c.company_id)
+            .join(resumes, resumes.c.resume_id == new_response.c.resume_id)
+            .join(applicant_users, applicant_users.c.user_id == resumes.c.applicant_id)
+            # message is not read, but CTE has to be in the statement to be executed
+            .add_cte(new_message)
         )
+
+    async def change_status_respond(self, respond: BaseResponseDTODAO) -> BaseResponseDTODAO:
+        """
+        One statement: status is updated, message is inserted in chat of the response and email
+        of the other side is returned. Status is changed only by the side which did not make the response
+        and only if resume or vacancy of the response belongs to user, otherwise no row is returned.
+        """
+        sql = self._change_status_respond_query(respond, [respond.response_id])
+
         try:
-            row = await self._session.execute(sql)
+            row = (await self._session.execute(sql)).one_or_none()
 
         except IntegrityError as exc:
             logger.bind(
-
                 app_name=f"{ResponseDAO.__name__} in {self.change_status_respond.__name__}"
             ).error(f"WITH DATA {respond} IN CHANGE STATUS RESPOND\nMESSAGE: {exc}")
             raise self._error_parser(respond, exc)
 
-        response_id = row.scalar_one_or_none()
-
-        if response_id is None:
+        if row is None:
             raise ResponsePermissionError()
 
-        sql_chat = (
-            select(ChatDB.chat_id)
-            .where(ChatDB.response_id == response_id)
-        )
-        chat_id = (await self._session.execute(sql_chat)).scalar_one()
+        return self._with_counterpart_email(respond, row.email)
+
+    async def change_status_responds(
+            self,
+            respond: BaseResponseDTODAO,
+            response_ids: list[int]
+    ) -> list[BaseResponseDTODAO]:
+        """
+        Status and message of respond are applied to all response_ids in one statement with the same
+        rules as change_status_respond. If any of responses can not be changed by user, nothing is returned
+        for it and the whole change is denied, so the caller must roll back.
+        """
+        response_ids = list(set(response_ids))
+        sql = self._change_status_respond_query(respond, response_ids)
 
-        sql_message = (
-            insert(MessageDB)
-            .values(
-                chat_id=chat_id,
-                sender_type=respond.responder_type,
-                message_text=respond.message,
-                sender_id=respond.user_id
-            )
-        )
         try:
-            await self._session.execute(sql_message)
+            rows = (await self._session.execute(sql)).all()
 
         except IntegrityError as exc:
             logger.bind(
-                app_name=f"{ResponseDAO.__name__} in {self.create_respond.__name__}"
-            ).error(f"WITH DATA {respond} IN CREATE MESSAGE RESPOND IN CHANGE STATUS\nMESSAGE: {exc}")
+                app_name=f"{ResponseDAO.__name__} in {self.change_status_responds.__name__}"
+            ).error(f"WITH DATA {respond} FOR {response_ids} IN CHANGE STATUS RESPONDS\nMESSAGE: {exc}")
             raise self._error_parser(respond, exc)
 
-        if respond.responder_type == ActorType.COMPANY:
-            sql = (
-                select(ApplicantDB.email)
-                .select_from(ResponsesDB)
-                .join(ResumeDB, ResumeDB.resume_id == ResponsesDB.resume_id)
-                .join(ApplicantDB, ApplicantDB.applicant_id == ResumeDB.applicant_id)
-                .where(ResponsesDB.response_id == respond.response_id)
-            )
+        if len(rows) != len(response_ids):
+            raise ResponsePermissionError()
 
-        elif respond.responder_type == ActorType.APPLICANT:
-            sql = (
-                select(CompanyDB.email)
-                .select_from(ResponsesDB)
-                .join(VacancyDB, VacancyDB.vacancy_id == ResponsesDB.vacancy_id)
-                .join(CompanyDB, CompanyDB.company_id == VacancyDB.company_id)
-                .where(ResponsesDB.response_id == respond.response_id)
-            )
-        email = (await self._session.execute(sql)).scalar()
+        return [
+            self._with_counterpart_email(replace(respond, response_id=row.response_id), row.email)
+            for row in rows
+        ]
 
+    @staticmethod
+    def _with_counterpart_email(respond: BaseResponseDTODAO, email: str) -> BaseResponseDTODAO:
         if respond.responder_type == ActorType.APPLICANT:
             respond.vacancy = BaseVacancyDTODAO(
                 company=BaseCompanyDTODAO(
@@ -258,6 +228,64 @@ class ResponseDAO(SqlAlchemyDAO, IResponsesDAO):
             )
         return respond
 
+    @staticmethod
+    def _change_status_respond_query(respond: BaseResponseDTODAO, response_ids: list[int]) -> Select:
+        vacancies, resumes = VacancyDB.__table__, ResumeDB.__table__
+
+        changed_response = (
+            update(ResponsesDB)
+            .where(
+                ResponsesDB.response_id.in_(response_ids),
+                ResponsesDB.responder_type != respond.responder_type,
+                vacancies.c.vacancy_id == ResponsesDB.vacancy_id,
+                resumes.c.resume_id == ResponsesDB.resume_id,
+                or_(
+                    vacancies.c.company_id == respond.user_id,
+                    resumes.c.applicant_id == respond.user_id,
+                ),
+            )
+            .values(
+                status=respond.status
+            )
+            .returning(
+                ResponsesDB.response_id,
+                vacancies.c.company_id,
+                resumes.c.applicant_id
+            )
+            .cte("changed_response")
+        )
+        # one INSERT of messages for all changed responses
+        new_message = (
+            insert(MessageDB)
+            .from_select(
+                ["chat_id", "sender_id", "sender_type", "message_text"],
+                select(
+                    ChatDB.chat_id,
+                    literal(respond.user_id),
+                    cast(literal(respond.responder_type.value), ActorTypeEnumDB),
+                    literal(respond.message, MessageDB.message_text.type),
+                ).join(changed_response, changed_response.c.response_id == ChatDB.response_id)
+            )
+            .returning(MessageDB.message_id)
+            .cte("new_message")
+        )
+
+        # email of the other side: company for applicant, applicant for company
+        counterpart_id = (
+            changed_response.c.company_id
+            if respond.responder_type == ActorType.APPLICANT else
+            changed_response.c.applicant_id
+        )
+        users = UserDB.__table__
+
+        return (
+            select(changed_response.c.response_id, users.c.email)
+            .select_from(changed_response)
+            .join(users, users.c.user_id == counterpart_id)
+            # message is not read, but CTE has to be in the statement to be executed
+            .add_cte(new_message)
+        )
+
     @staticmethod
     def _error_parser(
             respond: BaseResponseDTODAO,
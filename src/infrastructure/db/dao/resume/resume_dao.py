@@ -2,30 +2,44 @@ from dataclasses import asdict
 from datetime import date
 
 from loguru import logger
-from sqlalchemy import insert, select, update, delete, Select, func, or_, and_, asc
+from sqlalchemy import (
+    insert, select, update, delete, Select, func, or_, and_, asc, tuple_, case, column, distinct, true, union
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import load_only, joinedload, contains_eager
+from sqlalchemy.orm import load_only, joinedload, contains_eager, selectinload
 
 from src.dto.db.applicant.applicant import BaseApplicantDTODAO
+from src.dto.db.recommendation.recommendation import MatchResumeDTODAO, MatchVacancyDTODAO
 from src.dto.db.resume.resume import (
     BaseResumeDTODAO,
-    SearchDTODAO
+    SearchDTODAO,
+    ResumeFacetsDTODAO
 )
 from src.dto.db.user.user import BaseUserDTODAO
 from src.dto.db.work_experience.work_experience import BaseWorkExperienceDTODAO
 from src.exceptions.base import BaseExceptions
 from src.exceptions.infrascructure.resume.resume import ResumeException, ResumeNotFoundByID
-from src.infrastructure.db.models import ResumeDB, ApplicantDB, WorkExperienceDB, UserDB
-from src.core.enums import GenderEnum, EmploymentType, Currency
+from src.infrastructure.db.models import ResumeDB, ApplicantDB, WorkExperienceDB, UserDB, ResumeSkillDB
+from src.infrastructure.db.dao.skill.skill_dao import SkillDAO
+from src.infrastructure.db.utils.experience import total_experience_months
+from src.infrastructure.db.utils.matching import resume_match_select
+from src.infrastructure.db.utils.like_pattern import contains_pattern, LIKE_ESCAPE
+from src.infrastructure.db.utils.salary import salary_range_filter, salary_base_values
+from src.infrastructure.db.utils.skills import skills_owners
+from src.core.enums import GenderEnum, EmploymentType, Currency, ExperienceBucket, SkillsMatch
+from src.infrastructure.enums_db import EmploymentTypeEnumDB
 from src.interfaces.infrastructure.dao.resume_dao import IResumeDAO
 from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+from src.utils.cursor import decode_cursor
+from src.utils.skills import normalize_skills
 
 
 class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
     def __init__(self, session: AsyncSession):
         super().__init__(session)
         self._query_builder = ResumeQueryBuilder()
+        self._skill_dao = SkillDAO(session)
 
     async def create_resume(self, resume: BaseResumeDTODAO) -> BaseResumeDTODAO:
         sql = (
@@ -53,6 +67,11 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
             raise self._error_parser()
 
         model = result.scalar_one()
+        if model.key_skills is not None:
+            await self._skill_dao.set_resume_skills(model.resume_id, model.key_skills)
+        if model.salary_currency is not None:
+            await self._update_salary_base(model.resume_id)
+
         return BaseResumeDTODAO(
             applicant=BaseApplicantDTODAO(
                 user=BaseUserDTODAO(
@@ -74,7 +93,7 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
 
     async def update_resume(self, resume: BaseResumeDTODAO) -> None:
         data = asdict(resume)
-        resume_fields = {k: v for k, v in data.items() if v is not None and k not in {"resume_id"}}
+        resume_fields = {k: v for k, v in data.items() if v is not None and k not in {"resume_id", "applicant"}}
 
         sql = (
             update(ResumeDB)
@@ -83,10 +102,11 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
                 ResumeDB.applicant_id == resume.applicant.user.user_id
             )
             .values(**resume_fields)
+            .returning(ResumeDB.resume_id)
         )
 
         try:
-            await self._session.execute(sql)
+            updated_resume_id = (await self._session.execute(sql)).scalar_one_or_none()
 
         except IntegrityError as exc:
             logger.bind(
@@ -94,6 +114,22 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
             ).error(f"WITH DATA {resume}\nMESSAGE: {exc}")
             raise self._error_parser()
 
+        if updated_resume_id is None:
+            return
+
+        if resume.key_skills is not None:
+            await self._skill_dao.set_resume_skills(updated_resume_id, resume.key_skills)
+        if {"salary_min", "salary_max", "salary_currency"} & resume_fields.keys():
+            await self._update_salary_base(updated_resume_id)
+
+    async def _update_salary_base(self, resume_id: int) -> None:
+        sql = (
+            update(ResumeDB)
+            .where(ResumeDB.resume_id == resume_id)
+            .values(**salary_base_values(ResumeDB), updated_at=ResumeDB.updated_at)
+        )
+        await self._session.execute(sql)
+
     async def get_resume_by_id(self, resume_id: int) -> BaseResumeDTODAO:
         sql = (
             select(ResumeDB)
@@ -194,6 +230,31 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
         )
         await self._session.execute(sql)
 
+    async def recalculate_total_experience_months(self) -> int:
+        """
+        Refresh total_experience_months of resumes with job that is not ended yet,
+        other resumes are kept up to date by WorkExperienceDAO. Return count of changed resumes.
+        """
+        total_months = total_experience_months()
+        open_ended_resumes = (
+            select(WorkExperienceDB.resume_id)
+            .where(WorkExperienceDB.end_date.is_(None))
+        )
+
+        sql = (
+            update(ResumeDB)
+            .where(
+                ResumeDB.resume_id.in_(open_ended_resumes),
+                ResumeDB.total_experience_months != total_months
+            )
+            .values(
+                total_experience_months=total_months,
+                updated_at=ResumeDB.updated_at  # it isn't change of resume made by user
+            )
+        )
+        result = await self._session.execute(sql)
+        return result.rowcount
+
     async def search_resumes(self, search_dto: SearchDTODAO) -> list[BaseResumeDTODAO]:
         sql = self._query_builder.get_query(
             name_resume=search_dto.name_resume,
@@ -208,15 +269,25 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
             max_age=search_dto.max_age,
             start_experience_years=search_dto.start_experience_years,
             end_experience_years=search_dto.end_experience_years,
+            skills=search_dto.skills,
+            skills_match=search_dto.skills_match,
             offset=search_dto.offset,
-            limit=search_dto.limit
+            limit=search_dto.limit,
+            cursor=search_dto.cursor
         )
 
-        result = await self._session.execute(sql)
-        models = result.unique().all()
+        resume_ids = (await self._session.execute(sql)).scalars().all()
+        return await self.get_resumes_by_ids(list(resume_ids))
+
+    async def get_resumes_by_ids(self, resume_ids: list[int]) -> list[BaseResumeDTODAO]:
+        if not resume_ids:
+            return []
+
+        models = {resume.resume_id: resume for resume in await self._load_resumes(resume_ids)}
 
         dtos: list[BaseResumeDTODAO] = []
-        for resume, total_months in models:
+        # keep order of ids page, resume deleted between two queries is skipped
+        for resume in (models[resume_id] for resume_id in resume_ids if resume_id in models):
             applicant = resume.applicant  # That ApplicatDB joined with UserDB
             dto = BaseResumeDTODAO(
                 resume_id=resume.resume_id,
@@ -228,7 +299,7 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
                 salary_currency=resume.salary_currency,
                 location=resume.location,
                 type_of_employment=resume.type_of_employment,
-                total_months=total_months,
+                total_months=resume.total_experience_months,
                 applicant=BaseApplicantDTODAO(
                     description_applicant=applicant.description_applicant,
                     address=applicant.address,
@@ -260,11 +331,131 @@ class ResumeDAO(SqlAlchemyDAO, IResumeDAO):
             dtos.append(dto)
         return dtos
 
+    async def _load_resumes(self, resume_ids: list[int]) -> list[ResumeDB]:
+        """
+        Load resumes of search page by ids. Applicant is 1:1 so it is joined,
+        work experiences are loaded by one more IN query (a join would repeat resume for every of them).
+        """
+        sql = (
+            select(ResumeDB)
+            .join(ResumeDB.applicant)
+            .options(
+                contains_eager(ResumeDB.applicant)
+                .load_only(
+                    ApplicantDB.applicant_id,
+                    ApplicantDB.gender,
+                    ApplicantDB.address,
+                    ApplicantDB.level_education,
+                    ApplicantDB.date_born,
+                    ApplicantDB.email,
+                    ApplicantDB.first_name,
+                    ApplicantDB.last_name,
+                    ApplicantDB.phone_number,
+                    ApplicantDB.description_applicant,
+                    ApplicantDB.image_url,
+                    ApplicantDB.is_confirmed,
+                ),
+                selectinload(ResumeDB.work_experiences).load_only(
+                    WorkExperienceDB.work_experience_id,
+                    WorkExperienceDB.resume_id,
+                    WorkExperienceDB.company_name,
+                    WorkExperienceDB.start_date,
+                    WorkExperienceDB.end_date,
+                    WorkExperienceDB.description_work,
+                ),
+                load_only(
+                    ResumeDB.resume_id,
+                    ResumeDB.name_resume,
+                    ResumeDB.profession,
+                    ResumeDB.key_skills,
+                    ResumeDB.salary_min,
+                    ResumeDB.salary_max,
+                    ResumeDB.salary_currency,
+                    ResumeDB.location,
+                    ResumeDB.type_of_employment,
+                    ResumeDB.total_experience_months,
+                ),
+            )
+            .where(ResumeDB.resume_id.in_(resume_ids))
+        )
+        return list((await self._session.execute(sql)).scalars().all())
+
+    async def get_match_candidates(self, vacancy: MatchVacancyDTODAO, pool_size: int) -> list[MatchResumeDTODAO]:
+        """
+        Candidate pool of vacancy for shortlist: published resumes with most of its skills
+        (by ix_resume_skills_skill_id_resume_id) and resumes with its profession (by trigram index).
+        """
+        by_skills = (
+            select(ResumeSkillDB.resume_id)
+            .where(ResumeSkillDB.skill_id.in_(vacancy.skill_ids or []))
+            .group_by(ResumeSkillDB.resume_id)
+            .order_by(func.count().desc())
+            .limit(pool_size)
+        )
+        by_profession = (
+            select(ResumeDB.resume_id)
+            .where(
+                ResumeDB.is_published,
+                ResumeDB.profession.ilike(contains_pattern(vacancy.profession), escape=LIKE_ESCAPE)
+            )
+            .limit(pool_size)
+        )
+        candidates = union(by_skills, by_profession).subquery("candidates")
+        sql = (
+            resume_match_select()
+            .join(candidates, candidates.c.resume_id == ResumeDB.resume_id)
+            .where(ResumeDB.is_published)
+            .limit(pool_size)
+        )
+        result = await self._session.execute(sql)
+
+        return [MatchResumeDTODAO(**row._asdict()) for row in result]
+
+    async def get_resume_facets(self, search_dto: SearchDTODAO) -> ResumeFacetsDTODAO:
+        sql = self._query_builder.get_facets_query(
+            name_resume=search_dto.name_resume,
+            location=search_dto.location,
+            profession=search_dto.profession,
+            gender=search_dto.gender,
+            type_of_employment=search_dto.type_of_employment,
+            salary_min=search_dto.salary_min,
+            salary_max=search_dto.salary_max,
+            salary_currency=search_dto.salary_currency,
+            min_age=search_dto.min_age,
+            max_age=search_dto.max_age,
+            start_experience_years=search_dto.start_experience_years,
+            end_experience_years=search_dto.end_experience_years,
+            skills=search_dto.skills,
+            skills_match=search_dto.skills_match,
+        )
+        rows = (await self._session.execute(sql)).all()
+
+        facets = ResumeFacetsDTODAO(type_of_employment={}, salary_currency={}, gender={}, experience={})
+        for row in rows:
+            facet = RESUME_FACETS_BY_GROUPING[row.grouping]
+            key = row._mapping[facet]
+            if key is None:  # resume without value of the facet
+                continue
+
+            if facet == "experience":
+                key = ExperienceBucket(key)
+            getattr(facets, facet)[key] = row.resumes_count
+
+        return facets
+
     @staticmethod
     def _error_parser() -> BaseExceptions:
         return ResumeException()
 
 
+RESUME_FACETS = ("type_of_employment", "salary_currency", "gender", "experience")
+# GROUPING() of facets query has bit 1 for every column which is not in the grouping set of row
+RESUME_FACETS_BY_GROUPING = {
+    (2 ** len(RESUME_FACETS) - 1) ^ (1 << (len(RESUME_FACETS) - 1 - i)): facet
+    for i, facet in enumerate(RESUME_FACETS)
+}
+
+
 class ResumeQueryBuilder:
     def __init__(self):
         self._query = None
@@ -283,11 +474,15 @@ class ResumeQueryBuilder:
             max_age: int | None,
             start_experience_years: int | None,
             end_experience_years: int | None,
+            skills: list[str] | None = None,
+            skills_match: SkillsMatch = SkillsMatch.ALL,
             offset: int = 0,
-            limit: int = 25
+            limit: int = 25,
+            cursor: str | None = None
     ) -> Select:
         return (
-            self._select(offset, limit)
+            self._select(limit)
+            ._with_page(offset, cursor)
             ._with_experience_between(start_experience_years, end_experience_years)
             ._with_resume_name(name_resume)
             ._with_gender(gender)
@@ -296,93 +491,135 @@ class ResumeQueryBuilder:
             ._with_type_of_employment(type_of_employment)
             ._with_salary_and_currency(salary_min, salary_max, salary_currency)
             ._with_total_age(min_age, max_age)
+            ._with_skills(skills, skills_match)
             ._build()
         )
 
-    def _select(self, offset: int = 0, limit: int = 0):
-        end_date = func.coalesce(WorkExperienceDB.end_date, func.current_date())
-        months_diff = (
-                (func.extract("year", end_date) - func.extract("year", WorkExperienceDB.start_date)) * 12 +
-                (func.extract("month", end_date) - func.extract("month", WorkExperienceDB.start_date))
+    def get_facets_query(
+            self,
+            name_resume: str | None,
+            location: str | None,
+            profession: str | None,
+            gender: GenderEnum | None,
+            type_of_employment: EmploymentType | None,
+            salary_min: float | None,
+            salary_max: float | None,
+            salary_currency: Currency | None,
+            min_age: int | None,
+            max_age: int | None,
+            start_experience_years: int | None,
+            end_experience_years: int | None,
+            skills: list[str] | None = None,
+            skills_match: SkillsMatch = SkillsMatch.ALL,
+    ) -> Select:
+        """
+        Count of resumes found by the same filters per value of every facet, all facets in one query
+        with GROUPING SETS. Resume is counted in every its type of employment.
+        """
+        filtered = (
+            self._select_facets()
+            ._with_experience_between(start_experience_years, end_experience_years)
+            ._with_resume_name(name_resume)
+            ._with_gender(gender)
+            ._with_location(location)
+            ._with_profession(profession)
+            ._with_type_of_employment(type_of_employment)
+            ._with_salary_and_currency(salary_min, salary_max, salary_currency)
+            ._with_total_age(min_age, max_age)
+            ._with_skills(skills, skills_match)
+            ._build()
+            .subquery("filtered")
+        )
+        employment = (
+            func.unnest(filtered.c.type_of_employment)
+            .table_valued(column("employment_type", EmploymentTypeEnumDB))
+            .lateral("employment")
         )
 
-        self._work_sum_subq = (  # Calculated sum of months and prepared as subquery
+        facet_columns = (
+            employment.c.employment_type.label("type_of_employment"),
+            filtered.c.salary_currency,
+            filtered.c.gender,
+            filtered.c.experience,
+        )
+        return (
             select(
-                WorkExperienceDB.resume_id.label("resume_id"),
-                func.sum(months_diff).label("total_months")
+                *facet_columns,
+                func.grouping(*facet_columns).label("grouping"),
+                func.count(distinct(filtered.c.resume_id)).label("resumes_count")
             )
-            .group_by(WorkExperienceDB.resume_id)
-            .subquery()
+            .select_from(filtered.outerjoin(employment, true()))
+            .group_by(func.grouping_sets(*(tuple_(facet_column) for facet_column in facet_columns)))
         )
 
+    def _select(self, limit: int = 0):
+        # only page of ids, resumes with applicants and work experiences are loaded by ResumeDAO
         self._query = (
-            select(ResumeDB, self._work_sum_subq.c.total_months)
-            .outerjoin(self._work_sum_subq, self._work_sum_subq.c.resume_id == ResumeDB.resume_id)
-            .join(ResumeDB.applicant)
-            .options(
-                contains_eager(ResumeDB.applicant)
-                .load_only(
-                    ApplicantDB.applicant_id,
-                    ApplicantDB.gender,
-                    ApplicantDB.address,
-                    ApplicantDB.level_education,
-                    ApplicantDB.date_born,
-                    ApplicantDB.email,
-                    ApplicantDB.first_name,
-                    ApplicantDB.last_name,
-                    ApplicantDB.phone_number,
-                    ApplicantDB.description_applicant,
-                    ApplicantDB.image_url,
-                    ApplicantDB.is_confirmed,
-                ),
-                joinedload(ResumeDB.work_experiences).load_only(
-                    WorkExperienceDB.work_experience_id,
-                    WorkExperienceDB.resume_id,
-                    WorkExperienceDB.company_name,
-                    WorkExperienceDB.start_date,
-                    WorkExperienceDB.end_date,
-                    WorkExperienceDB.description_work,
-                ),
-                load_only(
-                    ResumeDB.resume_id,
-                    ResumeDB.name_resume,
-                    ResumeDB.profession,
-                    ResumeDB.key_skills,
-                    ResumeDB.salary_min,
-                    ResumeDB.salary_max,
-                    ResumeDB.salary_currency,
-                    ResumeDB.location,
-                    ResumeDB.type_of_employment,
-                ),
-            )
-            .order_by(asc(ResumeDB.name_resume))
+            select(ResumeDB.resume_id)
+            .order_by(asc(ResumeDB.name_resume), asc(ResumeDB.resume_id))
             .limit(limit)
-            .offset(offset)
+        )
+        return self
+
+    def _select_facets(self):
+        applicants = ApplicantDB.__table__
+        months = ResumeDB.total_experience_months
+        self._query = (
+            select(
+                ResumeDB.resume_id,
+                ResumeDB.type_of_employment,
+                ResumeDB.salary_currency,
+                applicants.c.gender,
+                case(
+                    (months < 12, ExperienceBucket.NO_EXPERIENCE.value),
+                    (months < 36, ExperienceBucket.BETWEEN_1_AND_3.value),
+                    (months < 72, ExperienceBucket.BETWEEN_3_AND_6.value),
+                    else_=ExperienceBucket.MORE_THAN_6.value
+                ).label("experience")
+            )
+            .join(applicants, applicants.c.applicant_id == ResumeDB.applicant_id)
+        )
+        return self
+
+    def _with_page(self, offset: int | None, cursor: str | None):
+        """
+        With cursor the page starts right after (name_resume, resume_id) of the previous one,
+        so every page costs the same. Offset is kept for old clients.
+        """
+        if cursor is None:
+            self._query = self._query.offset(offset)
+            return self
+
+        name_resume, resume_id = decode_cursor(cursor, str, int)
+        self._query = self._query.where(
+            tuple_(ResumeDB.name_resume, ResumeDB.resume_id) > tuple_(name_resume, resume_id)
         )
         return self
 
     def _with_resume_name(self, name_resume: str | None):
         if name_resume is not None:
-            self._query = self._query.where(ResumeDB.name_resume.like(f"%{name_resume}%"))
+            self._query = self._query.where(
+                ResumeDB.name_resume.ilike(contains_pattern(name_resume), escape=LIKE_ESCAPE)
+            )
         return self
 
     def _with_location(self, location: str | None):
         if location is not None:
-            self._query = self._query.where(ResumeDB.location.like(f"%{location}%"))
+            self._query = self._query.where(
+                ResumeDB.location.ilike(contains_pattern(location), escape=LIKE_ESCAPE)
+            )
         return self
 
     def _with_gender(self, gender: GenderEnum | None):
         if gender is not None:
-            self._query = (
-                self._query
-                .join(ResumeDB.applicant)
-                .where(ApplicantDB.gender == gender)
-            )
+            self._query = self._query.where(ResumeDB.applicant.has(ApplicantDB.gender == gender))
         return self
 
     def _with_profession(self, profession: str | None):
         if profession is not None:
-            self._query = self._query.where(ResumeDB.profession.like(f"%{profession}%"))
+            self._query = self._query.where(
+                ResumeDB.profession.ilike(contains_pattern(profession), escape=LIKE_ESCAPE)
+            )
         return self
 
     def _with_type_of_employment(self, type_of_employment: list[EmploymentType] | None):
@@ -393,31 +630,30 @@ class ResumeQueryBuilder:
             )
         return self
 
+    def _with_skills(self, skills: list[str] | None, skills_match: SkillsMatch):
+        names = normalize_skills(skills)
+        if names:
+            self._query = self._query.where(
+                ResumeDB.resume_id.in_(
+                    skills_owners(ResumeSkillDB.resume_id, ResumeSkillDB.skill_id, names, skills_match)
+                )
+            )
+        return self
+
     def _with_salary_and_currency(
             self,
             salary_min: float | None,
             salary_max: float | None,
             salary_currency: Currency | None
     ):
-        if salary_currency is not None:
+        if salary_min is not None or salary_max is not None:
+            # bounds are in salary_currency, rows in any currency are compared by salary in base currency
             self._query = self._query.where(
-                ResumeDB.salary_currency == salary_currency.value
+                salary_range_filter(ResumeDB, salary_min, salary_max, salary_currency)
             )
-
-        if salary_min is not None and salary_max is not None:
+        elif salary_currency is not None:
             self._query = self._query.where(
-                and_(
-                    or_(ResumeDB.salary_min.is_(None), ResumeDB.salary_min <= salary_max),
-                    or_(ResumeDB.salary_max.is_(None), ResumeDB.salary_max >= salary_min),
-                )
-            )
-        elif salary_min is not None:
-            self._query = self._query.where(
-                or_(ResumeDB.salary_max.is_(None), ResumeDB.salary_max >= salary_min)
-            )
-        elif salary_max is not None:
-            self._query = self._query.where(
-                or_(ResumeDB.salary_min.is_(None), ResumeDB.salary_min <= salary_max)
+                ResumeDB.salary_currency == salary_currency.value
             )
 
         return self
@@ -472,13 +708,11 @@ class ResumeQueryBuilder:
         if start_months is not None and end_months is not None and start_months > end_months:
             start_months, end_months = end_months, start_months
 
-        total_months = func.coalesce(self._work_sum_subq.c.total_months, 0)  # count no experience as 0 months
-
         conds = []
         if start_months is not None:
-            conds.append(total_months >= start_months)
+            conds.append(ResumeDB.total_experience_months >= start_months)
         if end_months is not None:
-            conds.append(total_months <= end_months)
+            conds.append(ResumeDB.total_experience_months <= end_months)
 
         if conds:
             self._query = self._query.where(*conds)
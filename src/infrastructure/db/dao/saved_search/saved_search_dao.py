@@ -0,0 +1,123 @@
+from sqlalchemy import insert, select, delete, func, literal
+
+from src.dto.db.saved_search.saved_search import SavedSearchDTODAO, AlertVacancyDTODAO
+from src.infrastructure.db.models import SavedSearchDB, SavedSearchTermDB, UserDB, VacancyDB, CompanyDB, ExchangeRateDB
+from src.infrastructure.db.models.exchange_rate import BASE_CURRENCY
+from src.infrastructure.enums_db import CurrencyEnumDB
+from src.interfaces.infrastructure.dao.saved_search_dao import ISavedSearchDAO
+from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+from src.utils.saved_search import PREDICATES_COUNT, saved_search_terms, vacancy_terms
+
+
+SAVED_SEARCH_COLUMNS = (
+    SavedSearchDB.saved_search_id,
+    SavedSearchDB.applicant_id,
+    SavedSearchDB.name,
+    SavedSearchDB.profession,
+    SavedSearchDB.location,
+    SavedSearchDB.salary_min,
+    SavedSearchDB.salary_max,
+    SavedSearchDB.salary_currency,
+    SavedSearchDB.type_of_employment,
+    SavedSearchDB.created_at,
+)
+
+
+class SavedSearchDAO(SqlAlchemyDAO, ISavedSearchDAO):
+    async def create_saved_search(self, saved_search: SavedSearchDTODAO) -> SavedSearchDTODAO:
+        sql = (
+            insert(SavedSearchDB)
+            .values(
+                applicant_id=saved_search.applicant_id,
+                name=saved_search.name,
+                profession=saved_search.profession,
+                location=saved_search.location,
+                salary_min=saved_search.salary_min,
+                salary_max=saved_search.salary_max,
+                salary_currency=saved_search.salary_currency,
+                type_of_employment=saved_search.type_of_employment
+            )
+            .returning(*SAVED_SEARCH_COLUMNS)
+        )
+        row = (await self._session.execute(sql)).one()
+
+        terms = saved_search_terms(
+            saved_search.profession,
+            saved_search.salary_currency,
+            saved_search.type_of_employment,
+            has_salary_bounds=saved_search.salary_min is not None or saved_search.salary_max is not None
+        )
+        await self._session.execute(
+            insert(SavedSearchTermDB),
+            [dict(term=term, saved_search_id=row.saved_search_id) for term in terms]
+        )
+
+        return SavedSearchDTODAO(**row._asdict())
+
+    async def get_saved_searches(self, applicant_id: int) -> list[SavedSearchDTODAO]:
+        sql = (
+            select(*SAVED_SEARCH_COLUMNS)
+            .where(SavedSearchDB.applicant_id == applicant_id)
+            .order_by(SavedSearchDB.saved_search_id)
+        )
+        result = await self._session.execute(sql)
+
+        return [SavedSearchDTODAO(**row._asdict()) for row in result]
+
+    async def delete_saved_search(self, saved_search_id: int, applicant_id: int) -> None:
+        # terms are deleted by cascade
+        sql = (
+            delete(SavedSearchDB)
+            .where(
+                SavedSearchDB.saved_search_id == saved_search_id,
+                SavedSearchDB.applicant_id == applicant_id
+            )
+        )
+        await self._session.execute(sql)
+
+    async def get_alert_vacancy(self, vacancy_id: int) -> AlertVacancyDTODAO | None:
+        sql = (
+            select(
+                VacancyDB.vacancy_id,
+                VacancyDB.title,
+                VacancyDB.profession,
+                CompanyDB.company_name,
+                VacancyDB.location,
+                VacancyDB.salary_min,
+                VacancyDB.salary_max,
+                VacancyDB.salary_currency,
+                VacancyDB.salary_min_base,
+                VacancyDB.salary_max_base,
+                VacancyDB.type_of_employment,
+            )
+            .join(CompanyDB, CompanyDB.company_id == VacancyDB.company_id)
+            .where(VacancyDB.vacancy_id == vacancy_id, VacancyDB.is_published)
+        )
+        row = (await self._session.execute(sql)).one_or_none()
+
+        return AlertVacancyDTODAO(**row._asdict()) if row is not None else None
+
+    async def get_candidate_searches(self, vacancy: AlertVacancyDTODAO) -> list[SavedSearchDTODAO]:
+        """
+        Searches which have all their terms among terms of vacancy, found by primary key of saved_search_terms.
+        """
+        candidate_ids = (
+            select(SavedSearchTermDB.saved_search_id)
+            .where(SavedSearchTermDB.term.in_(vacancy_terms(vacancy)))
+            .group_by(SavedSearchTermDB.saved_search_id)
+            .having(func.count() == PREDICATES_COUNT)
+        )
+        users = UserDB.__table__  # without polymorphic joins of UserDB
+        sql = (
+            select(*SAVED_SEARCH_COLUMNS, users.c.email, ExchangeRateDB.rate.label("salary_rate"))
+            .join(users, users.c.user_id == SavedSearchDB.applicant_id)
+            # salary bounds of search are compared in base currency, as in search of vacancies
+            .outerjoin(
+                ExchangeRateDB,
+                ExchangeRateDB.currency == func.coalesce(SavedSearchDB.salary_currency, literal(BASE_CURRENCY, CurrencyEnumDB))
+            )
+            .where(SavedSearchDB.saved_search_id.in_(candidate_ids))
+        )
+        result = await self._session.execute(sql)
+
+        return [SavedSearchDTODAO(**row._asdict()) for row in result]
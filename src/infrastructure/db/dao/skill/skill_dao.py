@@ -0,0 +1,84 @@
+from sqlalchemy import insert, select, delete, Table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.infrastructure.db.models import SkillDB, ResumeSkillDB, VacancySkillDB, ResumeDB, VacancyDB
+from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+from src.utils.skills import normalize_skills
+
+
+class SkillDAO(SqlAlchemyDAO):
+    """
+    Keeps skills dictionary and links of resumes/vacancies to it in sync with their key_skills.
+    Works in the session of calling DAO, so links are committed together with resume or vacancy.
+    """
+
+    async def set_resume_skills(self, resume_id: int, key_skills: str | None) -> None:
+        await self._replace_links(ResumeSkillDB.__table__, {resume_id: normalize_skills(key_skills)})
+
+    async def set_vacancy_skills(self, vacancy_id: int, key_skills: str | None) -> None:
+        await self._replace_links(VacancySkillDB.__table__, {vacancy_id: normalize_skills(key_skills)})
+
+    async def backfill_resume_skills(self, after_resume_id: int, chunk_size: int) -> int | None:
+        """
+        Rebuild links of next chunk of resumes ordered by id, return last processed id or None at the end.
+        """
+        sql = (
+            select(ResumeDB.resume_id, ResumeDB.key_skills)
+            .where(ResumeDB.resume_id > after_resume_id)
+            .order_by(ResumeDB.resume_id)
+            .limit(chunk_size)
+        )
+        rows = (await self._session.execute(sql)).all()
+        if not rows:
+            return None
+
+        await self._replace_links(
+            ResumeSkillDB.__table__,
+            {row.resume_id: normalize_skills(row.key_skills) for row in rows}
+        )
+        return rows[-1].resume_id
+
+    async def backfill_vacancy_skills(self, after_vacancy_id: int, chunk_size: int) -> int | None:
+        sql = (
+            select(VacancyDB.vacancy_id, VacancyDB.key_skills)
+            .where(VacancyDB.vacancy_id > after_vacancy_id)
+            .order_by(VacancyDB.vacancy_id)
+            .limit(chunk_size)
+        )
+        rows = (await self._session.execute(sql)).all()
+        if not rows:
+            return None
+
+        await self._replace_links(
+            VacancySkillDB.__table__,
+            {row.vacancy_id: normalize_skills(row.key_skills) for row in rows}
+        )
+        return rows[-1].vacancy_id
+
+    async def _replace_links(self, links: Table, skills_by_owner: dict[int, list[str]]) -> None:
+        owner_column = links.c.resume_id if "resume_id" in links.c else links.c.vacancy_id
+        names = {name for skills in skills_by_owner.values() for name in skills}
+
+        skill_ids: dict[str, int] = {}
+        if names:
+            await self._session.execute(
+                pg_insert(SkillDB)
+                .values([{"name": name} for name in sorted(names)])  # same order, so no deadlocks between writers
+                .on_conflict_do_nothing(index_elements=[SkillDB.name])
+            )
+            result = await self._session.execute(
+                select(SkillDB.name, SkillDB.skill_id).where(SkillDB.name.in_(names))
+            )
+            skill_ids = dict(result.tuples().all())
+
+        await self._session.execute(
+            delete(links).where(owner_column.in_(list(skills_by_owner)))
+        )
+
+        rows = [
+            {owner_column.name: owner_id, "skill_id": skill_ids[name]}
+            for owner_id, skills in skills_by_owner.items()
+            for name in skills
+        ]
+        if rows:
+            await self._session.execute(insert(links), rows)
@@ -2,7 +2,7 @@ from loguru import logger
 from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 
-from src.dto.db.user.user import BaseUserDTODAO
+from src.dto.db.user.user import BaseUserDTODAO, AuthUserDTODAO
 from src.exceptions.base import BaseExceptions
 from src.exceptions.infrascructure.user.user import UserAlreadyExist, UserNotFoundByEmail, BaseUserException
 
@@ -11,6 +11,19 @@ from src.interfaces.infrastructure.dao.user_dao import IUserDAO
 from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
 
 
+# columns of users table only: select(UserDB) joins applicants and companies for with_polymorphic
+_users = UserDB.__table__
+_PRINCIPAL_COLUMNS = (
+    _users.c.user_id,
+    _users.c.email,
+    _users.c.first_name,
+    _users.c.last_name,
+    _users.c.is_admin,
+    _users.c.is_superuser,
+    _users.c.type,
+)
+
+
 class UserDAO(SqlAlchemyDAO, IUserDAO):
     async def get_user_by_email(self, email: str) -> BaseUserDTODAO:
         sql = select(UserDB).where(UserDB.email == email)
@@ -34,6 +47,24 @@ class UserDAO(SqlAlchemyDAO, IUserDAO):
             type=result.type
         )
 
+    async def get_auth_user_by_email(self, email: str) -> AuthUserDTODAO:
+        sql = select(*_PRINCIPAL_COLUMNS, _users.c.password).where(_users.c.email == email)
+        result = (await self._session.execute(sql)).one_or_none()
+
+        if result is None:
+            logger.bind(
+                app_name=f"{UserDAO.__name__} in {self.get_auth_user_by_email.__name__}"
+            ).error(f"NOT FOUND BY EMAIL: {email}")
+            raise UserNotFoundByEmail(email)
+
+        return AuthUserDTODAO(**result._asdict())
+
+    async def get_auth_user_by_id(self, user_id: int) -> AuthUserDTODAO | None:
+        sql = select(*_PRINCIPAL_COLUMNS).where(_users.c.user_id == user_id)
+        result = (await self._session.execute(sql)).one_or_none()
+
+        return AuthUserDTODAO(**result._asdict()) if result is not None else None
+
     async def update_user(self, user: BaseUserDTODAO) -> None:
         data_dict = user.__dict__
 
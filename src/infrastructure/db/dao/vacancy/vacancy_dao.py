@@ -2,13 +2,21 @@ from dataclasses import asdict
 from datetime import datetime, timedelta
 
 from loguru import logger
-from sqlalchemy import insert, select, update, delete, case, func, text
+from sqlalchemy import insert, select, update, delete, case, func, text, Select, or_, and_, desc, tuple_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, load_only
 
 from src.dto.db.company.company import BaseCompanyDTODAO
+from src.dto.db.recommendation.recommendation import MatchVacancyDTODAO
 from src.dto.db.user.user import BaseUserDTODAO
-from src.dto.db.vacancy.vacancy import BaseVacancyDTODAO, BaseVacancyTypeDTODAO, BaseVacancyAccessDTODAO
+from src.dto.db.vacancy.vacancy import (
+    BaseVacancyDTODAO,
+    BaseVacancyTypeDTODAO,
+    BaseVacancyAccessDTODAO,
+    SearchDTODAO,
+    RecommendedVacancyDTODAO
+)
 from src.exceptions.infrascructure.vacancy.vacancy import (
     BaseVacancyException,
     VacancyException,
@@ -20,15 +28,30 @@ from src.infrastructure.db.models import (
     VacancyTypeDB,
     VacancyAccessDB,
     CompanyDB,
-    UserDB
+    UserDB,
+    VacancySkillDB,
+    VacancyRecommendationDB
 )
+from src.infrastructure.db.dao.skill.skill_dao import SkillDAO
 from src.infrastructure.db.models.vacancy import LikedVacancy
-from src.core.enums import VacancyDuration
+from src.infrastructure.db.utils.matching import vacancy_match_select
+from src.infrastructure.db.utils.like_pattern import contains_pattern, LIKE_ESCAPE
+from src.infrastructure.db.utils.rank import raised_rank_score, retiered_rank_score
+from src.infrastructure.db.utils.salary import salary_range_filter, salary_base_values
+from src.infrastructure.db.utils.skills import skills_owners
+from src.core.enums import VacancyDuration, Currency, EmploymentType, WorkScheduleType, SkillsMatch
 from src.interfaces.infrastructure.dao.vacancy_dao import IVacancyDAO
 from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
+from src.utils.cursor import decode_cursor
+from src.utils.skills import normalize_skills
 
 
 class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+        self._query_builder = VacancyQueryBuilder()
+        self._skill_dao = SkillDAO(session)
+
     async def create_vacancy(self, vacancy: BaseVacancyDTODAO) -> BaseVacancyDTODAO:
         subquery_vacancy_type = (
             select(VacancyTypeDB.vacancy_types_id)
@@ -55,6 +78,7 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
                 vacancy_type_id=subquery_vacancy_type,
                 experience_start=vacancy.experience_start,
                 experience_end=vacancy.experience_end,
+                rank_score=raised_rank_score(vacancy.vacancy_type.name),
             )
             .returning(VacancyDB.vacancy_id)
         )
@@ -91,6 +115,11 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
             ).error(f"WITH DATA {vacancy}\nEXCEPTION IN CREATE VACANCY_ACCESS: {exc}")
             raise self._error_parser(vacancy, exc)
 
+        if vacancy.key_skills is not None:
+            await self._skill_dao.set_vacancy_skills(vacancy_id, vacancy.key_skills)
+        if vacancy.salary_currency is not None:
+            await self._update_salary_base(vacancy_id)
+
         vacancy.vacancy_id = vacancy_id
         vacancy.created_at = datetime.now()
         vacancy.is_published = True
@@ -100,8 +129,16 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
     async def update_vacancy(self, vacancy: BaseVacancyDTODAO) -> None:
         data = asdict(vacancy)
         vacancy_update = {
-            k: v for k, v in data.items() if v is not None and k not in {"vacancy_id", "user", "company"}
+            k: v for k, v in data.items()
+            if v is not None and k not in {"vacancy_id", "user", "company", "vacancy_type", "vacancy_access"}
         }
+        if vacancy.vacancy_type is not None and vacancy.vacancy_type.name is not None:
+            vacancy_update["vacancy_type_id"] = (
+                select(VacancyTypeDB.vacancy_types_id)
+                .where(VacancyTypeDB.name == vacancy.vacancy_type.name)
+                .scalar_subquery()
+            )
+            vacancy_update["rank_score"] = retiered_rank_score(vacancy.vacancy_type.name)
 
         sql = (
             update(VacancyDB)
@@ -110,16 +147,34 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
                 VacancyDB.company_id == vacancy.company.user.user_id
             )
             .values(**vacancy_update)
+            .returning(VacancyDB.vacancy_id)
         )
 
         try:
-            await self._session.execute(sql)
+            updated_vacancy_id = (await self._session.execute(sql)).scalar_one_or_none()
         except IntegrityError as exc:
             logger.bind(
                 app_name=f"{VacancyDAO.__name__} in {self.update_vacancy.__name__}"
             ).error(f"WITH DATA {vacancy}\nEXCEPTION IN UPDATE VACANCY: {exc}")
             raise self._error_parser(vacancy, exc)
 
+        if updated_vacancy_id is None:
+            return
+
+        if vacancy.key_skills is not None:
+            await self._skill_dao.set_vacancy_skills(updated_vacancy_id, vacancy.key_skills)
+        if {"salary_min", "salary_max", "salary_currency"} & vacancy_update.keys():
+            await self._update_salary_base(updated_vacancy_id)
+
+    async def _update_salary_base(self, vacancy_id: int) -> None:
+        # updated_at is order of feed, it is not moved by this technical update
+        sql = (
+            update(VacancyDB)
+            .where(VacancyDB.vacancy_id == vacancy_id)
+            .values(**salary_base_values(VacancyDB), updated_at=VacancyDB.updated_at)
+        )
+        await self._session.execute(sql)
+
     async def get_vacancy_by_id(self, vacancy_id: int) -> BaseVacancyDTODAO:
         sql = (
             select(VacancyDB)
@@ -207,6 +262,54 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
             ),
         )
 
+    async def search_vacancies(self, search_dto: SearchDTODAO) -> list[BaseVacancyDTODAO]:
+        sql = self._query_builder.get_query(
+            profession=search_dto.profession,
+            location=search_dto.location,
+            salary_min=search_dto.salary_min,
+            salary_max=search_dto.salary_max,
+            salary_currency=search_dto.salary_currency,
+            type_of_employment=search_dto.type_of_employment,
+            type_work_schedule=search_dto.type_work_schedule,
+            experience_start=search_dto.experience_start,
+            experience_end=search_dto.experience_end,
+            skills=search_dto.skills,
+            skills_match=search_dto.skills_match,
+            offset=search_dto.offset,
+            limit=search_dto.limit,
+            cursor=search_dto.cursor
+        )
+
+        result = (await self._session.execute(sql)).all()
+
+        return [
+            BaseVacancyDTODAO(
+                company=BaseCompanyDTODAO(
+                    user=BaseUserDTODAO(
+                        user_id=vacancy.company_id
+                    ),
+                    company_name=vacancy.company_name,
+                    address=vacancy.address
+                ),
+                vacancy_id=vacancy.vacancy_id,
+                title=vacancy.title,
+                location=vacancy.location,
+                key_skills=vacancy.key_skills,
+                profession=vacancy.profession,
+                salary_min=vacancy.salary_min,
+                salary_max=vacancy.salary_max,
+                salary_currency=vacancy.salary_currency,
+                type_of_employment=vacancy.type_of_employment,
+                type_work_schedule=vacancy.type_work_schedule,
+                updated_at=vacancy.updated_at,
+                rank_score=vacancy.rank_score,
+                is_published=vacancy.is_published,
+                experience_start=vacancy.experience_start,
+                experience_end=vacancy.experience_end
+            )
+            for vacancy in result
+        ]
+
     async def delete_vacancy(self, vacancy_id: int, company_id: int) -> None:
         sql = (
             delete(VacancyDB)
@@ -286,9 +389,9 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
         )
 
         row = (await self._session.execute(sql_time_check)).first()
-        vacancy_type = row.type
         if not row:
             raise VacancyNotFoundByID(vacancy_id)
+        vacancy_type = row.type
 
         time_left = row.time_left
         if time_left is not None and time_left.total_seconds() > 0:
@@ -298,7 +401,7 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
         sql = (
             update(VacancyDB)
             .where(VacancyDB.vacancy_id == vacancy_id, VacancyDB.company_id == company_id)
-            .values(updated_at=func.now())
+            .values(updated_at=func.now(), rank_score=raised_rank_score(vacancy_type))
         )
         res = await self._session.execute(sql)
 
@@ -384,6 +487,75 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
             for vacancy in res
         ]
 
+    async def get_vacancy_for_matching(self, vacancy_id: int, company_id: int) -> MatchVacancyDTODAO:
+        sql = (
+            vacancy_match_select()
+            .where(VacancyDB.vacancy_id == vacancy_id, VacancyDB.company_id == company_id)
+        )
+        row = (await self._session.execute(sql)).one_or_none()
+
+        if row is None:
+            raise VacancyNotFoundByID(vacancy_id)
+
+        return MatchVacancyDTODAO(**row._asdict())
+
+    async def get_recommended_vacancies(self, applicant_id: int, limit: int) -> list[RecommendedVacancyDTODAO]:
+        # one read by ix_vacancy_recommendations_applicant_id_score, vacancies closed after the job are skipped
+        sql = (
+            select(
+                VacancyRecommendationDB.score,
+                VacancyDB.vacancy_id,
+                VacancyDB.title,
+                VacancyDB.profession,
+                VacancyDB.location,
+                VacancyDB.salary_min,
+                VacancyDB.salary_max,
+                VacancyDB.salary_currency,
+                VacancyDB.experience_start,
+                VacancyDB.experience_end,
+                VacancyDB.company_id,
+                CompanyDB.company_name,
+                CompanyDB.address,
+            )
+            .join(VacancyDB, VacancyDB.vacancy_id == VacancyRecommendationDB.vacancy_id)
+            .join(VacancyAccessDB, VacancyAccessDB.vacancy_id == VacancyDB.vacancy_id)
+            .join(CompanyDB, CompanyDB.company_id == VacancyDB.company_id)
+            .where(
+                VacancyRecommendationDB.applicant_id == applicant_id,
+                VacancyDB.is_published,
+                VacancyAccessDB.is_active,
+                VacancyAccessDB.end_date > func.now()
+            )
+            .order_by(desc(VacancyRecommendationDB.score))
+            .limit(limit)
+        )
+        result = (await self._session.execute(sql)).all()
+
+        return [
+            RecommendedVacancyDTODAO(
+                vacancy=BaseVacancyDTODAO(
+                    company=BaseCompanyDTODAO(
+                        user=BaseUserDTODAO(
+                            user_id=row.company_id
+                        ),
+                        company_name=row.company_name,
+                        address=row.address
+                    ),
+                    vacancy_id=row.vacancy_id,
+                    title=row.title,
+                    profession=row.profession,
+                    location=row.location,
+                    salary_min=row.salary_min,
+                    salary_max=row.salary_max,
+                    salary_currency=row.salary_currency,
+                    experience_start=row.experience_start,
+                    experience_end=row.experience_end
+                ),
+                score=row.score
+            )
+            for row in result
+        ]
+
     @staticmethod
     def _error_parser(
             vacancy: BaseVacancyDTODAO | None,
@@ -401,3 +573,171 @@ class VacancyDAO(SqlAlchemyDAO, IVacancyDAO):
             return VacancyNotFoundByID(kwargs.get("vacancy_id"))
 
         return VacancyException()
+
+
+class VacancyQueryBuilder:
+    """
+    Search only goes through published vacancies with an active access row,
+    every filter here is backed by an index on vacancies (see VacancyDB.__table_args__)
+    """
+
+    def __init__(self):
+        self._query = None
+
+    def get_query(
+            self,
+            profession: str | None,
+            location: str | None,
+            salary_min: float | None,
+            salary_max: float | None,
+            salary_currency: Currency | None,
+            type_of_employment: list[EmploymentType] | None,
+            type_work_schedule: list[WorkScheduleType] | None,
+            experience_start: int | None,
+            experience_end: int | None,
+            skills: list[str] | None = None,
+            skills_match: SkillsMatch = SkillsMatch.ALL,
+            offset: int = 0,
+            limit: int = 25,
+            cursor: str | None = None
+    ) -> Select:
+        return (
+            self._select(limit)
+            ._with_page(offset, cursor)
+            ._with_profession(profession)
+            ._with_location(location)
+            ._with_salary_and_currency(salary_min, salary_max, salary_currency)
+            ._with_type_of_employment(type_of_employment)
+            ._with_type_work_schedule(type_work_schedule)
+            ._with_experience_between(experience_start, experience_end)
+            ._with_skills(skills, skills_match)
+            ._build()
+        )
+
+    def _select(self, limit: int = 25):
+        self._query = (
+            select(
+                VacancyDB.vacancy_id,
+                VacancyDB.title,
+                VacancyDB.location,
+                VacancyDB.key_skills,
+                VacancyDB.profession,
+                VacancyDB.salary_min,
+                VacancyDB.salary_max,
+                VacancyDB.salary_currency,
+                VacancyDB.type_of_employment,
+                VacancyDB.type_work_schedule,
+                VacancyDB.updated_at,
+                VacancyDB.rank_score,
+                VacancyDB.is_published,
+                VacancyDB.experience_start,
+                VacancyDB.experience_end,
+                VacancyDB.company_id,
+                CompanyDB.company_name,
+                CompanyDB.address,
+            )
+            .join(VacancyAccessDB, VacancyAccessDB.vacancy_id == VacancyDB.vacancy_id)
+            .join(CompanyDB, CompanyDB.company_id == VacancyDB.company_id)
+            .where(
+                VacancyDB.is_published,  # plain column, so the planner matches partial indexes
+                VacancyAccessDB.is_active,
+                VacancyAccessDB.end_date > func.now()
+            )
+            # matches ix_vacancies_published_rank_score, so the scan stops after the page
+            .order_by(desc(VacancyDB.rank_score), desc(VacancyDB.vacancy_id))
+            .limit(limit)
+        )
+        return self
+
+    def _with_page(self, offset: int, cursor: str | None):
+        if cursor is None:
+            self._query = self._query.offset(offset)
+            return self
+
+        rank_score, vacancy_id = decode_cursor(cursor, int, int)
+        self._query = self._query.where(
+            tuple_(VacancyDB.rank_score, VacancyDB.vacancy_id) < tuple_(rank_score, vacancy_id)
+        )
+        return self
+
+    def _with_profession(self, profession: str | None):
+        if profession is not None:
+            self._query = self._query.where(
+                VacancyDB.profession.ilike(contains_pattern(profession), escape=LIKE_ESCAPE)
+            )
+        return self
+
+    def _with_location(self, location: str | None):
+        if location is not None:
+            self._query = self._query.where(
+                VacancyDB.location.ilike(contains_pattern(location), escape=LIKE_ESCAPE)
+            )
+        return self
+
+    def _with_salary_and_currency(
+            self,
+            salary_min: float | None,
+            salary_max: float | None,
+            salary_currency: Currency | None
+    ):
+        if salary_min is not None or salary_max is not None:
+            # bounds are in salary_currency, rows in any currency are compared by salary in base currency
+            self._query = self._query.where(
+                salary_range_filter(VacancyDB, salary_min, salary_max, salary_currency)
+            )
+        elif salary_currency is not None:
+            self._query = self._query.where(
+                VacancyDB.salary_currency == salary_currency.value
+            )
+
+        return self
+
+    def _with_type_of_employment(self, type_of_employment: list[EmploymentType] | None):
+        if type_of_employment:
+            type_of_employment_enum = [EmploymentType(x) for x in type_of_employment]
+            self._query = self._query.where(
+                VacancyDB.type_of_employment.overlap(type_of_employment_enum)  # && is served by GIN index
+            )
+        return self
+
+    def _with_type_work_schedule(self, type_work_schedule: list[WorkScheduleType] | None):
+        if type_work_schedule:
+            type_work_schedule_enum = [WorkScheduleType(x) for x in type_work_schedule]
+            self._query = self._query.where(
+                VacancyDB.type_work_schedule.overlap(type_work_schedule_enum)
+            )
+        return self
+
+    def _with_experience_between(
+            self,
+            experience_start: int | None = None,
+            experience_end: int | None = None
+    ):
+        #  if experience_start and experience_end are swapped
+        if experience_start is not None and experience_end is not None and experience_start > experience_end:
+            experience_start, experience_end = experience_end, experience_start
+
+        # vacancy window [experience_start, experience_end] must overlap with requested one
+        if experience_end is not None:
+            self._query = self._query.where(
+                or_(VacancyDB.experience_start.is_(None), VacancyDB.experience_start <= experience_end)
+            )
+        if experience_start is not None:
+            self._query = self._query.where(
+                or_(VacancyDB.experience_end.is_(None), VacancyDB.experience_end >= experience_start)
+            )
+
+        return self
+
+    def _with_skills(self, skills: list[str] | None, skills_match: SkillsMatch):
+        names = normalize_skills(skills)
+        if names:
+            self._query = self._query.where(
+                VacancyDB.vacancy_id.in_(
+                    skills_owners(VacancySkillDB.vacancy_id, VacancySkillDB.skill_id, names, skills_match)
+                )
+            )
+        return self
+
+    def _build(self):
+        return self._query
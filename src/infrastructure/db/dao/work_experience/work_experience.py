@@ -8,6 +8,7 @@ from src.dto.db.work_experience.work_experience import BaseWorkExperienceDTODAO
 from src.exceptions.infrascructure import BaseWorkExperiencesException
 from src.exceptions.infrascructure.work_experiences.work_experiences import WorkExperiences, WorkExperiencesNotFoundByID
 from src.infrastructure.db.models import WorkExperienceDB, ResumeDB
+from src.infrastructure.db.utils.experience import total_experience_months
 from src.interfaces.infrastructure.dao.workexperience_dao import IWorkExperienceDAO
 from src.interfaces.infrastructure.sqlalchemy_dao import SqlAlchemyDAO
 
@@ -42,6 +43,8 @@ class WorkExperienceDAO(SqlAlchemyDAO, IWorkExperienceDAO):
             ).error(f"WITH DATA {work_experience}\nMESSAGE: {exc}")
             raise self._error_parser()
 
+        await self._update_total_experience_months(res.resume_id)
+
         return BaseWorkExperienceDTODAO(
             resume_id=res.resume_id,
             work_experience_id=res.work_experience_id,
@@ -84,6 +87,8 @@ class WorkExperienceDAO(SqlAlchemyDAO, IWorkExperienceDAO):
             ).error(f"WITH DATA {work_experience}\nMESSAGE: {exc}")
             raise self._error_parser()
 
+        await self._update_total_experience_months(work_experience.resume_id)
+
     async def delete_work_experience(self, applicant_id: int, resume_id: int, work_experience_id: int) -> None:
         sub_sql = (
             select(ResumeDB.resume_id)
@@ -102,6 +107,7 @@ class WorkExperienceDAO(SqlAlchemyDAO, IWorkExperienceDAO):
             )
         )
         await self._session.execute(sql)
+        await self._update_total_experience_months(resume_id)
 
     async def get_work_experience_by_id(self, work_experience_id: int) -> BaseWorkExperienceDTODAO:
         sql = (
@@ -129,6 +135,17 @@ class WorkExperienceDAO(SqlAlchemyDAO, IWorkExperienceDAO):
             end_date=res.end_date
         )
 
+    async def _update_total_experience_months(self, resume_id: int) -> None:
+        """
+        Keep resumes.total_experience_months in the same transaction with changed work experience.
+        """
+        sql = (
+            update(ResumeDB)
+            .where(ResumeDB.resume_id == resume_id)
+            .values(total_experience_months=total_experience_months())
+        )
+        await self._session.execute(sql)
+
     @staticmethod
     def _error_parser() -> BaseWorkExperiencesException:
         return WorkExperiences()
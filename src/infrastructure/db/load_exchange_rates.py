@@ -0,0 +1,60 @@
+"""
+Load exchange rates to BASE_CURRENCY from csv file with columns currency,rate and recalculate
+salaries in base currency of resumes and vacancies whose currency rate has changed.
+
+    python -m src.infrastructure.db.load_exchange_rates [rates.csv, default exchange_rates.csv near this file]
+"""
+import argparse
+import asyncio
+import csv
+from decimal import Decimal
+from pathlib import Path
+
+from loguru import logger
+
+from src.core.config_reader import config
+from src.core.enums import Currency
+from src.infrastructure.connections import get_db_connection
+from src.infrastructure.db.dao.exchange_rate.exchange_rate_dao import ExchangeRateDAO
+from src.infrastructure.db.models.exchange_rate import BASE_CURRENCY
+
+
+DEFAULT_RATES_FILE = Path(__file__).parent / "exchange_rates.csv"
+
+
+def read_rates(path: Path) -> dict[Currency, Decimal]:
+    with path.open(newline="") as file:
+        rates = {Currency(row["currency"].strip().upper()): Decimal(row["rate"]) for row in csv.DictReader(file)}
+
+    if any(rate <= 0 for rate in rates.values()):
+        raise ValueError(f"Rates in {path} must be positive")
+    if rates.get(BASE_CURRENCY, Decimal(1)) != 1:
+        raise ValueError(f"Rate of base currency {BASE_CURRENCY.value} must be 1")
+
+    return rates
+
+
+async def main(path: Path) -> None:
+    rates = read_rates(path)
+    session_maker = get_db_connection(config.db)
+
+    # rates and salaries are changed in one transaction, so search never sees them out of sync
+    async with session_maker() as session:
+        dao = ExchangeRateDAO(session)
+        changed = await dao.set_rates(rates)
+        updated = await dao.recalculate_salaries_base(changed)
+        await session.commit()
+
+    await session_maker.kw["bind"].dispose()
+
+    logger.bind(app_name="load_exchange_rates").info(
+        f"CHANGED RATES {[currency.value for currency in changed]}, RECALCULATED {updated} SALARIES"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", type=Path, nargs="?", default=DEFAULT_RATES_FILE)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.path))
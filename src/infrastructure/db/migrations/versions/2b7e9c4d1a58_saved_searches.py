@@ -0,0 +1,57 @@
+"""saved searches
+
+Revision ID: 2b7e9c4d1a58
+Revises: f19b4d6a2c37
+Create Date: 2026-10-18 19:02:44.918306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7e9c4d1a58'
+down_revision: Union[str, None] = 'f19b4d6a2c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "saved_searches",
+        sa.Column("saved_search_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("applicant_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("profession", sa.String(length=30), nullable=True),
+        sa.Column("location", sa.String(length=100), nullable=True),
+        sa.Column("salary_min", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("salary_max", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("salary_currency", postgresql.ENUM(name="currency", create_type=False), nullable=True),
+        sa.Column(
+            "type_of_employment",
+            postgresql.ARRAY(postgresql.ENUM(name="employment_type", create_type=False)),
+            nullable=True
+        ),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["applicant_id"], ["applicants.applicant_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("saved_search_id"),
+    )
+    op.create_index("ix_saved_searches_applicant_id", "saved_searches", ["applicant_id"])
+    op.create_table(
+        "saved_search_terms",
+        sa.Column("term", sa.String(length=60), nullable=False),
+        sa.Column("saved_search_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["saved_search_id"], ["saved_searches.saved_search_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("term", "saved_search_id"),
+    )
+    op.create_index("ix_saved_search_terms_saved_search_id", "saved_search_terms", ["saved_search_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_saved_search_terms_saved_search_id", table_name="saved_search_terms")
+    op.drop_table("saved_search_terms")
+    op.drop_index("ix_saved_searches_applicant_id", table_name="saved_searches")
+    op.drop_table("saved_searches")
@@ -0,0 +1,87 @@
+"""vacancy search indexes
+
+Revision ID: 3f9a1c2e7b41
+Revises:
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c2e7b41'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # vacancies is a big table, so indexes are built without locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vacancies_published_updated_at",
+            "vacancies",
+            [sa.text("updated_at DESC"), sa.text("vacancy_id DESC")],
+            postgresql_where=sa.text("is_published"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_profession",
+            "vacancies",
+            ["profession"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_salary",
+            "vacancies",
+            ["salary_currency", "salary_min", "salary_max"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_experience",
+            "vacancies",
+            ["experience_start", "experience_end"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_type_of_employment",
+            "vacancies",
+            ["type_of_employment"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_type_work_schedule",
+            "vacancies",
+            ["type_work_schedule"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_company_id",
+            "vacancies",
+            ["company_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancy_access_active_end_date",
+            "vacancy_access",
+            ["vacancy_id", "end_date"],
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_vacancy_access_active_end_date", table_name="vacancy_access", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_company_id", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_type_work_schedule", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_type_of_employment", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_experience", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_salary", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_profession", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_vacancies_published_updated_at", table_name="vacancies", postgresql_concurrently=True)
@@ -0,0 +1,45 @@
+"""notification outbox
+
+Revision ID: 7d3a6e1f9b24
+Revises: 2b7e9c4d1a58
+Create Date: 2026-10-18 20:11:05.274631
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3a6e1f9b24'
+down_revision: Union[str, None] = '2b7e9c4d1a58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_outbox",
+        sa.Column("outbox_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("destination", sa.String(length=255), nullable=False),
+        sa.Column("template", sa.String(length=50), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=True),
+        sa.Column("body", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("outbox_id"),
+    )
+    op.create_index(
+        "ix_notification_outbox_next_attempt_at",
+        "notification_outbox",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("sent_at IS NULL")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_outbox_next_attempt_at", table_name="notification_outbox")
+    op.drop_table("notification_outbox")
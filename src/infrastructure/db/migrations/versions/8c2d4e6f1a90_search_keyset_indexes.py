@@ -0,0 +1,39 @@
+"""search keyset indexes
+
+Revision ID: 8c2d4e6f1a90
+Revises: 3f9a1c2e7b41
+Create Date: 2026-10-18 11:05:27.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2d4e6f1a90'
+down_revision: Union[str, None] = '3f9a1c2e7b41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_resumes_name_resume_resume_id",
+            "resumes",
+            ["name_resume", "resume_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_companies_company_name_company_id",
+            "companies",
+            ["company_name", "company_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_companies_company_name_company_id", table_name="companies", postgresql_concurrently=True)
+        op.drop_index("ix_resumes_name_resume_resume_id", table_name="resumes", postgresql_concurrently=True)
@@ -0,0 +1,75 @@
+"""salary in base currency
+
+Revision ID: a5f0d7c2e918
+Revises: e6c3b9d1f274
+Create Date: 2026-10-18 16:21:45.907314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5f0d7c2e918'
+down_revision: Union[str, None] = 'e6c3b9d1f274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SALARY_RANGE_BASE = "numrange(salary_min_base, salary_max_base, '[]')"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exchange_rates",
+        sa.Column("currency", postgresql.ENUM(name="currency", create_type=False), nullable=False),
+        sa.Column("rate", sa.Numeric(precision=18, scale=8), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("currency"),
+    )
+    # base currency, other rates are loaded by python -m src.infrastructure.db.load_exchange_rates
+    op.execute("INSERT INTO exchange_rates (currency, rate) VALUES ('USD', 1)")
+
+    for table in ("resumes", "vacancies"):
+        op.add_column(table, sa.Column("salary_min_base", sa.Numeric(precision=12, scale=2), nullable=True))
+        op.add_column(table, sa.Column("salary_max_base", sa.Numeric(precision=12, scale=2), nullable=True))
+        op.execute(
+            f"""
+            UPDATE {table} t
+            SET salary_min_base = CASE WHEN t.salary_min > t.salary_max THEN t.salary_max ELSE t.salary_min END * r.rate,
+                salary_max_base = CASE WHEN t.salary_min > t.salary_max THEN t.salary_min ELSE t.salary_max END * r.rate
+            FROM exchange_rates r
+            WHERE r.currency = t.salary_currency
+            """
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_resumes_salary_range_base",
+            "resumes",
+            [sa.text(SALARY_RANGE_BASE)],
+            postgresql_using="gist",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_vacancies_salary_range_base",
+            "vacancies",
+            [sa.text(SALARY_RANGE_BASE)],
+            postgresql_using="gist",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_vacancies_salary_range_base", table_name="vacancies", postgresql_concurrently=True)
+        op.drop_index("ix_resumes_salary_range_base", table_name="resumes", postgresql_concurrently=True)
+
+    for table in ("resumes", "vacancies"):
+        op.drop_column(table, "salary_max_base")
+        op.drop_column(table, "salary_min_base")
+
+    op.drop_table("exchange_rates")
@@ -0,0 +1,56 @@
+"""search trigram indexes
+
+Revision ID: b71e5a3c9d02
+Revises: 8c2d4e6f1a90
+Create Date: 2026-10-18 12:40:03.517962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e5a3c9d02'
+down_revision: Union[str, None] = '8c2d4e6f1a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRGM_INDEXES = (
+    ("ix_resumes_name_resume_trgm", "resumes", "name_resume"),
+    ("ix_resumes_location_trgm", "resumes", "location"),
+    ("ix_resumes_profession_trgm", "resumes", "profession"),
+    ("ix_companies_company_name_trgm", "companies", "company_name"),
+    ("ix_vacancies_profession_trgm", "vacancies", "profession"),
+    ("ix_vacancies_location_trgm", "vacancies", "location"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in TRGM_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+        # btree can't serve '%x%', trigram index took its place
+        op.drop_index("ix_vacancies_profession", table_name="vacancies", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vacancies_profession",
+            "vacancies",
+            ["profession"],
+            postgresql_concurrently=True,
+        )
+        for index_name, table_name, _ in reversed(TRGM_INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
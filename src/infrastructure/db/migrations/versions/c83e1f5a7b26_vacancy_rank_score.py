@@ -0,0 +1,59 @@
+"""vacancy rank score
+
+Revision ID: c83e1f5a7b26
+Revises: a5f0d7c2e918
+Create Date: 2026-10-18 17:04:12.663058
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c83e1f5a7b26'
+down_revision: Union[str, None] = 'a5f0d7c2e918'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "vacancies",
+        sa.Column("rank_score", sa.BigInteger(), server_default="0", nullable=False)
+    )
+    # updated_at of existing vacancies is the best known time of last raise
+    op.execute(
+        """
+        UPDATE vacancies v
+        SET rank_score = CASE t.name WHEN 'premium' THEN 2 WHEN 'paid' THEN 1 ELSE 0 END * 10000000000
+                         + extract(epoch FROM coalesce(v.updated_at, v.created_at))::bigint
+        FROM vacancy_types t
+        WHERE t.vacancy_types_id = v.vacancy_type_id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vacancies_published_rank_score",
+            "vacancies",
+            [sa.text("rank_score DESC"), sa.text("vacancy_id DESC")],
+            postgresql_where=sa.text("is_published"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_vacancies_published_updated_at", table_name="vacancies", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_vacancies_published_updated_at",
+            "vacancies",
+            [sa.text("updated_at DESC"), sa.text("vacancy_id DESC")],
+            postgresql_where=sa.text("is_published"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_vacancies_published_rank_score", table_name="vacancies", postgresql_concurrently=True)
+
+    op.drop_column("vacancies", "rank_score")
@@ -0,0 +1,57 @@
+"""resume total experience months
+
+Revision ID: d4a8f2b6c153
+Revises: b71e5a3c9d02
+Create Date: 2026-10-18 13:52:19.084611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8f2b6c153'
+down_revision: Union[str, None] = 'b71e5a3c9d02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "resumes",
+        sa.Column("total_experience_months", sa.Integer(), server_default="0", nullable=False)
+    )
+    op.execute(
+        """
+        UPDATE resumes r
+        SET total_experience_months = w.total_months
+        FROM (
+            SELECT
+                resume_id,
+                SUM(
+                    (EXTRACT(YEAR FROM COALESCE(end_date, CURRENT_DATE)) - EXTRACT(YEAR FROM start_date)) * 12 +
+                    (EXTRACT(MONTH FROM COALESCE(end_date, CURRENT_DATE)) - EXTRACT(MONTH FROM start_date))
+                ) AS total_months
+            FROM work_experiences
+            GROUP BY resume_id
+        ) w
+        WHERE w.resume_id = r.resume_id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_resumes_total_experience_months",
+            "resumes",
+            ["total_experience_months"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_resumes_total_experience_months", table_name="resumes", postgresql_concurrently=True)
+
+    op.drop_column("resumes", "total_experience_months")
@@ -0,0 +1,55 @@
+"""skills
+
+Revision ID: e6c3b9d1f274
+Revises: d4a8f2b6c153
+Create Date: 2026-10-18 15:07:33.512870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6c3b9d1f274'
+down_revision: Union[str, None] = 'd4a8f2b6c153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # links of existing rows are filled by python -m src.infrastructure.db.backfill_skills
+    op.create_table(
+        "skills",
+        sa.Column("skill_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.PrimaryKeyConstraint("skill_id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "resume_skills",
+        sa.Column("resume_id", sa.Integer(), nullable=False),
+        sa.Column("skill_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumes.resume_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["skill_id"], ["skills.skill_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("resume_id", "skill_id"),
+    )
+    op.create_index("ix_resume_skills_skill_id_resume_id", "resume_skills", ["skill_id", "resume_id"])
+    op.create_table(
+        "vacancy_skills",
+        sa.Column("vacancy_id", sa.Integer(), nullable=False),
+        sa.Column("skill_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["vacancy_id"], ["vacancies.vacancy_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["skill_id"], ["skills.skill_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("vacancy_id", "skill_id"),
+    )
+    op.create_index("ix_vacancy_skills_skill_id_vacancy_id", "vacancy_skills", ["skill_id", "vacancy_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vacancy_skills_skill_id_vacancy_id", table_name="vacancy_skills")
+    op.drop_table("vacancy_skills")
+    op.drop_index("ix_resume_skills_skill_id_resume_id", table_name="resume_skills")
+    op.drop_table("resume_skills")
+    op.drop_table("skills")
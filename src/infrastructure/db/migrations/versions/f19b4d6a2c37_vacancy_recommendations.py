@@ -0,0 +1,41 @@
+"""vacancy recommendations
+
+Revision ID: f19b4d6a2c37
+Revises: c83e1f5a7b26
+Create Date: 2026-10-18 18:15:27.204951
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19b4d6a2c37'
+down_revision: Union[str, None] = 'c83e1f5a7b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vacancy_recommendations",
+        sa.Column("applicant_id", sa.Integer(), nullable=False),
+        sa.Column("vacancy_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["applicant_id"], ["applicants.applicant_id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["vacancy_id"], ["vacancies.vacancy_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("applicant_id", "vacancy_id"),
+    )
+    op.create_index(
+        "ix_vacancy_recommendations_applicant_id_score",
+        "vacancy_recommendations",
+        ["applicant_id", sa.text("score DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_vacancy_recommendations_applicant_id_score", table_name="vacancy_recommendations")
+    op.drop_table("vacancy_recommendations")
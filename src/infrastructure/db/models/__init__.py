@@ -11,6 +11,11 @@ from src.infrastructure.db.models.vacancy import (
     VacancyDB,
     LikedVacancy
 )
+from src.infrastructure.db.models.skill import SkillDB, ResumeSkillDB, VacancySkillDB
+from src.infrastructure.db.models.exchange_rate import ExchangeRateDB
+from src.infrastructure.db.models.recommendation import VacancyRecommendationDB
+from src.infrastructure.db.models.saved_search import SavedSearchDB, SavedSearchTermDB
+from src.infrastructure.db.models.notification_outbox import NotificationOutboxDB
 
 
 __all__ = [
@@ -26,7 +31,15 @@ __all__ = [
     "LikedVacancy",
     "ResponsesDB",
     "MessageDB",
-    "ChatDB"
+    "ChatDB",
+    "SkillDB",
+    "ResumeSkillDB",
+    "VacancySkillDB",
+    "ExchangeRateDB",
+    "VacancyRecommendationDB",
+    "SavedSearchDB",
+    "SavedSearchTermDB",
+    "NotificationOutboxDB"
 ]
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Integer, ForeignKey
+from sqlalchemy import String, Boolean, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.db import models
@@ -24,6 +24,13 @@ class CompanyDB(models.UserDB):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # keyset pagination of search: (company_name, company_id) > cursor
+        Index("ix_companies_company_name_company_id", "company_name", "company_id"),
+        # substring ILIKE filter of search is served by pg_trgm
+        Index("ix_companies_company_name_trgm", "company_name", postgresql_using="gin", postgresql_ops={"company_name": "gin_trgm_ops"}),
+    )
+
     __mapper_args__ = {
         "polymorphic_identity": "company"
     }
@@ -0,0 +1,30 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Numeric, DateTime, func
+
+from src.core.enums import Currency
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.enums_db import CurrencyEnumDB
+
+
+# salary_min_base/salary_max_base of resumes and vacancies are kept in this currency
+BASE_CURRENCY = Currency.USD
+
+
+class ExchangeRateDB(Base):
+    """
+    How much of BASE_CURRENCY is one unit of currency. Loaded from file by
+    python -m src.infrastructure.db.load_exchange_rates
+    """
+    __tablename__ = "exchange_rates"
+
+    currency: Mapped[Currency] = mapped_column(CurrencyEnumDB, primary_key=True)
+    rate: Mapped[Decimal] = mapped_column(Numeric(18, 8), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=func.now(),
+        onupdate=func.now()
+    )
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Text, Integer, DateTime, Index, func, text
+
+from src.infrastructure.db.models.base import Base
+
+
+class NotificationOutboxDB(Base):
+    """
+    Notifications written in the transaction of the domain change, relay worker puts them in the queue.
+    """
+    __tablename__ = "notification_outbox"
+
+    outbox_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    destination: Mapped[str] = mapped_column(String(255), nullable=False)
+    template: Mapped[str] = mapped_column(String(50), nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=True)
+    body: Mapped[str] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+    sent_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # relay reads only not sent rows, the index stays small
+        Index(
+            "ix_notification_outbox_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("sent_at IS NULL")
+        ),
+    )
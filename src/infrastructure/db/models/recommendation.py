@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Float, DateTime, ForeignKey, Index, func, text
+
+from src.infrastructure.db.models.base import Base
+
+
+class VacancyRecommendationDB(Base):
+    """
+    Top vacancies for applicant, rebuilt by the recommendations job.
+    """
+    __tablename__ = "vacancy_recommendations"
+
+    applicant_id: Mapped[int] = mapped_column(
+        ForeignKey("applicants.applicant_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    vacancy_id: Mapped[int] = mapped_column(
+        ForeignKey("vacancies.vacancy_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        # feed of applicant is read in order of this index
+        Index("ix_vacancy_recommendations_applicant_id_score", "applicant_id", text("score DESC")),
+    )
@@ -2,12 +2,16 @@ from __future__ import annotations
 from datetime import datetime, date
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, Date, Numeric, DateTime, func
+from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, Date, Numeric, DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from src.infrastructure.db.models.base import Base
 from src.infrastructure.enums_db import CurrencyEnumDB, EmploymentTypeEnumDB
 
 
+# expression of GiST index, salary filter of search must be written the same way
+SALARY_RANGE_BASE = "numrange(salary_min_base, salary_max_base, '[]')"
+
+
 class ResumeDB(Base):
     __tablename__ = "resumes"
 
@@ -18,8 +22,13 @@ class ResumeDB(Base):
     salary_min: Mapped[float] = mapped_column(Numeric(10, 2), nullable=True)
     salary_max: Mapped[float] = mapped_column(Numeric(10, 2), nullable=True)
     salary_currency: Mapped[CurrencyEnumDB] = mapped_column(CurrencyEnumDB, nullable=True)
+    # salary in BASE_CURRENCY of exchange_rates, min <= max, kept by DAO and recalculated when rates change
+    salary_min_base: Mapped[float] = mapped_column(Numeric(12, 2), nullable=True)
+    salary_max_base: Mapped[float] = mapped_column(Numeric(12, 2), nullable=True)
     is_published: Mapped[bool] = mapped_column(Boolean, default=True)
     location: Mapped[str] = mapped_column(String(150), nullable=True)
+    # sum of work_experiences in months, kept by WorkExperienceDAO and recalculated every night
+    total_experience_months: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=True,
@@ -46,6 +55,18 @@ class ResumeDB(Base):
         back_populates="resume"
     )
 
+    __table_args__ = (
+        # keyset pagination of search: (name_resume, resume_id) > cursor
+        Index("ix_resumes_name_resume_resume_id", "name_resume", "resume_id"),
+        Index("ix_resumes_total_experience_months", "total_experience_months"),
+        # substring ILIKE filters of search are served by pg_trgm
+        Index("ix_resumes_name_resume_trgm", "name_resume", postgresql_using="gin", postgresql_ops={"name_resume": "gin_trgm_ops"}),
+        Index("ix_resumes_location_trgm", "location", postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"}),
+        Index("ix_resumes_profession_trgm", "profession", postgresql_using="gin", postgresql_ops={"profession": "gin_trgm_ops"}),
+        # cross-currency salary filter: numrange(...) && numrange(requested in base currency)
+        Index("ix_resumes_salary_range_base", text(SALARY_RANGE_BASE), postgresql_using="gist"),
+    )
+
 
 class WorkExperienceDB(Base):
     __tablename__ = "work_experiences"
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Numeric, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.infrastructure.db.models.base import Base
+from src.infrastructure.enums_db import CurrencyEnumDB, EmploymentTypeEnumDB
+
+
+class SavedSearchDB(Base):
+    """
+    Vacancy search of applicant, new vacancies which match it are sent to applicant.
+    """
+    __tablename__ = "saved_searches"
+
+    saved_search_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    applicant_id: Mapped[int] = mapped_column(
+        ForeignKey("applicants.applicant_id", ondelete="CASCADE"),
+        nullable=False
+    )
+    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    profession: Mapped[str] = mapped_column(String(30), nullable=True)
+    location: Mapped[str] = mapped_column(String(100), nullable=True)
+    salary_min: Mapped[float] = mapped_column(Numeric(10, 2), nullable=True)
+    salary_max: Mapped[float] = mapped_column(Numeric(10, 2), nullable=True)
+    salary_currency: Mapped[CurrencyEnumDB] = mapped_column(CurrencyEnumDB, nullable=True)
+    type_of_employment: Mapped[list[EmploymentTypeEnumDB]] = mapped_column(
+        ARRAY(EmploymentTypeEnumDB),
+        nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=func.now())
+
+    __table_args__ = (
+        Index("ix_saved_searches_applicant_id", "applicant_id"),
+    )
+
+
+class SavedSearchTermDB(Base):
+    """
+    Reverse index of saved searches: one term per predicate (profession token, currency, employment type),
+    see utils/saved_search.py. New vacancy reads only searches whose every term it has.
+    """
+    __tablename__ = "saved_search_terms"
+
+    term: Mapped[str] = mapped_column(String(60), primary_key=True)
+    saved_search_id: Mapped[int] = mapped_column(
+        ForeignKey("saved_searches.saved_search_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    __table_args__ = (
+        # cascade delete of search
+        Index("ix_saved_search_terms_saved_search_id", "saved_search_id"),
+    )
@@ -0,0 +1,49 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, ForeignKey, Index
+
+from src.infrastructure.db.models.base import Base
+
+
+class SkillDB(Base):
+    """
+    Dictionary of normalized skills, filled from key_skills of resumes and vacancies on write.
+    """
+    __tablename__ = "skills"
+
+    skill_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+
+
+class ResumeSkillDB(Base):
+    __tablename__ = "resume_skills"
+
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.resume_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    skill_id: Mapped[int] = mapped_column(
+        ForeignKey("skills.skill_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    __table_args__ = (
+        # skill -> resumes, for "has skills" filter of search
+        Index("ix_resume_skills_skill_id_resume_id", "skill_id", "resume_id"),
+    )
+
+
+class VacancySkillDB(Base):
+    __tablename__ = "vacancy_skills"
+
+    vacancy_id: Mapped[int] = mapped_column(
+        ForeignKey("vacancies.vacancy_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    skill_id: Mapped[int] = mapped_column(
+        ForeignKey("skills.skill_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    __table_args__ = (
+        Index("ix_vacancy_skills_skill_id_vacancy_id", "skill_id", "vacancy_id"),
+    )
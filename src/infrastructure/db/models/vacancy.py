@@ -2,9 +2,23 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Text, Boolean, Integer, ForeignKey, Numeric, DateTime, func, UniqueConstraint
+from sqlalchemy import (
+    String,
+    Text,
+    Boolean,
+    Integer,
+    BigInteger,
+    ForeignKey,
+    Numeric,
+    DateTime,
+    func,
+    UniqueConstraint,
+    Index,
+    text
+)
 from sqlalchemy.dialects.postgresql import ARRAY
 from src.infrastructure.db.models.base import Base
+from src.infrastructure.db.models.resume import SALARY_RANGE_BASE
 from src.core.enums import Currency
 from src.infrastructure.enums_db import (
     VacancyDurationEnumDB,
@@ -26,6 +40,9 @@ class VacancyDB(Base):
     salary_min: Mapped[float] = mapped_column(Numeric(10, 2), nullable=True)
     salary_max: Mapped[float] = mapped_column(Numeric(10, 2), nullable=True)
     salary_currency: Mapped[CurrencyEnumDB] = mapped_column(CurrencyEnumDB, nullable=True)
+    # salary in BASE_CURRENCY of exchange_rates, min <= max, kept by DAO and recalculated when rates change
+    salary_min_base: Mapped[float] = mapped_column(Numeric(12, 2), nullable=True)
+    salary_max_base: Mapped[float] = mapped_column(Numeric(12, 2), nullable=True)
     experience_start: Mapped[int] = mapped_column(Integer, nullable=True)
     experience_end: Mapped[int] = mapped_column(Integer, nullable=True)
 
@@ -49,6 +66,8 @@ class VacancyDB(Base):
         onupdate=func.now()
     )
     is_published: Mapped[bool] = mapped_column(Boolean, default=True)
+    # order of feed: tier of vacancy type and time of last raise, see utils/rank.py
+    rank_score: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
     is_confirmed: Mapped[bool] = mapped_column(Boolean, default=False)
 
     company_id: Mapped[int] = mapped_column(
@@ -69,6 +88,26 @@ class VacancyDB(Base):
         back_populates="vacancy"
     )
 
+    __table_args__ = (
+        # feed order of search, partial so unpublished vacancies don't take place in index;
+        # activity lives in vacancy_access and is checked per row while the index is read
+        Index(
+            "ix_vacancies_published_rank_score",
+            text("rank_score DESC"),
+            text("vacancy_id DESC"),
+            postgresql_where=text("is_published"),
+        ),
+        # substring ILIKE filters of search are served by pg_trgm
+        Index("ix_vacancies_profession_trgm", "profession", postgresql_using="gin", postgresql_ops={"profession": "gin_trgm_ops"}),
+        Index("ix_vacancies_location_trgm", "location", postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"}),
+        Index("ix_vacancies_salary", "salary_currency", "salary_min", "salary_max"),
+        Index("ix_vacancies_salary_range_base", text(SALARY_RANGE_BASE), postgresql_using="gist"),
+        Index("ix_vacancies_experience", "experience_start", "experience_end"),
+        Index("ix_vacancies_type_of_employment", "type_of_employment", postgresql_using="gin"),
+        Index("ix_vacancies_type_work_schedule", "type_work_schedule", postgresql_using="gin"),
+        Index("ix_vacancies_company_id", "company_id"),
+    )
+
 
 class VacancyAccessDB(Base):
     __tablename__ = "vacancy_access"
@@ -83,6 +122,15 @@ class VacancyAccessDB(Base):
     end_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    __table_args__ = (
+        Index(
+            "ix_vacancy_access_active_end_date",
+            "vacancy_id",
+            "end_date",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
 
 class VacancyTypeDB(Base):
     __tablename__ = "vacancy_types"
@@ -0,0 +1,37 @@
+"""
+Connection pool of SQLAlchemy engine which counts its checkouts: how long requests wait for a connection,
+how often the pool goes beyond pool_size and how often it runs out of connections at all.
+"""
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    # counters are only changed from the event loop of the engine, engine.dispose() starts them from zero
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.overflow_checkouts = 0
+        self.checkout_timeouts = 0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+
+        except PoolTimeoutError:
+            self.checkout_timeouts += 1
+            raise
+
+        wait = time.perf_counter() - start
+        self.checkouts += 1
+        self.checkout_wait_total += wait
+        self.checkout_wait_max = max(self.checkout_wait_max, wait)
+        if self.checkedout() > self.size():
+            self.overflow_checkouts += 1
+
+        return connection
@@ -0,0 +1,21 @@
+from sqlalchemy import ScalarSelect, func, select
+
+from src.infrastructure.db.models import WorkExperienceDB, ResumeDB
+
+
+def total_experience_months() -> ScalarSelect:
+    """
+    Sum of months of all work experiences of resume, correlated with resumes of outer statement.
+    Job without end_date lasts until today, so the value grows by itself and is recalculated every night.
+    """
+    end_date = func.coalesce(WorkExperienceDB.end_date, func.current_date())
+    months_diff = (
+            (func.extract("year", end_date) - func.extract("year", WorkExperienceDB.start_date)) * 12 +
+            (func.extract("month", end_date) - func.extract("month", WorkExperienceDB.start_date))
+    )
+
+    return (
+        select(func.coalesce(func.sum(months_diff), 0))
+        .where(WorkExperienceDB.resume_id == ResumeDB.resume_id)
+        .scalar_subquery()
+    )
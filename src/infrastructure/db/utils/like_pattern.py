@@ -0,0 +1,14 @@
+LIKE_ESCAPE = "\\"
+
+
+def contains_pattern(value: str) -> str:
+    """
+    Make pattern for ILIKE '%value%' where %, _ and \\ entered by user are matched literally.
+    """
+    escaped = (
+        value
+        .replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+    return f"%{escaped}%"
@@ -0,0 +1,45 @@
+from sqlalchemy import Select, func, select
+
+from src.infrastructure.db.models import ResumeDB, ResumeSkillDB, VacancyDB, VacancySkillDB
+
+
+def resume_match_select() -> Select:
+    """
+    Columns of MatchResumeDTODAO, skills of resume are read by primary key of resume_skills.
+    """
+    skill_ids = func.array(
+        select(ResumeSkillDB.skill_id)
+        .where(ResumeSkillDB.resume_id == ResumeDB.resume_id)
+        .scalar_subquery()
+    )
+    return select(
+        ResumeDB.resume_id,
+        ResumeDB.applicant_id,
+        ResumeDB.profession,
+        ResumeDB.location,
+        ResumeDB.salary_min_base,
+        ResumeDB.salary_max_base,
+        ResumeDB.total_experience_months,
+        skill_ids.label("skill_ids"),
+    )
+
+
+def vacancy_match_select() -> Select:
+    """
+    Columns of MatchVacancyDTODAO, skills of vacancy are read by primary key of vacancy_skills.
+    """
+    skill_ids = func.array(
+        select(VacancySkillDB.skill_id)
+        .where(VacancySkillDB.vacancy_id == VacancyDB.vacancy_id)
+        .scalar_subquery()
+    )
+    return select(
+        VacancyDB.vacancy_id,
+        VacancyDB.profession,
+        VacancyDB.location,
+        VacancyDB.salary_min_base,
+        VacancyDB.salary_max_base,
+        VacancyDB.experience_start,
+        VacancyDB.experience_end,
+        skill_ids.label("skill_ids"),
+    )
@@ -0,0 +1,27 @@
+from sqlalchemy import BigInteger, ColumnElement, cast, func
+
+from src.infrastructure.db.models import VacancyDB
+
+
+# rank_score = tier * RANK_TIER_STEP + unix time of last raise, so feed is premium > paid > free
+# and recently raised first inside the tier; unix time stays less than the step for centuries
+RANK_TIER_STEP = 10_000_000_000
+VACANCY_TYPE_TIERS = {"free": 0, "paid": 1, "premium": 2}
+
+
+def _tier(vacancy_type_name: str | None) -> int:
+    return VACANCY_TYPE_TIERS.get(vacancy_type_name, 0)
+
+
+def raised_rank_score(vacancy_type_name: str | None) -> ColumnElement:
+    """
+    rank_score of vacancy which is created or raised in search right now.
+    """
+    return _tier(vacancy_type_name) * RANK_TIER_STEP + cast(func.extract("epoch", func.now()), BigInteger)
+
+
+def retiered_rank_score(vacancy_type_name: str | None) -> ColumnElement:
+    """
+    rank_score of vacancy after change of its type, time of last raise is kept.
+    """
+    return _tier(vacancy_type_name) * RANK_TIER_STEP + VacancyDB.rank_score % RANK_TIER_STEP
@@ -0,0 +1,55 @@
+from sqlalchemy import ColumnElement, Numeric, and_, case, func, literal, literal_column, or_, select
+
+from src.core.enums import Currency
+from src.infrastructure.db.models import ExchangeRateDB, ResumeDB, VacancyDB
+from src.infrastructure.db.models.exchange_rate import BASE_CURRENCY
+
+
+def _rate(currency) -> ColumnElement:
+    return select(ExchangeRateDB.rate).where(ExchangeRateDB.currency == currency).scalar_subquery()
+
+
+def salary_base_values(model: type[ResumeDB] | type[VacancyDB]) -> dict[str, ColumnElement]:
+    """
+    Values of salary_min_base/salary_max_base for UPDATE of resumes or vacancies, calculated from
+    the row itself. Swapped min and max are put in order, so numrange of the index never fails.
+    Without rate of salary_currency both are NULL.
+    """
+    swapped = model.salary_min > model.salary_max
+    lower = case((swapped, model.salary_max), else_=model.salary_min)
+    upper = case((swapped, model.salary_min), else_=model.salary_max)
+    rate = _rate(model.salary_currency)
+
+    return {
+        "salary_min_base": lower * rate,
+        "salary_max_base": upper * rate,
+    }
+
+
+def salary_range_filter(
+        model: type[ResumeDB] | type[VacancyDB],
+        salary_min: float | None,
+        salary_max: float | None,
+        salary_currency: Currency | None
+) -> ColumnElement:
+    """
+    Salary of the row overlaps with requested one in any currency, bounds of request are in
+    salary_currency or in BASE_CURRENCY. Served by GiST index on SALARY_RANGE_BASE.
+    Rows without salary or without rate of their currency don't match, nothing matches for unknown salary_currency.
+    """
+    if salary_min is not None and salary_max is not None and salary_min > salary_max:
+        salary_min, salary_max = salary_max, salary_min
+
+    rate = _rate(salary_currency or BASE_CURRENCY)
+    requested_min = literal(salary_min, Numeric) * rate if salary_min is not None else None
+    requested_max = literal(salary_max, Numeric) * rate if salary_max is not None else None
+
+    # '[]' must be a constant, otherwise expression doesn't match the index
+    row_range = func.numrange(model.salary_min_base, model.salary_max_base, literal_column("'[]'"))
+    requested_range = func.numrange(requested_min, requested_max, literal_column("'[]'"))
+
+    return and_(
+        row_range.op("&&")(requested_range),
+        or_(model.salary_min_base.is_not(None), model.salary_max_base.is_not(None)),
+        rate.is_not(None),
+    )
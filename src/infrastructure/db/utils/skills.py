@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Select, func, select
+
+from src.core.enums import SkillsMatch
+from src.infrastructure.db.models import SkillDB
+
+
+def skills_owners(owner_id: Column, skill_id: Column, names: list[str], skills_match: SkillsMatch) -> Select:
+    """
+    Ids of resumes or vacancies (owner_id of link table) which have any or all of normalized skill names.
+    Names are few and unique, so for ALL it is enough to count found links of the owner.
+    """
+    query = (
+        select(owner_id)
+        .join(SkillDB, SkillDB.skill_id == skill_id)
+        .where(SkillDB.name.in_(names))
+    )
+    if skills_match == SkillsMatch.ALL:
+        query = query.group_by(owner_id).having(func.count() == len(names))
+
+    return query
@@ -9,3 +9,13 @@ class DBConfig:
     db_name: str
     driver: str
     port: int
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
+    # asyncpg prepared statements per connection, 0 behind pgbouncer in transaction mode
+    statement_cache_size: int = 100
+    # statement_timeout of Postgres for connections of the app, 0 is no timeout
+    statement_timeout_ms: int = 0
+    echo: bool = False
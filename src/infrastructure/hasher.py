@@ -1,14 +1,44 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
+from src.dto.services.metrics.metrics import HasherStatsDTO
 from src.interfaces.infrastructure.hasher import IHasher
 
 
 class Hasher(IHasher):
-    def __init__(self):
+    """
+    bcrypt takes hundreds of milliseconds of CPU, so it runs in a bounded thread pool instead of the event loop.
+    bcrypt releases GIL, up to max_workers hashes are calculated in parallel, the others wait in the queue.
+    """
+
+    def __init__(self, max_workers: int = 4):
         self.hasher = CryptContext(schemes=['bcrypt'], deprecated="auto")
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hasher")
+        # calls which wait for result, running in the pool or queued
+        self._pending = 0
+
+    async def hash(self, row: str) -> str:
+        return await self._run(self.hasher.hash, row)
+
+    async def verify(self, row: str, hashed_row) -> bool:
+        return await self._run(self.hasher.verify, row, hashed_row)
+
+    async def _run(self, func: Callable, *args) -> Any:
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+        finally:
+            self._pending -= 1
 
-    def hash(self, row: str) -> str:
-        return self.hasher.hash(row)
+    def close(self) -> None:
+        # hashes already started are finished, the threads of the pool are joined
+        self._executor.shutdown(wait=True, cancel_futures=True)
 
-    def verify(self, row: str, hashed_row) -> bool:
-        return self.hasher.verify(row, hashed_row)
+    def stats(self) -> HasherStatsDTO:
+        running = min(self._pending, self._max_workers)
+        return HasherStatsDTO(max_workers=self._max_workers, running=running, queued=self._pending - running)
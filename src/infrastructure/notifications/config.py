@@ -8,3 +8,13 @@ class NotificationConfig:
     smtp_user: str
     smtp_password: str
     mail_from: str
+    smtp_use_ssl: bool = True
+    smtp_timeout: int = 30
+    smtp_pool_size: int = 2
+    smtp_max_idle_seconds: int = 60
+    smtp_batch_size: int = 100
+    outbox_batch_size: int = 100
+    outbox_max_attempts: int = 10
+    outbox_retry_base_seconds: int = 5
+    outbox_retry_max_seconds: int = 3600
+    digest_window_seconds: int = 300
@@ -1,11 +1,10 @@
-import smtplib
-
 from email.message import EmailMessage
 from typing import Any
 
 from loguru import logger
 
 from src.core.config_reader import config
+from src.infrastructure.notifications.smtp_pool import get_smtp_pool
 from src.interfaces.infrastructure.notifications import AbstractNotifications
 
 
@@ -27,25 +26,38 @@ class EmailNotifications(AbstractNotifications):
 
         elif template == "send_message_about_change_status":
             from src.infrastructure.celery.tasks import send_message_about_change_status
-            send_message_about_change_status(destination, subject, body)
+            send_message_about_change_status.delay(destination, subject, body)
+
+    def send_many(self, template: str, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Messages of any template are queued as batches, every batch is sent over one SMTP connection.
+        """
+        from src.infrastructure.celery.tasks import send_emails
+
+        emails = [(destination, data.get("subject"), data.get("body")) for destination, data in messages]
+        batch_size = config.mail.smtp_batch_size
+        for start in range(0, len(emails), batch_size):
+            send_emails.delay(emails[start:start + batch_size])
 
     def send_(self, destination: str, subject: str, body: str):
-        self.msg = EmailMessage()
-        self.msg["From"] = config.mail.smtp_user
-        self.msg["Subject"] = subject
-        self.msg["To"] = destination
-        self.msg.set_content(body)
-
-        logger.bind(
-            app_name=f"{EmailNotifications.__name__} in {self.send.__name__}"
-        ).info(f"DATA: TO_EMAIL {destination} | SUBJECT {subject} | BODY {body}")
-
-        try:
-            with smtplib.SMTP_SSL(config.mail.smtp_server, config.mail.smtp_port) as smtp:
-                smtp.login(config.mail.smtp_user, config.mail.smtp_password)
-                smtp.send_message(self.msg)
-
-        except smtplib.SMTPException as exc:
+        self.send_batch([(destination, subject, body)])
+
+    def send_batch(self, emails: list[tuple[str, str, str]]) -> int:
+        """
+        Sends (destination, subject, body) over pooled connection of the worker process.
+        Errors of connection and login are raised as SMTPBatchInterrupted, the task retries the unsent rest.
+        """
+        messages = []
+        for destination, subject, body in emails:
+            self.msg = EmailMessage()
+            self.msg["From"] = config.mail.smtp_user
+            self.msg["Subject"] = subject
+            self.msg["To"] = destination
+            self.msg.set_content(body)
+            messages.append(self.msg)
+
             logger.bind(
-                app_name=f"{EmailNotifications.__name__} in {self.send.__name__}"
-            ).info(f"EXCEPTION {exc}")
+                app_name=f"{EmailNotifications.__name__} in {self.send_batch.__name__}"
+            ).info(f"DATA: TO_EMAIL {destination} | SUBJECT {subject} | BODY {body}")
+
+        return get_smtp_pool(config.mail).send_messages(messages)
@@ -0,0 +1,32 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.db.models import NotificationOutboxDB
+from src.interfaces.infrastructure.notifications import AbstractNotifications
+
+
+class OutboxNotifications(AbstractNotifications):
+    """
+    Notifications are added to the session of transaction manager and written by its commit together with
+    the domain change, so send must be called before commit. Rolled back change sends nothing.
+    Emails are put in the queue by relay worker, see relay_notification_outbox task.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def send(self, destination: str, template: str, data: dict[str, Any]) -> None:
+        self._session.add(self._outbox_row(destination, template, data))
+
+    def send_many(self, template: str, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        self._session.add_all([self._outbox_row(destination, template, data) for destination, data in messages])
+
+    @staticmethod
+    def _outbox_row(destination: str, template: str, data: dict[str, Any]) -> NotificationOutboxDB:
+        return NotificationOutboxDB(
+            destination=destination,
+            template=template,
+            subject=data.get("subject"),
+            body=data.get("body")
+        )
@@ -0,0 +1,153 @@
+"""
+Logged in SMTP connections of a worker process, reused by email tasks instead of TLS handshake and
+login for every message. Celery worker forks processes, so the pool is created lazily in each of them.
+"""
+import os
+import queue
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+from loguru import logger
+
+from src.infrastructure.notifications.config import NotificationConfig
+
+
+# errors after which the connection is useless, the message is sent again over a new one
+CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError)
+
+
+class SMTPBatchInterrupted(smtplib.SMTPException):
+    """
+    Batch stopped by an error of connection or login, the first `sent` messages are already delivered.
+    """
+
+    def __init__(self, sent: int, total: int):
+        super().__init__(f"sent {sent} of {total} messages")
+        self.sent = sent
+        self.total = total
+
+
+class SMTPPool:
+    def __init__(self, config: NotificationConfig):
+        self._config = config
+        # the last returned connection is taken first, the others are closed by the server when idle
+        self._idle: queue.LifoQueue[tuple[smtplib.SMTP, float]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(config.smtp_pool_size)
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp_class = smtplib.SMTP_SSL if self._config.smtp_use_ssl else smtplib.SMTP
+        smtp = smtp_class(self._config.smtp_server, self._config.smtp_port, timeout=self._config.smtp_timeout)
+        try:
+            if self._config.smtp_user:
+                smtp.login(self._config.smtp_user, self._config.smtp_password)
+
+        except BaseException:
+            self._close(smtp)
+            raise
+
+        return smtp
+
+    @staticmethod
+    def _close(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    def _take(self) -> smtplib.SMTP:
+        while True:
+            try:
+                smtp, returned_at = self._idle.get_nowait()
+
+            except queue.Empty:
+                return self._connect()
+
+            if time.monotonic() - returned_at < self._config.smtp_max_idle_seconds:
+                return smtp
+            self._close(smtp)
+
+    def send_messages(self, messages: list[EmailMessage]) -> int:
+        """
+        All messages go over one connection. Failed connection is replaced once per message, then
+        SMTPBatchInterrupted is raised from the error with count of messages sent before it.
+        Messages refused by the server are logged and skipped. Returns count of sent messages.
+        """
+        sent = 0
+        with self._slots:
+            smtp = None
+            try:
+                smtp = self._take()
+                for message in messages:
+                    try:
+                        smtp = self._send(smtp, message)
+                        sent += 1
+
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as exc:
+                        logger.bind(
+                            app_name=f"{SMTPPool.__name__} in {self.send_messages.__name__}"
+                        ).error(f"TO_EMAIL {message['To']} REFUSED\nMESSAGE: {exc}")
+
+            except Exception as exc:
+                if smtp is not None:
+                    self._close(smtp)
+                raise SMTPBatchInterrupted(sent, len(messages)) from exc
+
+            except BaseException:
+                if smtp is not None:
+                    self._close(smtp)
+                raise
+
+            self._idle.put((smtp, time.monotonic()))
+
+        return sent
+
+    def _send(self, smtp: smtplib.SMTP, message: EmailMessage) -> smtplib.SMTP:
+        try:
+            smtp.send_message(message)
+            return smtp
+
+        except CONNECTION_ERRORS as exc:
+            logger.bind(
+                app_name=f"{SMTPPool.__name__} in {self._send.__name__}"
+            ).warning(f"RECONNECT AFTER {exc!r}")
+            self._close(smtp)
+
+        smtp = self._connect()
+        smtp.send_message(message)
+        return smtp
+
+    def close(self) -> None:
+        while True:
+            try:
+                smtp, _ = self._idle.get_nowait()
+
+            except queue.Empty:
+                return
+            self._close(smtp)
+
+
+_pool: SMTPPool | None = None
+_pool_pid: int | None = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool(config: NotificationConfig) -> SMTPPool:
+    """
+    Pool of the current process, connections of parent process are not shared with forked children.
+    """
+    global _pool, _pool_pid
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool, _pool_pid = SMTPPool(config), os.getpid()
+
+        return _pool
+
+
+def close_smtp_pool() -> None:
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
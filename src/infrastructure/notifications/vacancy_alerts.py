@@ -0,0 +1,11 @@
+from src.interfaces.infrastructure.vacancy_alerts import IVacancyAlerts
+
+
+class CeleryVacancyAlerts(IVacancyAlerts):
+    """
+    Matching is made by worker, request which created vacancy only puts a task in the queue.
+    """
+
+    def new_vacancy(self, vacancy_id: int) -> None:
+        from src.infrastructure.celery.tasks import match_saved_searches
+        match_saved_searches.delay(vacancy_id)
@@ -6,3 +6,8 @@ class RedisConfig:
     host: str
     port: int
     db: int
+    search_cache_ttl: int = 30
+    shortlist_cache_ttl: int = 600
+    # connections of the process, over it callers wait for a free one up to pool_timeout seconds
+    max_connections: int = 50
+    pool_timeout: int = 5
@@ -0,0 +1,58 @@
+import json
+import time
+from typing import Any
+
+from redis.asyncio import Redis
+
+from src.interfaces.infrastructure.notification_digest import INotificationDigest
+
+
+class NotificationDigest(INotificationDigest):
+    """
+    Data of notifications is appended to a list per template and destination, the window starts with
+    the first of them: its end is the score of the list in DUE_KEY, later notifications don't move it.
+    """
+    DUE_KEY = "digest:due"
+
+    def __init__(self, redis: Redis, window: int = 300):
+        self._redis = redis
+        self._window = window
+
+    async def add(self, template: str, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        due = time.time() + self._window
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for destination, data in messages:
+                member = self._member(template, destination)
+                pipe.rpush(self._items_key(member), json.dumps(data))
+                pipe.zadd(self.DUE_KEY, {member: due}, nx=True)
+            await pipe.execute()
+
+    async def pop_due(self, limit: int) -> list[tuple[str, str, list[dict[str, Any]]]]:
+        members = await self._redis.zrangebyscore(self.DUE_KEY, "-inf", time.time(), start=0, num=limit)
+
+        digests = []
+        for member in members:
+            # list is taken atomically, notification added after it starts a new window
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.lrange(self._items_key(member), 0, -1)
+                pipe.delete(self._items_key(member))
+                pipe.zrem(self.DUE_KEY, member)
+                items, _, _ = await pipe.execute()
+
+            # empty if another worker took it first
+            if items:
+                template, destination = json.loads(member)
+                digests.append((template, destination, [json.loads(item) for item in items]))
+
+        return digests
+
+    @staticmethod
+    def _member(template: str, destination: str) -> str:
+        return json.dumps([template, destination])
+
+    @staticmethod
+    def _items_key(member: str | bytes) -> str:
+        if isinstance(member, bytes):
+            member = member.decode()
+        return f"digest:items:{member}"
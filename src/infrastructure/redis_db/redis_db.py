@@ -17,3 +17,9 @@ class RedisDB(IRedisDB):
 
     async def exists(self, key: str) -> bool:
         return bool(await self._redis.exists(key))
+
+    async def incr(self, key: str) -> int:
+        return await self._redis.incr(key)
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
@@ -0,0 +1,140 @@
+import enum
+import hashlib
+import json
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, TypeVar
+
+from loguru import logger
+from pydantic import TypeAdapter
+from redis.exceptions import RedisError
+
+from src.dto.base_dto import BaseDTO
+from src.interfaces.infrastructure.redis_db import IRedisDB
+from src.interfaces.infrastructure.search_cache import ISearchCache
+
+
+T = TypeVar("T")
+
+# opaque values, they are compared as they are
+CASE_SENSITIVE_FIELDS = {"cursor"}
+
+
+def _normalize_value(field: str, value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, str):
+        return value if field in CASE_SENSITIVE_FIELDS else value.strip().lower()
+    if isinstance(value, (list, tuple, set)):
+        return sorted(str(_normalize_value(field, item)) for item in value)
+    return value
+
+
+def normalize_search(search_dto: BaseDTO) -> dict[str, Any]:
+    """
+    Make the same dict for searches which give the same result:
+    None is dropped, strings are lowercased (filters are case-insensitive), lists are sorted.
+    """
+    return {
+        field: _normalize_value(field, value)
+        for field, value in sorted(asdict(search_dto).items())
+        if value is not None
+    }
+
+
+def search_hash(search_dto: BaseDTO) -> str:
+    canonical = json.dumps(normalize_search(search_dto), separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@lru_cache
+def _adapter(result_type: Any) -> TypeAdapter:
+    return TypeAdapter(result_type)
+
+
+class SearchCache(ISearchCache):
+    """
+    Result of search is kept under key with generation of its scope ("resumes", "companies"),
+    so after change of data the generation is incremented and all old keys are never read again,
+    they are removed by TTL. If Redis is not available search goes to the database.
+    Result is stored as JSON and built again as `result_type` (DTOs, enums and dates included) on read.
+    """
+
+    def __init__(self, redis_db: IRedisDB, ttl: int = 30):
+        self._redis_db = redis_db
+        self._ttl = ttl
+
+    async def get_or_load(
+            self,
+            scope: str,
+            search_dto: BaseDTO,
+            loader: Callable[[], Awaitable[T]],
+            result_type: Any,
+            kind: str = "page"
+    ) -> T:
+        adapter = _adapter(result_type)
+        try:
+            generation = int(await self._redis_db.get(self._generation_key(scope)) or 0)
+            key = f"search:{scope}:{generation}:{kind}:{search_hash(search_dto)}"
+            cached = await self._redis_db.get(key)
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{SearchCache.__name__} in {self.get_or_load.__name__}"
+            ).error(f"SCOPE {scope} MESSAGE: {exc}")
+            return await loader()
+
+        if cached is not None:
+            await self._count(scope, "hits")
+            return adapter.validate_json(cached)
+
+        await self._count(scope, "misses")
+        result = await loader()
+
+        try:
+            await self._redis_db.set(key, adapter.dump_json(result), expire=self._ttl)
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{SearchCache.__name__} in {self.get_or_load.__name__}"
+            ).error(f"SCOPE {scope} MESSAGE: {exc}")
+
+        return result
+
+    async def invalidate(self, scope: str) -> None:
+        try:
+            await self._redis_db.incr(self._generation_key(scope))
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{SearchCache.__name__} in {self.invalidate.__name__}"
+            ).error(f"SCOPE {scope} MESSAGE: {exc}")
+
+    async def get_stats(self, scope: str) -> dict[str, Any]:
+        try:
+            hits = int(await self._redis_db.get(self._counter_key(scope, "hits")) or 0)
+            misses = int(await self._redis_db.get(self._counter_key(scope, "misses")) or 0)
+            generation = int(await self._redis_db.get(self._generation_key(scope)) or 0)
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{SearchCache.__name__} in {self.get_stats.__name__}"
+            ).error(f"SCOPE {scope} MESSAGE: {exc}")
+            hits, misses, generation = 0, 0, 0
+
+        return {"scope": scope, "hits": hits, "misses": misses, "generation": generation}
+
+    async def _count(self, scope: str, counter: str) -> None:
+        try:
+            await self._redis_db.incr(self._counter_key(scope, counter))
+
+        except RedisError:
+            pass
+
+    @staticmethod
+    def _generation_key(scope: str) -> str:
+        return f"search:{scope}:generation"
+
+    @staticmethod
+    def _counter_key(scope: str, counter: str) -> str:
+        return f"search:{scope}:{counter}"
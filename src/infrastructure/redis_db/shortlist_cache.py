@@ -0,0 +1,54 @@
+import json
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from src.interfaces.infrastructure.redis_db import IRedisDB
+from src.interfaces.infrastructure.shortlist_cache import IShortlistCache
+
+
+class ShortlistCache(IShortlistCache):
+    """
+    Ranking of the whole candidate pool is kept, so every page of shortlist is a slice of it.
+    If Redis is not available shortlist is scored again.
+    """
+
+    def __init__(self, redis_db: IRedisDB, ttl: int = 600):
+        self._redis_db = redis_db
+        self._ttl = ttl
+
+    async def get(self, vacancy_id: int) -> list[tuple[int, float]] | None:
+        try:
+            cached = await self._redis_db.get(self._key(vacancy_id))
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{ShortlistCache.__name__} in {self.get.__name__}"
+            ).error(f"VACANCY {vacancy_id} MESSAGE: {exc}")
+            return None
+
+        if cached is None:
+            return None
+        return [(resume_id, score) for resume_id, score in json.loads(cached)]
+
+    async def set(self, vacancy_id: int, ranking: list[tuple[int, float]]) -> None:
+        try:
+            await self._redis_db.set(self._key(vacancy_id), json.dumps(ranking), expire=self._ttl)
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{ShortlistCache.__name__} in {self.set.__name__}"
+            ).error(f"VACANCY {vacancy_id} MESSAGE: {exc}")
+
+    async def invalidate(self, vacancy_id: int) -> None:
+        try:
+            await self._redis_db.delete(self._key(vacancy_id))
+
+        except RedisError as exc:
+            logger.bind(
+                app_name=f"{ShortlistCache.__name__} in {self.invalidate.__name__}"
+            ).error(f"VACANCY {vacancy_id} MESSAGE: {exc}")
+
+    @staticmethod
+    def _key(vacancy_id: int) -> str:
+        return f"shortlist:vacancy:{vacancy_id}"
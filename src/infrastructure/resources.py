@@ -0,0 +1,66 @@
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.core.config import Config
+from src.dto.services.metrics.metrics import PoolStatsDTO
+from src.infrastructure.connections import create_db_engine, get_redis_connections
+from src.infrastructure.db.pool import MeteredQueuePool
+from src.infrastructure.hasher import Hasher
+from src.interfaces.infrastructure.resources import IResources
+
+
+class AppResources(IResources):
+    """
+    Engine, Redis pool and hasher thread pool of web app: created once with the app, used by every request
+    through providers and closed by lifespan on shutdown. The pools connect and start threads lazily,
+    so creating them does no I/O.
+    """
+
+    def __init__(self, config: Config):
+        self.engine: AsyncEngine = create_db_engine(config.db)
+        self.session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+        self.redis: Redis = get_redis_connections(config.redis)
+        self.hasher: Hasher = Hasher(max_workers=config.auth.hash_workers)
+
+    def _db_pool_stats(self) -> PoolStatsDTO:
+        db_pool = self.engine.pool
+        stats = PoolStatsDTO(
+            name="db",
+            size=db_pool.size(),
+            in_use=db_pool.checkedout(),
+            idle=db_pool.checkedin(),
+            overflow=max(db_pool.overflow(), 0),
+        )
+        if isinstance(db_pool, MeteredQueuePool):
+            stats.checkouts = db_pool.checkouts
+            stats.checkout_wait_avg_ms = db_pool.checkout_wait_total / max(db_pool.checkouts, 1) * 1000
+            stats.checkout_wait_max_ms = db_pool.checkout_wait_max * 1000
+            stats.overflow_checkouts = db_pool.overflow_checkouts
+            stats.checkout_timeouts = db_pool.checkout_timeouts
+        return stats
+
+    def pool_stats(self) -> list[PoolStatsDTO]:
+        # redis-py has no public counters of the pool
+        redis_pool = self.redis.connection_pool
+        redis_in_use = len(redis_pool._in_use_connections)
+        redis_idle = len(redis_pool._available_connections)
+
+        return [
+            self._db_pool_stats(),
+            PoolStatsDTO(
+                name="redis",
+                size=redis_pool.max_connections,
+                in_use=redis_in_use,
+                idle=redis_idle,
+            ),
+        ]
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+        await self.redis.connection_pool.disconnect()
+        await self.engine.dispose()
+        self.hasher.close()
@@ -0,0 +1,12 @@
+from src.dto.db.notification_outbox.notification_outbox import OutboxNotificationDTODAO
+
+
+class INotificationOutboxDAO:
+    async def get_pending_notifications(self, limit: int, max_attempts: int) -> list[OutboxNotificationDTODAO]:
+        raise NotImplementedError
+
+    async def mark_sent(self, outbox_ids: list[int]) -> None:
+        raise NotImplementedError
+
+    async def mark_failed(self, outbox_ids: list[int], retry_base_seconds: int, retry_max_seconds: int) -> None:
+        raise NotImplementedError
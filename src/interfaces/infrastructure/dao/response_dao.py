@@ -7,3 +7,10 @@ class IResponsesDAO:
 
     async def change_status_respond(self, respond: BaseResponseDTODAO) -> BaseResponseDTODAO:
         raise NotImplementedError
+
+    async def change_status_responds(
+            self,
+            respond: BaseResponseDTODAO,
+            response_ids: list[int]
+    ) -> list[BaseResponseDTODAO]:
+        raise NotImplementedError
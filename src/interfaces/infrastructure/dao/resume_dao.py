@@ -1,4 +1,5 @@
-from src.dto.db.resume.resume import BaseResumeDTODAO
+from src.dto.db.recommendation.recommendation import MatchResumeDTODAO, MatchVacancyDTODAO
+from src.dto.db.resume.resume import BaseResumeDTODAO, ResumeFacetsDTODAO
 
 
 class IResumeDAO:
@@ -16,3 +17,15 @@ class IResumeDAO:
 
     async def search_resumes(self, search_dto) -> list[BaseResumeDTODAO]:
         raise NotImplementedError
+
+    async def recalculate_total_experience_months(self) -> int:
+        raise NotImplementedError
+
+    async def get_resume_facets(self, search_dto) -> ResumeFacetsDTODAO:
+        raise NotImplementedError
+
+    async def get_resumes_by_ids(self, resume_ids: list[int]) -> list[BaseResumeDTODAO]:
+        raise NotImplementedError
+
+    async def get_match_candidates(self, vacancy: MatchVacancyDTODAO, pool_size: int) -> list[MatchResumeDTODAO]:
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+from src.dto.db.saved_search.saved_search import SavedSearchDTODAO, AlertVacancyDTODAO
+
+
+class ISavedSearchDAO:
+    async def create_saved_search(self, saved_search: SavedSearchDTODAO) -> SavedSearchDTODAO:
+        raise NotImplementedError
+
+    async def get_saved_searches(self, applicant_id: int) -> list[SavedSearchDTODAO]:
+        raise NotImplementedError
+
+    async def delete_saved_search(self, saved_search_id: int, applicant_id: int) -> None:
+        raise NotImplementedError
+
+    async def get_alert_vacancy(self, vacancy_id: int) -> AlertVacancyDTODAO | None:
+        raise NotImplementedError
+
+    async def get_candidate_searches(self, vacancy: AlertVacancyDTODAO) -> list[SavedSearchDTODAO]:
+        raise NotImplementedError
@@ -1,10 +1,16 @@
-from src.dto.db.user.user import BaseUserDTODAO
+from src.dto.db.user.user import BaseUserDTODAO, AuthUserDTODAO
 
 
 class IUserDAO:
     async def get_user_by_email(self, email: str) -> BaseUserDTODAO:
         raise NotImplementedError
 
+    async def get_auth_user_by_email(self, email: str) -> AuthUserDTODAO:
+        raise NotImplementedError
+
+    async def get_auth_user_by_id(self, user_id: int) -> AuthUserDTODAO | None:
+        raise NotImplementedError
+
     async def update_user(self, user: BaseUserDTODAO) -> None:
         raise NotImplementedError
 
@@ -1,4 +1,5 @@
-from src.dto.db.vacancy.vacancy import BaseVacancyDTODAO
+from src.dto.db.recommendation.recommendation import MatchVacancyDTODAO
+from src.dto.db.vacancy.vacancy import BaseVacancyDTODAO, SearchDTODAO, RecommendedVacancyDTODAO
 
 
 class IVacancyDAO:
@@ -11,6 +12,9 @@ class IVacancyDAO:
     async def get_vacancy_by_id(self, vacancy_id: int) -> BaseVacancyDTODAO:
         raise NotImplementedError
 
+    async def search_vacancies(self, search_dto: SearchDTODAO) -> list[BaseVacancyDTODAO]:
+        raise NotImplementedError
+
     async def delete_vacancy(self, vacancy_id: int, company_id: int) -> None:
         raise NotImplementedError
 
@@ -28,3 +32,9 @@ class IVacancyDAO:
 
     async def get_all_liked_vacancy(self, applicant_id: int) -> list[BaseVacancyDTODAO]:
         ...
+
+    async def get_vacancy_for_matching(self, vacancy_id: int, company_id: int) -> MatchVacancyDTODAO:
+        raise NotImplementedError
+
+    async def get_recommended_vacancies(self, applicant_id: int, limit: int) -> list[RecommendedVacancyDTODAO]:
+        raise NotImplementedError
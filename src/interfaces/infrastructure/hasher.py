@@ -1,9 +1,14 @@
 from typing import Protocol
 
+from src.dto.services.metrics.metrics import HasherStatsDTO
+
 
 class IHasher(Protocol):
-    def hash(self, row: str) -> str:
+    async def hash(self, row: str) -> str:
+        raise NotImplementedError
+
+    async def verify(self, row: str, hashed_row) -> bool:
         raise NotImplementedError
 
-    def verify(self, row: str, hashed_row) -> bool:
+    def stats(self) -> HasherStatsDTO:
         raise NotImplementedError
@@ -0,0 +1,19 @@
+import abc
+from typing import Any
+
+
+class INotificationDigest(abc.ABC):
+    """
+    Notifications of one template to one destination, collected during a window and sent as one email.
+    """
+
+    @abc.abstractmethod
+    async def add(self, template: str, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def pop_due(self, limit: int) -> list[tuple[str, str, list[dict[str, Any]]]]:
+        """
+        Removes and returns (template, destination, data of notifications) which window is over.
+        """
+        raise NotImplementedError
@@ -6,3 +6,10 @@ class AbstractNotifications(abc.ABC):
     @abc.abstractmethod
     def send(self, destination: str, template: str, data: dict[str, Any]) -> None:
         raise NotImplementedError
+
+    def send_many(self, template: str, messages: list[tuple[str, dict[str, Any]]]) -> None:
+        """
+        messages are pairs (destination, data), implementations may queue them as one task.
+        """
+        for destination, data in messages:
+            self.send(destination, template, data)
@@ -0,0 +1,21 @@
+import abc
+
+from src.dto.db.user.user import AuthUserDTODAO
+
+
+class IPrincipalCache(abc.ABC):
+    """
+    Principals of users by user_id, kept in the process for a short time.
+    """
+
+    @abc.abstractmethod
+    def get(self, user_id: int) -> AuthUserDTODAO | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, principal: AuthUserDTODAO) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, user_id: int) -> None:
+        raise NotImplementedError
@@ -16,3 +16,11 @@ class IRedisDB(abc.ABC):
     @abc.abstractmethod
     async def exists(self, key: str) -> bool:
         raise NotImplementedError
+
+    @abc.abstractmethod
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+import abc
+
+from src.dto.services.metrics.metrics import PoolStatsDTO
+
+
+class IResources(abc.ABC):
+    """
+    Connections shared by all requests of the process.
+    """
+
+    @abc.abstractmethod
+    def pool_stats(self) -> list[PoolStatsDTO]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,32 @@
+import abc
+from typing import Any, Awaitable, Callable, TypeVar
+
+from src.dto.base_dto import BaseDTO
+
+
+T = TypeVar("T")
+
+RESUMES_SEARCH = "resumes"
+COMPANIES_SEARCH = "companies"
+SEARCH_SCOPES = (RESUMES_SEARCH, COMPANIES_SEARCH)
+
+
+class ISearchCache(abc.ABC):
+    @abc.abstractmethod
+    async def get_or_load(
+            self,
+            scope: str,
+            search_dto: BaseDTO,
+            loader: Callable[[], Awaitable[T]],
+            result_type: Any,
+            kind: str = "page"
+    ) -> T:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def invalidate(self, scope: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def get_stats(self, scope: str) -> dict[str, Any]:
+        raise NotImplementedError
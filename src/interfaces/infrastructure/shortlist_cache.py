@@ -0,0 +1,19 @@
+import abc
+
+
+class IShortlistCache(abc.ABC):
+    """
+    Ranked candidate pool of vacancy: list of (resume_id, score), best first.
+    """
+
+    @abc.abstractmethod
+    async def get(self, vacancy_id: int) -> list[tuple[int, float]] | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, vacancy_id: int, ranking: list[tuple[int, float]]) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def invalidate(self, vacancy_id: int) -> None:
+        raise NotImplementedError
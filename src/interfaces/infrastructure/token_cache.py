@@ -0,0 +1,15 @@
+import abc
+
+
+class IVerifiedTokenCache(abc.ABC):
+    """
+    Claims of tokens which signature is already verified, until exp of token.
+    """
+
+    @abc.abstractmethod
+    def get(self, token: str) -> dict | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, token: str, claims: dict) -> None:
+        raise NotImplementedError
@@ -0,0 +1,11 @@
+import abc
+
+
+class IVacancyAlerts(abc.ABC):
+    """
+    Sends new vacancy to applicants whose saved searches it matches.
+    """
+
+    @abc.abstractmethod
+    def new_vacancy(self, vacancy_id: int) -> None:
+        raise NotImplementedError
@@ -6,6 +6,9 @@ class IJWTAuth(abc.ABC):
     async def set_tokens(self, user: dict) -> None:
         ...
 
+    async def set_access_token(self, user: dict) -> None:
+        ...
+
     @abc.abstractmethod
     async def set_token(self, token: str, token_type: str) -> None:
         ...
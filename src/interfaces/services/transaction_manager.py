@@ -4,6 +4,7 @@ from src.interfaces.infrastructure.dao.applicant_dao import IApplicantDAO
 from src.interfaces.infrastructure.dao.company_dao import ICompanyDAO
 from src.interfaces.infrastructure.dao.repond_on_vacancy_dao import IRespondOnVacancyDAO
 from src.interfaces.infrastructure.dao.resume_dao import IResumeDAO
+from src.interfaces.infrastructure.dao.saved_search_dao import ISavedSearchDAO
 from src.interfaces.infrastructure.dao.user_dao import IUserDAO
 from src.interfaces.infrastructure.dao.vacancy_dao import IVacancyDAO
 from src.interfaces.infrastructure.dao.workexperience_dao import IWorkExperienceDAO
@@ -17,6 +18,7 @@ class IBaseTransactionManager(Protocol):
     work_experience_dao: IWorkExperienceDAO
     vacancy_dao: IVacancyDAO
     respond_dao: IRespondOnVacancyDAO
+    saved_search_dao: ISavedSearchDAO
 
     async def commit(self):
         raise NotImplementedError
@@ -6,6 +6,7 @@ from loguru import logger
 
 from src.core.config_reader import config
 from src.dto.db.applicant.applicant import BaseApplicantDTODAO
+from src.dto.db.saved_search.saved_search import SavedSearchDTODAO
 from src.dto.db.user.user import BaseUserDTODAO
 from src.dto.services.applicant.applicant import (
     CreateApplicantDTO,
@@ -13,7 +14,10 @@ from src.dto.services.applicant.applicant import (
     UpdateApplicantDTO,
     ApplicantDTO
 )
+from src.dto.services.applicant.saved_search import CreateSavedSearchDTO, SavedSearchDTO
+from src.dto.services.company.company import BaseCompanyDTO
 from src.dto.services.user.user import UserOutDTO, BaseUserDTO
+from src.dto.services.vacancy.vacancy import BaseVacancyDTO, RecommendedVacancyDTO
 from src.exceptions.infrascructure.user.user import UserAlreadyExist
 from src.core.enums import TypeUser
 from src.interfaces.infrastructure.hasher import IHasher
@@ -37,7 +41,7 @@ class CreateApplicant(ApplicantUseCase):
             notifications: AbstractNotifications,
             redis_db: IRedisDB
     ) -> ApplicantOutDTO:
-        hashed_password = self._hasher.hash(applicant_dto.user.password)
+        hashed_password = await self._hasher.hash(applicant_dto.user.password)
         applicant = BaseApplicantDTODAO(
             user=BaseUserDTODAO(
                 email=applicant_dto.user.email,
@@ -56,7 +60,6 @@ class CreateApplicant(ApplicantUseCase):
 
         try:
             applicant_created = await self._tm.applicant_dao.create_applicant(applicant)
-            await self._tm.commit()
 
         except UserAlreadyExist:
             logger.bind(
@@ -88,6 +91,8 @@ class CreateApplicant(ApplicantUseCase):
                 "body": f"Перейдите по ссылке для подтверждения: {confirm_link}"
             }
         )
+        # email is written to the outbox by the same commit
+        await self._tm.commit()
 
         return ApplicantOutDTO(
             user=UserOutDTO(
@@ -143,6 +148,72 @@ class GetApplicantByID(ApplicantUseCase):
         )
 
 
+class GetRecommendedVacancies(ApplicantUseCase):
+    async def __call__(self, applicant_id: int, limit: int) -> list[RecommendedVacancyDTO]:
+        recommendations = await self._tm.vacancy_dao.get_recommended_vacancies(applicant_id, limit)
+
+        return [
+            RecommendedVacancyDTO(
+                vacancy=BaseVacancyDTO(
+                    company=BaseCompanyDTO(
+                        user=BaseUserDTO(
+                            user_id=item.vacancy.company.user.user_id
+                        ),
+                        company_name=item.vacancy.company.company_name,
+                        address=item.vacancy.company.address
+                    ),
+                    vacancy_id=item.vacancy.vacancy_id,
+                    title=item.vacancy.title,
+                    profession=item.vacancy.profession,
+                    location=item.vacancy.location,
+                    salary_min=item.vacancy.salary_min,
+                    salary_max=item.vacancy.salary_max,
+                    salary_currency=item.vacancy.salary_currency,
+                    experience_start=item.vacancy.experience_start,
+                    experience_end=item.vacancy.experience_end
+                ),
+                score=item.score
+            )
+            for item in recommendations
+        ]
+
+
+class CreateSavedSearch(ApplicantUseCase):
+    async def __call__(self, saved_search_dto: CreateSavedSearchDTO) -> SavedSearchDTO:
+        saved_search = await self._tm.saved_search_dao.create_saved_search(
+            SavedSearchDTODAO(**saved_search_dto.__dict__)
+        )
+        await self._tm.commit()
+
+        return _saved_search_dto(saved_search)
+
+
+class GetSavedSearches(ApplicantUseCase):
+    async def __call__(self, applicant_id: int) -> list[SavedSearchDTO]:
+        saved_searches = await self._tm.saved_search_dao.get_saved_searches(applicant_id)
+        return [_saved_search_dto(saved_search) for saved_search in saved_searches]
+
+
+class DeleteSavedSearch(ApplicantUseCase):
+    async def __call__(self, saved_search_id: int, applicant_id: int) -> None:
+        await self._tm.saved_search_dao.delete_saved_search(saved_search_id, applicant_id)
+        await self._tm.commit()
+
+
+def _saved_search_dto(saved_search: SavedSearchDTODAO) -> SavedSearchDTO:
+    return SavedSearchDTO(
+        saved_search_id=saved_search.saved_search_id,
+        name=saved_search.name,
+        profession=saved_search.profession,
+        location=saved_search.location,
+        salary_min=saved_search.salary_min,
+        salary_max=saved_search.salary_max,
+        salary_currency=saved_search.salary_currency,
+        type_of_employment=saved_search.type_of_employment,
+        created_at=saved_search.created_at
+    )
+
+
 class ApplicantService:
     def __init__(
             self,
@@ -166,3 +237,18 @@ class ApplicantService:
 
     async def get_applicant(self, applicant_id: int) -> ApplicantDTO:
         return await GetApplicantByID(tm=self._tm, hasher=self._hasher)(applicant_id)
+
+    async def get_recommended_vacancies(self, applicant_id: int, limit: int) -> list[RecommendedVacancyDTO]:
+        return await GetRecommendedVacancies(tm=self._tm, hasher=self._hasher)(applicant_id, limit)
+
+    async def create_saved_search(self, saved_search_dto: CreateSavedSearchDTO) -> SavedSearchDTO:
+        """
+        Save search of vacancies, applicant gets an email when a new vacancy matches it
+        """
+        return await CreateSavedSearch(tm=self._tm, hasher=self._hasher)(saved_search_dto)
+
+    async def get_saved_searches(self, applicant_id: int) -> list[SavedSearchDTO]:
+        return await GetSavedSearches(tm=self._tm, hasher=self._hasher)(applicant_id)
+
+    async def delete_saved_search(self, saved_search_id: int, applicant_id: int) -> None:
+        await DeleteSavedSearch(tm=self._tm, hasher=self._hasher)(saved_search_id, applicant_id)
@@ -23,13 +23,19 @@ from src.core.enums import TypeUser
 from src.interfaces.infrastructure.hasher import IHasher
 from src.interfaces.infrastructure.notifications import AbstractNotifications
 from src.interfaces.infrastructure.redis_db import IRedisDB
+from src.interfaces.infrastructure.search_cache import ISearchCache, COMPANIES_SEARCH
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 
 
 class CompanyUseCase(ABC):
-    def __init__(self, tm: IBaseTransactionManager, hasher: IHasher):
+    def __init__(self, tm: IBaseTransactionManager, hasher: IHasher, search_cache: ISearchCache | None = None):
         self._tm = tm
         self._hasher = hasher
+        self._search_cache = search_cache
+
+    async def _invalidate_search(self) -> None:
+        if self._search_cache is not None:
+            await self._search_cache.invalidate(COMPANIES_SEARCH)
 
 
 class CreateCompany(CompanyUseCase):
@@ -39,7 +45,7 @@ class CreateCompany(CompanyUseCase):
             notifications: AbstractNotifications,
             redis_db: IRedisDB
     ) -> CompanyOutDTO:
-        hashed_password = self._hasher.hash(company_dto.user.password)
+        hashed_password = await self._hasher.hash(company_dto.user.password)
         company = BaseCompanyDTODAO(
             user=BaseUserDTODAO(
                 email=company_dto.user.email,
@@ -56,7 +62,6 @@ class CreateCompany(CompanyUseCase):
 
         try:
             company_created = await self._tm.company_dao.create_company(company)
-            await self._tm.commit()
 
         except UserAlreadyExist:
             logger.bind(
@@ -87,6 +92,9 @@ class CreateCompany(CompanyUseCase):
                 "body": f"Перейдите по ссылке для подтверждения: {confirm_link}"
             }
         )
+        # email is written to the outbox by the same commit
+        await self._tm.commit()
+        await self._invalidate_search()
 
         return CompanyOutDTO(
             user=UserOutDTO(
@@ -113,6 +121,7 @@ class UpdateCompany(CompanyUseCase):
         try:
             await self._tm.company_dao.update_company(company)
             await self._tm.commit()
+            await self._invalidate_search()
 
         except UserAlreadyExist:
             logger.bind(
@@ -141,7 +150,13 @@ class GetCompanyByID(CompanyUseCase):
 class SearchCompanies(CompanyUseCase):
     async def __call__(self, search_company_dto: SearchDTO) -> list[CompanyDataDTO]:
         search_dto = SearchDTODAO(**search_company_dto.__dict__)
-        companies = await self._tm.company_dao.search_company(search_dto)
+        if self._search_cache is None:
+            companies = await self._tm.company_dao.search_company(search_dto)
+        else:
+            companies = await self._search_cache.get_or_load(
+                COMPANIES_SEARCH, search_dto, lambda: self._tm.company_dao.search_company(search_dto),
+                list[BaseCompanyDTODAO]
+            )
 
         return [
             CompanyDataDTO(
@@ -160,23 +175,25 @@ class CompanyService:
             tm: IBaseTransactionManager,
             hasher: IHasher,
             notifications: AbstractNotifications,
-            redis_db: IRedisDB
+            redis_db: IRedisDB,
+            search_cache: ISearchCache | None = None
     ):
         self._tm = tm
         self._hasher = hasher
         self._notifications = notifications
         self._redis_db = redis_db
+        self._search_cache = search_cache
 
     async def create_company(self, company_dto: CreateCompanyDTO) -> CompanyOutDTO:
-        return await CreateCompany(tm=self._tm, hasher=self._hasher)(
+        return await CreateCompany(tm=self._tm, hasher=self._hasher, search_cache=self._search_cache)(
             company_dto, self._notifications, self._redis_db
         )
 
     async def update_company(self, company_dto: UpdateCompanyDTO) -> None:
-        return await UpdateCompany(tm=self._tm, hasher=self._hasher)(company_dto)
+        return await UpdateCompany(tm=self._tm, hasher=self._hasher, search_cache=self._search_cache)(company_dto)
 
     async def get_company(self, company_id: int) -> CompanyDTO:
-        return await GetCompanyByID(tm=self._tm, hasher=self._hasher)(company_id)
+        return await GetCompanyByID(tm=self._tm, hasher=self._hasher, search_cache=self._search_cache)(company_id)
 
     async def search_companies(self, search_company_dto: SearchDTO) -> list[CompanyDataDTO]:
-        return await SearchCompanies(tm=self._tm, hasher=self._hasher)(search_company_dto)
+        return await SearchCompanies(tm=self._tm, hasher=self._hasher, search_cache=self._search_cache)(search_company_dto)
@@ -0,0 +1,28 @@
+from src.dto.services.metrics.metrics import SearchCacheStatsDTO, PoolStatsDTO, HasherStatsDTO
+from src.interfaces.infrastructure.hasher import IHasher
+from src.interfaces.infrastructure.resources import IResources
+from src.interfaces.infrastructure.search_cache import ISearchCache, SEARCH_SCOPES
+
+
+class MetricsService:
+    def __init__(
+            self,
+            search_cache: ISearchCache,
+            resources: IResources | None = None,
+            hasher: IHasher | None = None
+    ):
+        self._search_cache = search_cache
+        self._resources = resources
+        self._hasher = hasher
+
+    async def get_search_cache_stats(self) -> list[SearchCacheStatsDTO]:
+        return [
+            SearchCacheStatsDTO(**await self._search_cache.get_stats(scope))
+            for scope in SEARCH_SCOPES
+        ]
+
+    async def get_pool_stats(self) -> list[PoolStatsDTO]:
+        return self._resources.pool_stats() if self._resources is not None else []
+
+    async def get_hasher_stats(self) -> HasherStatsDTO | None:
+        return self._hasher.stats() if self._hasher is not None else None
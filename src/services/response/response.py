@@ -10,13 +10,52 @@ from src.dto.db.resume.resume import BaseResumeDTODAO
 from src.dto.db.vacancy.vacancy import BaseVacancyDTODAO
 from src.dto.services.response.response import (
     CreateResponseDTO,
-    ChangeStatusResponseDTO
+    ChangeStatusResponseDTO,
+    ChangeStatusResponsesDTO
 )
 from src.exceptions.infrascructure.response.response import BaseResponseException
 from src.interfaces.infrastructure.notifications import AbstractNotifications
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 
 
+def change_status_notification(res: BaseResponseDTODAO, message: str | None) -> tuple[str, dict]:
+    """
+    Destination and data of email to the other side of response which status was changed.
+    """
+    if res.responder_type == ActorType.APPLICANT:
+        destination = res.vacancy.company.user.email
+        body = (
+            "Вам пришёл отклик от кандидата.\n"
+            if message is None else
+            "Вам пришёл отклик от кандидата.\n"
+            f"«{message}»\n"
+        )
+        body += f"Ссылка на чат"  # тут мб сделать ссылку на чат
+        data_notification = {
+            "subject": f"С Вами хотят связаться",
+            "body": body
+        }
+
+    elif res.responder_type == ActorType.COMPANY:
+        destination = res.resume.applicant.user.email
+        body = (
+            "Вам пришло сообщение от компании.\n"
+            if message is None else
+            "Вам пришло сообщение от компании.\n"
+            f"«{message}»\n"
+        )
+        body += f"Ссылка на чат"  # тут мб сделать ссылку на чат
+        data_notification = {
+            "subject": f"С Вами хотят связаться",
+            "body": body
+        }
+    else:
+        destination = ""
+        data_notification = {}
+
+    return destination, data_notification
+
+
 class RespondOnVacancyUseCase(ABC):
     def __init__(self, tm: IBaseTransactionManager):
         self._tm = tm
@@ -45,7 +84,6 @@ class CreateResponseByApplicant(RespondOnVacancyUseCase):
 
         try:
             respond_out = await self._tm.respond_dao.create_respond(respond)
-            await self._tm.commit()
 
         except BaseResponseException as exc:
             logger.bind(
@@ -76,6 +114,8 @@ class CreateResponseByApplicant(RespondOnVacancyUseCase):
             template="send_respond_notification",
             data=data_notification
         )
+        # emails are written to the outbox by the same commit
+        await self._tm.commit()
 
 
 class CreateResponseByCompany(RespondOnVacancyUseCase):
@@ -101,7 +141,6 @@ class CreateResponseByCompany(RespondOnVacancyUseCase):
 
         try:
             respond_out = await self._tm.respond_dao.create_respond(respond)
-            await self._tm.commit()
 
         except BaseResponseException as exc:
             logger.bind(
@@ -131,10 +170,12 @@ class CreateResponseByCompany(RespondOnVacancyUseCase):
         ).info(f"DATA {data_notification}")
 
         notifications.send(
-            destination=respond_out.vacancy.company.user.email,
+            destination=respond_out.resume.applicant.user.email,
             template="send_respond_notification",
             data=data_notification
         )
+        # emails are written to the outbox by the same commit
+        await self._tm.commit()
 
 
 class ChangeStatusResponse(RespondOnVacancyUseCase):
@@ -158,7 +199,6 @@ class ChangeStatusResponse(RespondOnVacancyUseCase):
         )
         try:
             res = await self._tm.respond_dao.change_status_respond(respond)
-            await self._tm.commit()
 
         except BaseResponseException as exc:
             logger.bind(
@@ -171,42 +211,57 @@ class ChangeStatusResponse(RespondOnVacancyUseCase):
             app_name=f"{ChangeStatusResponse.__name__}"
         ).info(f"Send email to {res}")
 
-        if res.responder_type == ActorType.APPLICANT:
-            destination = res.resume.applicant.user.email
-            body = (
-                "Вам пришёл отклик от кандидата.\n"
-                if respond_dto.message is None else
-                "Вам пришёл отклик от кандидата.\n"
-                f"«{respond_dto.message}»\n"
-            )
-            body += f"Ссылка на чат"  # тут мб сделать ссылку на чат
-            data_notification = {
-                "subject": f"С Вами хотят связаться",
-                "body": body
-            }
-
-        elif res.responder_type == ActorType.COMPANY:  # ???? тут что-то вот не так, почему-то данные пустые ????
-            destination = res.vacancy.company.user.email
-            body = (
-                "Вам пришло сообщение от компании.\n"
-                if respond_dto.message is None else
-                "Вам пришло сообщение от компании.\n"
-                f"«{respond_dto.message}»\n"
-            )
-            body += f"Ссылка на чат"  # тут мб сделать ссылку на чат
-            data_notification = {
-                "subject": f"С Вами хотят связаться",
-                "body": body
-            }
-        else:
-            destination = ""
-            data_notification = {}
-
+        destination, data_notification = change_status_notification(res, respond_dto.message)
         notifications.send(
             destination=destination,
             template="send_message_about_change_status",
             data=data_notification
         )
+        # emails are written to the outbox by the same commit
+        await self._tm.commit()
+
+        return respond_dto.status
+
+
+class ChangeStatusResponses(RespondOnVacancyUseCase):
+    async def __call__(
+            self,
+            respond_dto: ChangeStatusResponsesDTO,
+            notifications: AbstractNotifications
+    ) -> StatusRespond:
+        respond = BaseResponseDTODAO(
+            user_id=respond_dto.user_id,
+            vacancy=BaseVacancyDTODAO(
+                company=None
+            ),
+            resume=BaseResumeDTODAO(
+                applicant=None,
+            ),
+            responder_type=respond_dto.responder_type,
+            status=respond_dto.status,
+            message=respond_dto.message
+        )
+        try:
+            res = await self._tm.respond_dao.change_status_responds(respond, respond_dto.response_ids)
+
+        except BaseResponseException as exc:
+            logger.bind(
+                app_name=f"{ChangeStatusResponses.__name__}"
+            ).error(f"WITH DATA {respond_dto}")
+            await self._tm.rollback()
+            raise exc
+
+        logger.bind(
+            app_name=f"{ChangeStatusResponses.__name__}"
+        ).info(f"Send {len(res)} emails")
+
+        # relay puts emails of one template in one task
+        notifications.send_many(
+            template="send_message_about_change_status",
+            messages=[change_status_notification(response, respond_dto.message) for response in res]
+        )
+        # emails are written to the outbox by the same commit
+        await self._tm.commit()
 
         return respond_dto.status
 
@@ -228,3 +283,6 @@ class ResponseService:
 
     async def change_status_response(self, respond_dto: ChangeStatusResponseDTO) -> StatusRespond:
         return await ChangeStatusResponse(self._tm)(respond_dto, self._notifications)
+
+    async def change_status_responses(self, respond_dto: ChangeStatusResponsesDTO) -> StatusRespond:
+        return await ChangeStatusResponses(self._tm)(respond_dto, self._notifications)
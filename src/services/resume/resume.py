@@ -1,9 +1,11 @@
 from abc import ABC
+from dataclasses import replace
+from typing import Any, Awaitable, Callable, TypeVar
 
 from loguru import logger
 
 from src.dto.db.applicant.applicant import BaseApplicantDTODAO
-from src.dto.db.resume.resume import BaseResumeDTODAO, SearchDTODAO
+from src.dto.db.resume.resume import BaseResumeDTODAO, ResumeFacetsDTODAO, SearchDTODAO
 from src.dto.db.user.user import BaseUserDTODAO
 from src.dto.services.applicant.applicant import ApplicantDTO
 from src.dto.services.resume.resume import (
@@ -12,17 +14,82 @@ from src.dto.services.resume.resume import (
     UpdateResumeDTO,
     ResumeDTO,
     SearchResumeDTO,
-    ResumeSearchOutDTO
+    ResumeSearchOutDTO,
+    ResumeSearchResultDTO,
+    ResumeFacetsDTO
 )
 from src.dto.services.user.user import BaseUserDTO
 from src.dto.services.work_exprerience.work_experience import WorkExperienceDTO
 from src.exceptions.infrascructure.resume.resume import ResumeException
+from src.interfaces.infrastructure.search_cache import ISearchCache, RESUMES_SEARCH
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 
 
+T = TypeVar("T")
+
+
+def resume_search_out_dto(r: BaseResumeDTODAO) -> ResumeSearchOutDTO:
+    """
+    Resume of search page with applicant and work experiences, also used by shortlist of vacancy.
+    """
+    return ResumeSearchOutDTO(
+        resume_id=r.resume_id,
+        name_resume=r.name_resume,
+        profession=r.profession,
+        key_skills=r.key_skills,
+        salary_min=r.salary_min,
+        salary_max=r.salary_max,
+        salary_currency=r.salary_currency,
+        location=r.location,
+        type_of_employment=r.type_of_employment,
+        total_months=r.total_months,
+        applicant=ApplicantDTO(
+            applicant_id=r.applicant.user.user_id,
+            address=r.applicant.address,
+            level_education=r.applicant.level_education,
+            date_born=r.applicant.date_born,
+            gender=r.applicant.gender,
+            user=BaseUserDTO(
+                email=r.applicant.user.email,
+                first_name=r.applicant.user.first_name,
+                last_name=r.applicant.user.last_name,
+                phone_number=r.applicant.user.phone_number,
+                image_url=r.applicant.user.image_url
+            )
+        ),
+        work_experiences=[
+            WorkExperienceDTO(
+                resume_id=w.resume_id,
+                work_experience_id=w.work_experience_id,
+                company_name=w.company_name,
+                start_date=w.start_date,
+                end_date=w.end_date,
+                description_work=w.description_work
+            )
+            for w in r.work_experiences
+        ]
+    )
+
+
 class ResumeUseCase(ABC):
-    def __init__(self, tm: IBaseTransactionManager):
+    def __init__(self, tm: IBaseTransactionManager, search_cache: ISearchCache | None = None):
         self._tm = tm
+        self._search_cache = search_cache
+
+    async def _invalidate_search(self) -> None:
+        if self._search_cache is not None:
+            await self._search_cache.invalidate(RESUMES_SEARCH)
+
+    async def _cached_search(
+            self,
+            search_dto: SearchDTODAO,
+            loader: Callable[[], Awaitable[T]],
+            result_type: Any,
+            kind: str
+    ) -> T:
+        if self._search_cache is None:
+            return await loader()
+        return await self._search_cache.get_or_load(RESUMES_SEARCH, search_dto, loader, result_type, kind)
 
 
 class CreateResume(ResumeUseCase):
@@ -45,6 +112,7 @@ class CreateResume(ResumeUseCase):
         try:
             resume_created = await self._tm.resume_dao.create_resume(resume)
             await self._tm.commit()
+            await self._invalidate_search()
 
         except ResumeException:
             logger.bind(
@@ -90,6 +158,7 @@ class UpdateResume(ResumeUseCase):
         try:
             await self._tm.resume_dao.update_resume(resume)
             await self._tm.commit()
+            await self._invalidate_search()
 
         except ResumeException:
             logger.bind(
@@ -142,80 +211,59 @@ class GetResumeByID(ResumeUseCase):
 
 
 class SearchResumes(ResumeUseCase):
-    async def __call__(self, search_dto: SearchResumeDTO) -> list[ResumeSearchOutDTO]:
+    async def __call__(self, search_dto: SearchResumeDTO, facets: bool = False) -> ResumeSearchResultDTO:
         search_dto_dao = SearchDTODAO(**search_dto.__dict__)
-        resumes = await self._tm.resume_dao.search_resumes(search_dto_dao)
-        dtos: list[ResumeSearchOutDTO] = []
-
-        for r in resumes:
-            applicant_dto = ApplicantDTO(
-                applicant_id=r.applicant.user.user_id,
-                address=r.applicant.address,
-                level_education=r.applicant.level_education,
-                date_born=r.applicant.date_born,
-                gender=r.applicant.gender,
-                user=BaseUserDTO(
-                    email=r.applicant.user.email,
-                    first_name=r.applicant.user.first_name,
-                    last_name=r.applicant.user.last_name,
-                    phone_number=r.applicant.user.phone_number,
-                    image_url=r.applicant.user.image_url
-                )
-            )
+        resumes = await self._cached_search(
+            search_dto_dao, lambda: self._tm.resume_dao.search_resumes(search_dto_dao),
+            list[BaseResumeDTODAO], kind="page"
+        )
+        dtos = [resume_search_out_dto(r) for r in resumes]
 
-            work_exps = [
-                WorkExperienceDTO(
-                    resume_id=w.resume_id,
-                    work_experience_id=w.work_experience_id,
-                    company_name=w.company_name,
-                    start_date=w.start_date,
-                    end_date=w.end_date,
-                    description_work=w.description_work
-                )
-                for w in r.work_experiences
-            ]
+        if not facets:
+            return ResumeSearchResultDTO(resumes=dtos)
 
-            dtos.append(
-                ResumeSearchOutDTO(
-                    resume_id=r.resume_id,
-                    name_resume=r.name_resume,
-                    profession=r.profession,
-                    key_skills=r.key_skills,
-                    salary_min=r.salary_min,
-                    salary_max=r.salary_max,
-                    salary_currency=r.salary_currency,
-                    location=r.location,
-                    type_of_employment=r.type_of_employment,
-                    total_months=r.total_months,
-                    applicant=applicant_dto,
-                    work_experiences=work_exps
-                )
-            )
+        # same session, so counts are made in the same transaction with the page;
+        # counts don't depend on the page, so all pages of the search share one cached entry
+        facets_dto_dao = replace(search_dto_dao, offset=None, limit=None, cursor=None)
+        resume_facets = await self._cached_search(
+            facets_dto_dao, lambda: self._tm.resume_dao.get_resume_facets(facets_dto_dao),
+            ResumeFacetsDTODAO, kind="facets"
+        )
 
-        return dtos
+        return ResumeSearchResultDTO(
+            resumes=dtos,
+            facets=ResumeFacetsDTO(
+                type_of_employment=resume_facets.type_of_employment,
+                salary_currency=resume_facets.salary_currency,
+                gender=resume_facets.gender,
+                experience=resume_facets.experience
+            )
+        )
 
 
 class DeleteResume(ResumeUseCase):
     async def __call__(self, resume_id: int, applicant_id: int) -> None:
         await self._tm.resume_dao.delete_resume(resume_id, applicant_id)
         await self._tm.commit()
+        await self._invalidate_search()
 
 
 class ResumeService:
-    def __init__(self, tm: IBaseTransactionManager):
+    def __init__(self, tm: IBaseTransactionManager, search_cache: ISearchCache | None = None):
         self._tm = tm
+        self._search_cache = search_cache
 
     async def create_resume(self, resume_dto: CreateResumeDTO) -> ResumeOutDTO:
-        return await CreateResume(self._tm)(resume_dto)
+        return await CreateResume(self._tm, self._search_cache)(resume_dto)
 
     async def update_resume(self, resume_dto: UpdateResumeDTO) -> None:
-        await UpdateResume(self._tm)(resume_dto)
+        await UpdateResume(self._tm, self._search_cache)(resume_dto)
 
     async def get_resume_by_id(self, resume_id: int) -> ResumeDTO:
-        return await GetResumeByID(self._tm)(resume_id)
+        return await GetResumeByID(self._tm, self._search_cache)(resume_id)
 
-    async def search_resumes(self, search_dto: SearchResumeDTO) -> list[ResumeSearchOutDTO]:
-        return await SearchResumes(self._tm)(search_dto)
+    async def search_resumes(self, search_dto: SearchResumeDTO, facets: bool = False) -> ResumeSearchResultDTO:
+        return await SearchResumes(self._tm, self._search_cache)(search_dto, facets)
 
     async def delete_resume(self, resume_id: int, applicant_id: int) -> None:
-        await DeleteResume(self._tm)(resume_id, applicant_id)
+        await DeleteResume(self._tm, self._search_cache)(resume_id, applicant_id)
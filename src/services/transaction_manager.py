@@ -6,6 +6,7 @@ from src.interfaces.infrastructure.dao.applicant_dao import IApplicantDAO
 from src.interfaces.infrastructure.dao.company_dao import ICompanyDAO
 from src.interfaces.infrastructure.dao.repond_on_vacancy_dao import IRespondOnVacancyDAO
 from src.interfaces.infrastructure.dao.resume_dao import IResumeDAO
+from src.interfaces.infrastructure.dao.saved_search_dao import ISavedSearchDAO
 from src.interfaces.infrastructure.dao.user_dao import IUserDAO
 from src.interfaces.infrastructure.dao.vacancy_dao import IVacancyDAO
 from src.interfaces.infrastructure.dao.workexperience_dao import IWorkExperienceDAO
@@ -34,7 +35,8 @@ class TransactionManager(BaseTransactionManager):
             resume_dao: Type[IResumeDAO],
             work_experience: Type[IWorkExperienceDAO],
             vacancy_dao: Type[IVacancyDAO],
-            respond_dao: Type[IRespondOnVacancyDAO]
+            respond_dao: Type[IRespondOnVacancyDAO],
+            saved_search_dao: Type[ISavedSearchDAO]
     ):
         super().__init__(session=session)
         self.user_dao = user_dao(session=session)  # type: ignore
@@ -44,3 +46,4 @@ class TransactionManager(BaseTransactionManager):
         self.work_experience_dao = work_experience(session=session)  # type: ignore
         self.vacancy_dao = vacancy_dao(session=session)  # type: ignore
         self.respond_dao = respond_dao(session=session)  # type: ignore
+        self.saved_search_dao = saved_search_dao(session=session)  # type: ignore
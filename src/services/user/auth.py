@@ -4,16 +4,29 @@ from abc import ABC
 from loguru import logger
 
 from src.core.config_reader import config
-from src.dto.db.user.user import BaseUserDTODAO
+from src.dto.db.user.user import BaseUserDTODAO, AuthUserDTODAO
 from src.dto.services.user.auth import AuthUserDTO, AuthUserOutDTO
 from src.exceptions.infrascructure.user.user import UserNotFoundByEmail, BaseUserException
-from src.exceptions.services.auth import InvalidEmail, InvalidPassword
+from src.exceptions.services.auth import InvalidEmail, InvalidPassword, RefreshTokenNotValid
 from src.interfaces.infrastructure.hasher import IHasher
+from src.interfaces.infrastructure.principal_cache import IPrincipalCache
 from src.interfaces.infrastructure.redis_db import IRedisDB
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 from src.interfaces.services.auth import IJWTAuth
 
 
+def principal_data(user: AuthUserDTODAO) -> dict:
+    return {
+        "user_id": user.user_id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "is_admin": user.is_admin,
+        "is_superuser": user.is_superuser,
+        "type": user.type
+    }
+
+
 class AuthUseCase(ABC):
     def __init__(self, tm: IBaseTransactionManager, hasher: IHasher):
         self._tm = tm
@@ -23,7 +36,7 @@ class AuthUseCase(ABC):
 class AuthenticateUser(AuthUseCase):
     async def __call__(self, auth_dto: AuthUserDTO, auth: IJWTAuth) -> AuthUserOutDTO:
         try:
-            user = await self._tm.user_dao.get_user_by_email(auth_dto.email)
+            user = await self._tm.user_dao.get_auth_user_by_email(auth_dto.email)
 
         except UserNotFoundByEmail:
             logger.bind(
@@ -31,23 +44,13 @@ class AuthenticateUser(AuthUseCase):
             ).error(f"USER NOT FOUND WITH: {auth_dto.email}")
             raise InvalidEmail(auth_dto.email)
 
-        if not self._hasher.verify(auth_dto.password, user.password):
+        if not await self._hasher.verify(auth_dto.password, user.password):
             logger.bind(
                 app_name=f"{AuthenticateUser.__name__}"
             ).error(f"INCORRECT PASSWORD ON USER: {auth_dto.email}")
             raise InvalidPassword()
 
-        data_dct = {
-            "user_id": user.user_id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "is_admin": user.is_admin,
-            "is_superuser": user.is_superuser,
-            "type": user.type
-        }
-
-        await auth.set_tokens(data_dct)
+        await auth.set_tokens(principal_data(user))
 
         return AuthUserOutDTO(
             user_id=user.user_id,
@@ -59,6 +62,32 @@ class AuthenticateUser(AuthUseCase):
         )
 
 
+class RefreshAccessToken(AuthUseCase):
+    """
+    Access token is issued with the current principal of user, not with the copy in refresh token:
+    flags taken away from user stop working after the next refresh.
+    """
+
+    async def __call__(self, auth: IJWTAuth, principal_cache: IPrincipalCache) -> None:
+        token_data = await auth.read_token(config.auth.refresh_token_name)
+        if token_data is None:
+            raise RefreshTokenNotValid()
+
+        user_id = token_data["user_id"]
+        user = principal_cache.get(user_id)
+        if user is None:
+            user = await self._tm.user_dao.get_auth_user_by_id(user_id)
+            if user is None:
+                logger.bind(
+                    app_name=f"{RefreshAccessToken.__name__}"
+                ).error(f"USER NOT FOUND WITH ID: {user_id}")
+                raise RefreshTokenNotValid()
+
+            principal_cache.set(user)
+
+        await auth.set_access_token(principal_data(user))
+
+
 class VerifyUser(AuthUseCase):
     async def __call__(self, token: str, redis_db: IRedisDB) -> bool:
         redis_key = config.auth.user_confirm_key.format(token=token)
@@ -82,13 +111,23 @@ class VerifyUser(AuthUseCase):
 
 
 class AuthService:
-    def __init__(self, tm: IBaseTransactionManager, hasher: IHasher, redis_db: IRedisDB):
+    def __init__(
+            self,
+            tm: IBaseTransactionManager,
+            hasher: IHasher,
+            redis_db: IRedisDB,
+            principal_cache: IPrincipalCache
+    ):
         self._tm = tm
         self._hasher = hasher
         self._redis_db = redis_db
+        self._principal_cache = principal_cache
 
     async def authenticate_user(self, auth_dto: AuthUserDTO, auth: IJWTAuth) -> AuthUserOutDTO:
         return await AuthenticateUser(self._tm, self._hasher)(auth_dto, auth)
 
+    async def refresh_access_token(self, auth: IJWTAuth) -> None:
+        return await RefreshAccessToken(self._tm, self._hasher)(auth, self._principal_cache)
+
     async def verify_user(self, token: str) -> bool:
         return await VerifyUser(self._tm, self._hasher)(token, self._redis_db)
@@ -3,10 +3,12 @@ from abc import ABC
 from loguru import logger
 
 from src.exceptions.infrascructure.user.user import UserNotFoundByEmail
+from src.dto.db.user.user import BaseUserDTODAO
 from src.dto.services.user.user import UserDTO, UpdateUserDTO
 from src.exceptions.infrascructure.user.user import UserAlreadyExist
 from src.exceptions.services.auth import InvalidEmail
 from src.interfaces.infrastructure.hasher import IHasher
+from src.interfaces.infrastructure.principal_cache import IPrincipalCache
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 
 
@@ -39,11 +41,11 @@ class GetUserByEmail(UserUseCase):
 
 
 class UpdateUser(UserUseCase):
-    async def __call__(self, user_dto: UpdateUserDTO) -> None:
+    async def __call__(self, user_dto: UpdateUserDTO, principal_cache: IPrincipalCache) -> None:
         if user_dto.password is not None:
-            hashed_password = self._hasher.hash(user_dto.password)
+            hashed_password = await self._hasher.hash(user_dto.password)
             user_dto.password = hashed_password
-        user = UpdateUserDTODAO(**user_dto.__dict__)
+        user = BaseUserDTODAO(**user_dto.__dict__)
 
         try:
             await self._tm.user_dao.update_user(user)
@@ -57,14 +59,18 @@ class UpdateUser(UserUseCase):
 
             raise UserAlreadyExist(user_dto.email)
 
+        # the next refresh of access token reads new name of user
+        principal_cache.invalidate(user_dto.user_id)
+
 
 class UserService:
-    def __init__(self, tm: IBaseTransactionManager, hasher: IHasher):
+    def __init__(self, tm: IBaseTransactionManager, hasher: IHasher, principal_cache: IPrincipalCache):
         self._tm = tm
         self._hasher = hasher
+        self._principal_cache = principal_cache
 
     async def get_user_by_email(self, email: str) -> UserDTO:
         return await GetUserByEmail(self._tm, self._hasher)(email)
 
     async def update_user(self, user_data: UpdateUserDTO) -> None:
-        await UpdateUser(self._tm, self._hasher)(user_data)
+        await UpdateUser(self._tm, self._hasher)(user_data, self._principal_cache)
@@ -1,5 +1,6 @@
 from abc import ABC
 
+import numpy as np
 from loguru import logger
 
 from src.dto.db.company.company import BaseCompanyDTODAO
@@ -7,7 +8,8 @@ from src.dto.db.user.user import BaseUserDTODAO
 from src.dto.db.vacancy.vacancy import (
     BaseVacancyDTODAO,
     BaseVacancyTypeDTODAO,
-    BaseVacancyTypePriceDTODAO
+    BaseVacancyTypePriceDTODAO,
+    SearchDTODAO
 )
 from src.dto.services.company.company import BaseCompanyDTO
 from src.dto.services.user.user import BaseUserDTO
@@ -15,7 +17,9 @@ from src.dto.services.vacancy.vacancy import (
     CreateVacancyDTO,
     VacancyOutDTO,
     UpdateVacancyDTO,
-    BaseVacancyDTO
+    BaseVacancyDTO,
+    SearchVacancyDTO,
+    ShortlistResumeDTO
 )
 from src.dto.services.vacancy.vacancy_access import BaseVacancyAccessDTO
 from src.dto.services.vacancy.vacancy_type import BaseVacancyTypeDTO
@@ -24,15 +28,32 @@ from src.exceptions.infrascructure.vacancy.vacancy import (
     VacancyNotFoundByID,
     NotUpdatedTimeVacancy
 )
+from src.interfaces.infrastructure.shortlist_cache import IShortlistCache
+from src.interfaces.infrastructure.vacancy_alerts import IVacancyAlerts
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
+from src.services.resume.resume import resume_search_out_dto
+from src.utils.matching import SHORTLIST_WEIGHTS, Vocabulary, resume_features, score_matrix, vacancy_features
+
+
+# resumes scored for shortlist of one vacancy, pages are slices of this pool
+SHORTLIST_POOL_SIZE = 500
 
 
 class VacancyUseCase(ABC):
-    def __init__(self, tm: IBaseTransactionManager):
+    def __init__(self, tm: IBaseTransactionManager, shortlist_cache: IShortlistCache | None = None):
         self._tm = tm
+        self._shortlist_cache = shortlist_cache
+
+    async def _invalidate_shortlist(self, vacancy_id: int) -> None:
+        if self._shortlist_cache is not None:
+            await self._shortlist_cache.invalidate(vacancy_id)
 
 
 class CreateVacancy(VacancyUseCase):
+    def __init__(self, tm: IBaseTransactionManager, vacancy_alerts: IVacancyAlerts | None = None):
+        super().__init__(tm)
+        self._vacancy_alerts = vacancy_alerts
+
     async def __call__(self, vacancy_dto: CreateVacancyDTO) -> VacancyOutDTO:
         vacancy = BaseVacancyDTODAO(
             company=BaseCompanyDTODAO(
@@ -70,6 +91,10 @@ class CreateVacancy(VacancyUseCase):
             await self._tm.rollback()
             raise exc
 
+        # saved searches are matched by worker only after vacancy is visible to it
+        if self._vacancy_alerts is not None:
+            self._vacancy_alerts.new_vacancy(res.vacancy_id)
+
         return VacancyOutDTO(
             vacancy_id=res.vacancy_id,
             title=res.title,
@@ -115,6 +140,7 @@ class UpdateVacancy(VacancyUseCase):
         try:
             await self._tm.vacancy_dao.update_vacancy(vacancy)
             await self._tm.commit()
+            await self._invalidate_shortlist(vacancy_dto.vacancy_id)
 
         except BaseVacancyException as exc:
             logger.bind(
@@ -173,10 +199,45 @@ class GetVacancyByID(VacancyUseCase):
         )
 
 
+class SearchVacancies(VacancyUseCase):
+    async def __call__(self, search_dto: SearchVacancyDTO) -> list[BaseVacancyDTO]:
+        search_dto_dao = SearchDTODAO(**search_dto.__dict__)
+        vacancies = await self._tm.vacancy_dao.search_vacancies(search_dto_dao)
+
+        return [
+            BaseVacancyDTO(
+                company=BaseCompanyDTO(
+                    user=BaseUserDTO(
+                        user_id=vacancy.company.user.user_id
+                    ),
+                    company_name=vacancy.company.company_name,
+                    address=vacancy.company.address
+                ),
+                vacancy_id=vacancy.vacancy_id,
+                title=vacancy.title,
+                location=vacancy.location,
+                key_skills=vacancy.key_skills,
+                profession=vacancy.profession,
+                salary_min=vacancy.salary_min,
+                salary_max=vacancy.salary_max,
+                salary_currency=vacancy.salary_currency,
+                type_of_employment=vacancy.type_of_employment,
+                type_work_schedule=vacancy.type_work_schedule,
+                updated_at=vacancy.updated_at,
+                rank_score=vacancy.rank_score,
+                is_published=vacancy.is_published,
+                experience_start=vacancy.experience_start,
+                experience_end=vacancy.experience_end
+            )
+            for vacancy in vacancies
+        ]
+
+
 class DeleteVacancy(VacancyUseCase):
     async def __call__(self, vacancy_id: int, company_id: int) -> None:
         await self._tm.vacancy_dao.delete_vacancy(vacancy_id, company_id)
         await self._tm.commit()
+        await self._invalidate_shortlist(vacancy_id)
 
 
 class ChangeVisibilityVacancy(VacancyUseCase):
@@ -251,24 +312,84 @@ class GetAllLikedVacanciesByApplicant(VacancyUseCase):
         ]
 
 
+class GetVacancyShortlist(VacancyUseCase):
+    async def __call__(self, vacancy_id: int, company_id: int, offset: int, limit: int) -> list[ShortlistResumeDTO]:
+        try:
+            ranking = await self._get_ranking(vacancy_id, company_id)
+
+        except VacancyNotFoundByID as exc:
+            logger.bind(
+                app_name=f"{GetVacancyShortlist.__name__}"
+            ).error(f"WITH ID {vacancy_id}\nEXCEPTION {exc.message()}")
+            raise exc
+
+        page = ranking[offset:offset + limit]
+        resumes = await self._tm.resume_dao.get_resumes_by_ids([resume_id for resume_id, _ in page])
+        scores = dict(page)
+
+        return [
+            ShortlistResumeDTO(
+                resume=resume_search_out_dto(resume),
+                score=scores[resume.resume_id]
+            )
+            for resume in resumes
+        ]
+
+    async def _get_ranking(self, vacancy_id: int, company_id: int) -> list[tuple[int, float]]:
+        # vacancy is read every time, so cached ranking is never shown to another company
+        vacancy = await self._tm.vacancy_dao.get_vacancy_for_matching(vacancy_id, company_id)
+
+        if self._shortlist_cache is not None:
+            ranking = await self._shortlist_cache.get(vacancy_id)
+            if ranking is not None:
+                return ranking
+
+        candidates = await self._tm.resume_dao.get_match_candidates(vacancy, SHORTLIST_POOL_SIZE)
+        ranking = []
+        if candidates:
+            vocabulary = Vocabulary()
+            scores = score_matrix(
+                resume_features(candidates, vocabulary),
+                vacancy_features([vacancy], vocabulary),
+                SHORTLIST_WEIGHTS
+            )[:, 0]
+            order = np.argsort(-scores, kind="stable")
+            ranking = [(candidates[i].resume_id, round(float(scores[i]), 4)) for i in order]
+
+        if self._shortlist_cache is not None:
+            await self._shortlist_cache.set(vacancy_id, ranking)
+
+        return ranking
+
+
 class VacancyService:
-    def __init__(self, tm: IBaseTransactionManager):
+    def __init__(
+            self,
+            tm: IBaseTransactionManager,
+            shortlist_cache: IShortlistCache | None = None,
+            vacancy_alerts: IVacancyAlerts | None = None
+    ):
         self._tm = tm
+        self._shortlist_cache = shortlist_cache
+        self._vacancy_alerts = vacancy_alerts
 
     async def create_vacancy(self, vacancy_dto: CreateVacancyDTO) -> VacancyOutDTO:
-        return await CreateVacancy(self._tm)(vacancy_dto)
+        return await CreateVacancy(self._tm, self._vacancy_alerts)(vacancy_dto)
 
     async def update_vacancy(self, vacancy_dto: UpdateVacancyDTO) -> None:
-        await UpdateVacancy(self._tm)(vacancy_dto)
+        await UpdateVacancy(self._tm, self._shortlist_cache)(vacancy_dto)
 
     async def get_vacancy_by_id(self, vacancy_id) -> BaseVacancyDTO:
         return await GetVacancyByID(self._tm)(vacancy_id)
 
-    async def search_vacancy(self):
-        ...
+    async def search_vacancy(self, search_dto: SearchVacancyDTO) -> list[BaseVacancyDTO]:
+        """
+        Search published vacancies with active access, raised vacancies go first
+        """
+        return await SearchVacancies(self._tm)(search_dto)
 
     async def delete_vacancy(self, vacancy_id: int, company_id: int) -> None:
-        await DeleteVacancy(self._tm)(vacancy_id, company_id)
+        await DeleteVacancy(self._tm, self._shortlist_cache)(vacancy_id, company_id)
 
     async def change_visibility_vacancy(self, vacancy_id: int, company_id: int, published: bool) -> None:
         """
@@ -292,3 +413,15 @@ class VacancyService:
 
     async def get_all_liked_vacancies_by_applicant(self, applicant_id: int) -> list[BaseVacancyDTO]:
         return await GetAllLikedVacanciesByApplicant(self._tm)(applicant_id)
+
+    async def get_vacancy_shortlist(
+            self,
+            vacancy_id: int,
+            company_id: int,
+            offset: int = 0,
+            limit: int = 20
+    ) -> list[ShortlistResumeDTO]:
+        """
+        Resumes which fit the vacancy of company best, ranked by skills, salary and experience
+        """
+        return await GetVacancyShortlist(self._tm, self._shortlist_cache)(vacancy_id, company_id, offset, limit)
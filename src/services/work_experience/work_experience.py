@@ -9,12 +9,19 @@ from src.dto.services.work_exprerience.work_experience import (
     UpdateWorkExperienceDTO
 )
 from src.exceptions.infrascructure.work_experiences.work_experiences import WorkExperiences
+from src.interfaces.infrastructure.search_cache import ISearchCache, RESUMES_SEARCH
 from src.interfaces.services.transaction_manager import IBaseTransactionManager
 
 
 class WorkExperienceUseCase(ABC):
-    def __init__(self, tm: IBaseTransactionManager):
+    def __init__(self, tm: IBaseTransactionManager, search_cache: ISearchCache | None = None):
         self._tm = tm
+        self._search_cache = search_cache
+
+    async def _invalidate_search(self) -> None:
+        # work experiences and total experience are part of found resumes
+        if self._search_cache is not None:
+            await self._search_cache.invalidate(RESUMES_SEARCH)
 
 
 class CreateWorkExperience(WorkExperienceUseCase):
@@ -31,6 +38,7 @@ class CreateWorkExperience(WorkExperienceUseCase):
         try:
             result = await self._tm.work_experience_dao.create_work_experience(work_experience)
             await self._tm.commit()
+            await self._invalidate_search()
 
         except WorkExperiences:
             logger.bind(
@@ -57,6 +65,7 @@ class UpdateWorkExperience(WorkExperienceUseCase):
         try:
             await self._tm.work_experience_dao.update_work_experience(work_experience)
             await self._tm.commit()
+            await self._invalidate_search()
 
         except WorkExperiences:
             logger.bind(
@@ -78,20 +87,22 @@ class DeleteWorkExperience(WorkExperienceUseCase):
     async def __call__(self, applicant_id: int, resume_id: int, work_experience_id: int):
         await self._tm.work_experience_dao.delete_work_experience(applicant_id, resume_id, work_experience_id)
         await self._tm.commit()
+        await self._invalidate_search()
 
 
 class WorkExperienceService:
-    def __init__(self, tm: IBaseTransactionManager):
+    def __init__(self, tm: IBaseTransactionManager, search_cache: ISearchCache | None = None):
         self._tm = tm
+        self._search_cache = search_cache
 
     async def create_work_experience(self, work_experience_dto: CreateWorkExperienceDTO) -> WorkExperienceDTO:
-        return await CreateWorkExperience(self._tm)(work_experience_dto)
+        return await CreateWorkExperience(self._tm, self._search_cache)(work_experience_dto)
 
     async def update_work_experience(self, work_experience_dto: UpdateWorkExperienceDTO) -> None:
-        return await UpdateWorkExperience(self._tm)(work_experience_dto)
+        return await UpdateWorkExperience(self._tm, self._search_cache)(work_experience_dto)
 
     async def delete_work_experience(self, applicant_id: int, resume_id: int, work_experience_id: int) -> None:
-        await DeleteWorkExperience(self._tm)(applicant_id, resume_id, work_experience_id)
+        await DeleteWorkExperience(self._tm, self._search_cache)(applicant_id, resume_id, work_experience_id)
 
     async def get_work_experience_by_id(self, work_experience_id: int) -> WorkExperienceDTO:
-        return await GetWorkExperienceByID(self._tm)(work_experience_id)
+        return await GetWorkExperienceByID(self._tm, self._search_cache)(work_experience_id)
@@ -0,0 +1,41 @@
+import base64
+import json
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Any, Callable
+
+from src.exceptions.services.search import InvalidCursor
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type {type(value)} can not be used in cursor")
+
+
+def encode_cursor(*keys: Any) -> str:
+    """
+    Make opaque cursor from the last sort key and primary key of page.
+    """
+    raw = json.dumps(list(keys), default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *converters: Callable[[Any], Any]) -> list[Any]:
+    """
+    Return keys of cursor made by encode_cursor, every key is passed through its converter
+    (int, str, datetime.fromisoformat...). Raise InvalidCursor if cursor was broken or changed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        keys = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+        if not isinstance(keys, list) or len(keys) != len(converters):
+            raise InvalidCursor(cursor)
+
+        return [converter(key) for converter, key in zip(converters, keys)]
+
+    except (ValueError, TypeError, UnicodeError):
+        raise InvalidCursor(cursor)
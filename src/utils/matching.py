@@ -0,0 +1,260 @@
+"""
+Scoring of resumes against vacancies, vectorized with NumPy over whole candidate sets:
+every function works with arrays of all rows at once, there are no loops over pairs.
+"""
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.dto.db.recommendation.recommendation import MatchResumeDTODAO, MatchVacancyDTODAO
+
+
+MATCH_WEIGHTS = {
+    "profession": 0.30,
+    "skills": 0.35,
+    "salary": 0.15,
+    "location": 0.10,
+    "experience": 0.10,
+}
+# shortlist of vacancy: candidates are already found by profession or skills
+SHORTLIST_WEIGHTS = {
+    "skills": 0.50,
+    "salary": 0.25,
+    "experience": 0.25,
+}
+# score of a feature which is unknown on one of the sides
+NEUTRAL_SCORE = 0.5
+# experience further than this from the vacancy window gives 0
+EXPERIENCE_TOLERANCE_YEARS = 3.0
+
+_WORDS = re.compile(r"\w+")
+
+
+@dataclass
+class MatchFeatures:
+    """
+    Features of n rows: sparse sets as pairs (row, term) and dense values per row, NaN is unknown.
+    """
+    ids: np.ndarray
+    profession_rows: np.ndarray
+    profession_terms: np.ndarray
+    skill_rows: np.ndarray
+    skill_ids: np.ndarray
+    location: np.ndarray  # code of location, -1 is unknown
+    salary_min: np.ndarray
+    salary_max: np.ndarray
+    experience_min: np.ndarray  # years
+    experience_max: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class Vocabulary:
+    """
+    Codes of profession words and locations, must be shared by resumes and vacancies which are compared.
+    """
+
+    def __init__(self):
+        self._codes: dict[str, int] = {}
+
+    def code(self, key: str) -> int:
+        return self._codes.setdefault(key, len(self._codes))
+
+    def profession_terms(self, profession: str | None) -> list[int]:
+        return [self.code(f"p:{word}") for word in set(_WORDS.findall((profession or "").lower()))]
+
+    def location(self, location: str | None) -> int:
+        location = " ".join((location or "").lower().split())
+        return self.code(f"l:{location}") if location else -1
+
+
+def _pairs(groups: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    rows = np.repeat(np.arange(len(groups)), [len(group) for group in groups])
+    terms = np.fromiter((term for group in groups for term in group), dtype=np.int64, count=len(rows))
+    return rows, terms
+
+
+def _floats(values: list) -> np.ndarray:
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+
+
+def _features(
+        ids: list[int],
+        professions: list[str | None],
+        skills: list[list[int] | None],
+        locations: list[str | None],
+        salary_min: list,
+        salary_max: list,
+        experience_min: list,
+        experience_max: list,
+        vocabulary: Vocabulary
+) -> MatchFeatures:
+    profession_rows, profession_terms = _pairs([vocabulary.profession_terms(p) for p in professions])
+    skill_rows, skill_ids = _pairs([list(set(s or [])) for s in skills])
+
+    return MatchFeatures(
+        ids=np.array(ids, dtype=np.int64),
+        profession_rows=profession_rows,
+        profession_terms=profession_terms,
+        skill_rows=skill_rows,
+        skill_ids=skill_ids,
+        location=np.array([vocabulary.location(location) for location in locations], dtype=np.int64),
+        salary_min=_floats(salary_min),
+        salary_max=_floats(salary_max),
+        experience_min=_floats(experience_min),
+        experience_max=_floats(experience_max),
+    )
+
+
+def resume_features(resumes: list[MatchResumeDTODAO], vocabulary: Vocabulary) -> MatchFeatures:
+    years = [resume.total_experience_months / 12 for resume in resumes]
+    return _features(
+        ids=[resume.resume_id for resume in resumes],
+        professions=[resume.profession for resume in resumes],
+        skills=[resume.skill_ids for resume in resumes],
+        locations=[resume.location for resume in resumes],
+        salary_min=[resume.salary_min_base for resume in resumes],
+        salary_max=[resume.salary_max_base for resume in resumes],
+        experience_min=years,
+        experience_max=years,
+        vocabulary=vocabulary,
+    )
+
+
+def vacancy_features(vacancies: list[MatchVacancyDTODAO], vocabulary: Vocabulary) -> MatchFeatures:
+    return _features(
+        ids=[vacancy.vacancy_id for vacancy in vacancies],
+        professions=[vacancy.profession for vacancy in vacancies],
+        skills=[vacancy.skill_ids for vacancy in vacancies],
+        locations=[vacancy.location for vacancy in vacancies],
+        salary_min=[vacancy.salary_min_base for vacancy in vacancies],
+        salary_max=[vacancy.salary_max_base for vacancy in vacancies],
+        experience_min=[vacancy.experience_start for vacancy in vacancies],
+        experience_max=[vacancy.experience_end for vacancy in vacancies],
+        vocabulary=vocabulary,
+    )
+
+
+def _overlap_counts(
+        left_rows: np.ndarray,
+        left_terms: np.ndarray,
+        n_left: int,
+        right_rows: np.ndarray,
+        right_terms: np.ndarray,
+        n_right: int
+) -> np.ndarray:
+    """
+    Matrix n_left x n_right of count of common terms: sparse join of (row, term) pairs by term.
+    """
+    counts = np.zeros((n_left, n_right), dtype=np.float32)
+
+    order = np.argsort(right_terms, kind="stable")
+    right_terms, right_rows = right_terms[order], right_rows[order]
+    start = np.searchsorted(right_terms, left_terms, side="left")
+    lengths = np.searchsorted(right_terms, left_terms, side="right") - start
+
+    total = int(lengths.sum())
+    if total == 0:
+        return counts
+
+    # for every left pair all right pairs with the same term: start + 0..length-1
+    first = np.cumsum(lengths) - lengths
+    positions = np.repeat(start - first, lengths) + np.arange(total)
+    np.add.at(counts, (np.repeat(left_rows, lengths), right_rows[positions]), 1)
+
+    return counts
+
+
+def _set_sizes(rows: np.ndarray, n: int) -> np.ndarray:
+    return np.bincount(rows, minlength=n).astype(np.float32)
+
+
+def score_matrix(
+        resumes: MatchFeatures,
+        vacancies: MatchFeatures,
+        weights: dict[str, float] = MATCH_WEIGHTS
+) -> np.ndarray:
+    """
+    Matrix len(resumes) x len(vacancies) of scores from 0 to 1, features missing in weights are not counted.
+    """
+    n_resumes, n_vacancies = len(resumes), len(vacancies)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # profession: Jaccard of words
+        common = _overlap_counts(
+            resumes.profession_rows, resumes.profession_terms, n_resumes,
+            vacancies.profession_rows, vacancies.profession_terms, n_vacancies,
+        )
+        union = (
+                _set_sizes(resumes.profession_rows, n_resumes)[:, None]
+                + _set_sizes(vacancies.profession_rows, n_vacancies)[None, :]
+                - common
+        )
+        profession = np.where(union > 0, common / union, 0)
+
+        # skills: part of skills of vacancy which resume has
+        common = _overlap_counts(
+            resumes.skill_rows, resumes.skill_ids, n_resumes,
+            vacancies.skill_rows, vacancies.skill_ids, n_vacancies,
+        )
+        required = _set_sizes(vacancies.skill_rows, n_vacancies)[None, :]
+        skills = np.where(required > 0, common / required, NEUTRAL_SCORE)
+
+    # salary: ranges overlap, open bound is infinite
+    resume_min = np.nan_to_num(resumes.salary_min, nan=-np.inf)[:, None]
+    resume_max = np.nan_to_num(resumes.salary_max, nan=np.inf)[:, None]
+    vacancy_min = np.nan_to_num(vacancies.salary_min, nan=-np.inf)[None, :]
+    vacancy_max = np.nan_to_num(vacancies.salary_max, nan=np.inf)[None, :]
+    salary_unknown = (
+            (np.isnan(resumes.salary_min) & np.isnan(resumes.salary_max))[:, None]
+            | (np.isnan(vacancies.salary_min) & np.isnan(vacancies.salary_max))[None, :]
+    )
+    overlaps = np.maximum(resume_min, vacancy_min) <= np.minimum(resume_max, vacancy_max)
+    salary = np.where(salary_unknown, NEUTRAL_SCORE, overlaps.astype(np.float32))
+
+    # location: the same city
+    location_unknown = (resumes.location < 0)[:, None] | (vacancies.location < 0)[None, :]
+    same_location = resumes.location[:, None] == vacancies.location[None, :]
+    location = np.where(location_unknown, NEUTRAL_SCORE, same_location.astype(np.float32))
+
+    # experience: distance in years from the window of vacancy
+    years = resumes.experience_min[:, None]
+    below = np.nan_to_num(vacancies.experience_min[None, :] - years, nan=0).clip(min=0)
+    above = np.nan_to_num(years - vacancies.experience_max[None, :], nan=0).clip(min=0)
+    experience = (1 - (below + above) / EXPERIENCE_TOLERANCE_YEARS).clip(min=0)
+
+    features = {
+        "profession": profession,
+        "skills": skills,
+        "salary": salary,
+        "location": location,
+        "experience": experience,
+    }
+    scores = np.zeros((n_resumes, n_vacancies), dtype=np.float32)
+    for name, weight in weights.items():
+        scores += weight * features[name]
+    return scores
+
+
+def top_n_by_group(scores: np.ndarray, groups: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rows of scores belong to groups (resumes of applicant), rows of one group must go one after another.
+    Group takes the best score of its rows per column, then n best columns of every group are returned
+    as flat arrays (group, column, score) ordered by group and score desc.
+    """
+    if scores.size == 0 or n <= 0:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=np.float32)
+
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    best = np.maximum.reduceat(scores, starts, axis=0)
+
+    n = min(n, best.shape[1])
+    columns = np.argpartition(-best, n - 1, axis=1)[:, :n]
+    top = np.take_along_axis(best, columns, axis=1)
+    order = np.argsort(-top, axis=1, kind="stable")
+    columns = np.take_along_axis(columns, order, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+
+    return np.repeat(groups[starts], n), columns.ravel(), top.ravel()
@@ -0,0 +1,27 @@
+"""
+Notifications which are not urgent are coalesced by recipient and template, see NotificationDigest.
+"""
+from typing import Any
+
+
+COALESCED_TEMPLATES = frozenset({
+    "send_message_about_change_status",
+    "send_respond_notification",
+})
+DIGEST_SEPARATOR = "\n\n———\n\n"
+
+
+def digest_email(notifications: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Subject and body of one email from data of notifications in order of their creation.
+    """
+    if len(notifications) == 1:
+        return notifications[0]
+
+    return {
+        "subject": f"У вас {len(notifications)} новых уведомлений",
+        "body": DIGEST_SEPARATOR.join(
+            f"{notification.get('subject') or ''}\n{notification.get('body') or ''}".strip()
+            for notification in notifications
+        )
+    }
@@ -0,0 +1,109 @@
+"""
+Reverse index of saved searches. Every search is indexed by exactly one term per predicate:
+
+    p:<token>        the longest word of profession, "p:*" if there is no profession
+    c:<currency>     salary currency of search without salary bounds, "c:*" otherwise
+    e:<employment>   one of employment types, "e:*" if there are none
+
+A vacancy could match only searches whose all PREDICATES_COUNT terms are among vacancy_terms(),
+other predicates of candidates are checked by saved_search_matches().
+
+Predicates follow search of vacancies: salary bounds are compared with salary of vacancy in base currency,
+currency alone means salary in this currency, location is a substring. Profession differs: search of
+vacancies looks for a substring, a saved search needs all its words among words of vacancy profession.
+"""
+import re
+
+from src.core.enums import Currency, EmploymentType
+from src.dto.db.saved_search.saved_search import SavedSearchDTODAO, AlertVacancyDTODAO
+
+
+ANY = "*"
+PREDICATES_COUNT = 3
+
+_WORDS = re.compile(r"\w+")
+
+
+def profession_tokens(profession: str | None) -> set[str]:
+    return set(_WORDS.findall((profession or "").lower()))
+
+
+def saved_search_terms(
+        profession: str | None,
+        salary_currency: Currency | None,
+        type_of_employment: list[EmploymentType] | None,
+        has_salary_bounds: bool = False
+) -> list[str]:
+    tokens = profession_tokens(profession)
+    # longest word is the rarest one as a rule, the other words are checked on match
+    profession_term = max(sorted(tokens), key=len) if tokens else ANY
+    # with bounds the currency only converts them, vacancies in any currency fit
+    currency_term = salary_currency.value if salary_currency is not None and not has_salary_bounds else ANY
+    # vacancy must have all employment types of search, so any of them fits as a key
+    employment_term = min(e.value for e in type_of_employment) if type_of_employment else ANY
+
+    return [f"p:{profession_term}", f"c:{currency_term}", f"e:{employment_term}"]
+
+
+def vacancy_terms(vacancy: AlertVacancyDTODAO) -> list[str]:
+    terms = [f"p:{ANY}", f"c:{ANY}", f"e:{ANY}"]
+    terms += [f"p:{token}" for token in sorted(profession_tokens(vacancy.profession))]
+    if vacancy.salary_currency is not None:
+        terms.append(f"c:{vacancy.salary_currency.value}")
+    terms += [f"e:{e.value}" for e in vacancy.type_of_employment or []]
+
+    return terms
+
+
+def _has_salary_bounds(search: SavedSearchDTODAO) -> bool:
+    return search.salary_min is not None or search.salary_max is not None
+
+
+def _salary_matches(search: SavedSearchDTODAO, vacancy: AlertVacancyDTODAO) -> bool:
+    """
+    Overlap of salaries in base currency, as salary_range_filter() of search of vacancies: bounds of search
+    are converted by salary_rate of its currency (of base currency without one), vacancy in any currency fits.
+    """
+    if not _has_salary_bounds(search):
+        return search.salary_currency is None or search.salary_currency == vacancy.salary_currency
+
+    lower, upper = vacancy.salary_min_base, vacancy.salary_max_base
+    if search.salary_rate is None or (lower is None and upper is None):
+        return False
+
+    rate = float(search.salary_rate)
+    search_min = float(search.salary_min) * rate if search.salary_min is not None else None
+    search_max = float(search.salary_max) * rate if search.salary_max is not None else None
+    if search_min is not None and search_max is not None and search_min > search_max:
+        search_min, search_max = search_max, search_min
+
+    if search_min is not None and upper is not None and upper < search_min:
+        return False
+    if search_max is not None and lower is not None and lower > search_max:
+        return False
+    return True
+
+
+def saved_search_matches(search: SavedSearchDTODAO, vacancy: AlertVacancyDTODAO) -> bool:
+    if not profession_tokens(search.profession) <= profession_tokens(vacancy.profession):
+        return False
+
+    if search.type_of_employment and not set(search.type_of_employment) <= set(vacancy.type_of_employment or []):
+        return False
+
+    if search.location and search.location.strip().lower() not in (vacancy.location or "").lower():
+        return False
+
+    return _salary_matches(search, vacancy)
+
+
+def alerts_by_email(searches: list[SavedSearchDTODAO], vacancy: AlertVacancyDTODAO) -> dict[str, list[str]]:
+    """
+    Names of matched searches per email, so applicant gets one letter about vacancy.
+    """
+    alerts: dict[str, list[str]] = {}
+    for search in searches:
+        if search.email and saved_search_matches(search, vacancy):
+            alerts.setdefault(search.email, []).append(search.name)
+
+    return alerts
@@ -0,0 +1,26 @@
+import re
+
+
+SKILL_MAX_LENGTH = 50
+_SEPARATORS = re.compile(r"[,;\n\r|•]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_skills(key_skills: str | list[str] | None) -> list[str]:
+    """
+    Split free text of key_skills ("Python, Django; SQL") or list of such texts into normalized skills:
+    lowercased, without extra spaces and bullets, without duplicates, in order of input.
+    """
+    if not key_skills:
+        return []
+
+    texts = key_skills if isinstance(key_skills, list) else [key_skills]
+    tokens = [token for text in texts for token in _SEPARATORS.split(text)]
+
+    skills: list[str] = []
+    for token in tokens:
+        skill = _SPACES.sub(" ", token).strip(" -*.\t").lower()[:SKILL_MAX_LENGTH].strip()
+        if skill and skill not in skills:
+            skills.append(skill)
+
+    return skills
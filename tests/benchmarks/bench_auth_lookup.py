@@ -0,0 +1,87 @@
+"""
+Login lookup of user by email: select(UserDB) with polymorphic LEFT JOINs of applicants and companies
+vs UserDAO.get_auth_user_by_email on users columns only, at 1M users.
+
+Needs migrated Postgres from .env. Users are generated on the server, half applicants and half companies,
+in a transaction which is rolled back at the end.
+
+    python -m tests.benchmarks.bench_auth_lookup --users 1000000 --lookups 2000
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.config_reader import config
+from src.infrastructure.db.dao.user.user_dao import UserDAO
+from src.infrastructure.db.models import UserDB
+from src.infrastructure.db.utils.connection_string_maker import make_connection_string
+
+
+SEED_USERS = """
+INSERT INTO users (email, password, first_name, last_name, phone_number, type, is_superuser, is_admin, created_at)
+SELECT 'bench_' || n || '@b.io', repeat('x', 60), 'bench', 'bench', '+000000000',
+       CASE WHEN n % 2 = 0 THEN 'applicant' ELSE 'company' END, false, false, now()
+FROM generate_series(1, :users) AS n
+"""
+SEED_APPLICANTS = """
+INSERT INTO applicants (applicant_id, gender)
+SELECT user_id, 'MALE' FROM users WHERE email LIKE 'bench\\_%' AND type = 'applicant'
+"""
+SEED_COMPANIES = """
+INSERT INTO companies (company_id, company_name)
+SELECT user_id, 'bench ' || user_id FROM users WHERE email LIKE 'bench\\_%' AND type = 'company'
+"""
+
+
+async def measure(name: str, emails: list[str], lookup) -> None:
+    start = time.perf_counter()
+    for email in emails:
+        await lookup(email)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<12} {elapsed / len(emails) * 1000:8.3f} ms/login {len(emails) / elapsed:9.1f} logins/s")
+
+
+async def main(users: int, lookups: int) -> None:
+    engine = create_async_engine(make_connection_string(config.db))
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+
+        for sql in (SEED_USERS, SEED_APPLICANTS, SEED_COMPANIES):
+            await session.execute(text(sql), {"users": users})
+        await session.execute(text("ANALYZE users, applicants, companies"))
+        print(f"{users} users, {lookups} lookups by email")
+
+        emails = [f"bench_{random.randint(1, users)}@b.io" for _ in range(lookups)]
+        dao = UserDAO(session)
+
+        async def polymorphic(email: str) -> None:
+            # how get_user_by_email loads the user for login
+            (await session.execute(select(UserDB).where(UserDB.email == email))).scalar()
+            session.expunge_all()
+
+        async def lean(email: str) -> None:
+            await dao.get_auth_user_by_email(email)
+
+        await measure("polymorphic", emails, polymorphic)
+        await measure("lean", emails, lean)
+
+        await session.close()
+        await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.lookups))
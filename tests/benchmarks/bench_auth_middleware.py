@@ -0,0 +1,115 @@
+"""
+Requests per second of a trivial endpoint which reads request.state.user, with a valid access token:
+BaseHTTPMiddleware verifying the token on every request (as before) vs plain ASGI middleware with the
+verified token cache.
+
+Requests are sent to the ASGI app directly, without server and client, to measure the middleware.
+
+    python -m tests.benchmarks.bench_auth_middleware --requests 5000
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+from src.api.middleware.auth import AuthenticationMiddleware
+from src.core.config_reader import config
+from src.dto.web.auth import AnonymousUser, ActiveUser
+from src.infrastructure.auth.jwt import JWTProvider
+
+
+class BaseHTTPAuthenticationMiddleware(BaseHTTPMiddleware):
+    # the middleware before: cookies parsed by Request, signature verified on every request
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        access_token_data = JWTProvider().read_token(request.cookies.get(config.auth.access_token_name))
+
+        if access_token_data is None:
+            request.state.user = AnonymousUser()
+        else:
+            request.state.user = ActiveUser(
+                **{field: access_token_data.get(field) for field in ActiveUser.model_fields}
+            )
+        return await call_next(request)
+
+
+def make_app(middleware) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(request: Request):
+        return {"user_id": request.state.user.user_id}
+
+    app.add_middleware(middleware)
+    return app
+
+
+async def request(app: FastAPI, headers: list[tuple[bytes, bytes]]) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/me",
+        "raw_path": b"/me",
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(name: str, app: FastAPI, headers: list[tuple[bytes, bytes]], requests: int) -> None:
+    assert await request(app, headers) == 200
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, headers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:>14}: {requests / elapsed:8.1f} requests/s, {elapsed / requests * 1_000_000:7.1f} us per request")
+
+
+def main(requests: int) -> None:
+    token = JWTProvider().create_access_token({
+        "user_id": 1,
+        "email": "bench@mail.ru",
+        "first_name": "bench",
+        "last_name": "bench",
+        "is_admin": False,
+        "is_superuser": False,
+        "type": "applicant",
+    })
+    headers = [
+        (b"host", b"localhost"),
+        (b"user-agent", b"bench"),
+        (b"cookie", f"theme=dark; {config.auth.access_token_name}={token}; lang=ru".encode()),
+    ]
+
+    print(f"{requests} requests with a valid access token")
+    asyncio.run(measure("BaseHTTP", make_app(BaseHTTPAuthenticationMiddleware), headers, requests))
+    asyncio.run(measure("ASGI + cache", make_app(AuthenticationMiddleware), headers, requests))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    main(args.requests)
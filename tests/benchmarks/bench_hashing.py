@@ -0,0 +1,103 @@
+"""
+Login throughput and latency of unrelated endpoints while many logins verify passwords at once:
+bcrypt on the event loop (as before the pool) vs Hasher with a bounded thread pool.
+
+Requests go to a FastAPI app in-process through httpx, /login only verifies the password,
+/ping is an endpoint which doesn't touch the hasher.
+
+    python -m tests.benchmarks.bench_hashing --logins 100 --workers 4 --rounds 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from passlib.context import CryptContext
+
+from src.infrastructure.hasher import Hasher
+
+
+PASSWORD = "bench-password"
+PING_INTERVAL = 0.01
+
+
+def make_app(hasher: Hasher, hashed: str, on_loop: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login():
+        if on_loop:
+            valid = hasher.hasher.verify(PASSWORD, hashed)
+        else:
+            valid = await hasher.verify(PASSWORD, hashed)
+        return {"valid": valid}
+
+    @app.get("/ping")
+    async def ping():
+        return {"detail": "ok"}
+
+    return app
+
+
+async def ping_until(client: httpx.AsyncClient, done: asyncio.Event, latencies: list[float]) -> None:
+    """
+    Pings on a fixed schedule, latency counts from the planned time: a blocked loop delays the ping
+    itself, measuring from the real start would hide it.
+    """
+    planned = time.perf_counter()
+    while not done.is_set():
+        await asyncio.sleep(max(0.0, planned - time.perf_counter()))
+        await client.get("/ping")
+        latencies.append(time.perf_counter() - planned)
+        planned += PING_INTERVAL
+
+
+async def measure(name: str, hasher: Hasher, hashed: str, on_loop: bool, logins: int) -> None:
+    app = make_app(hasher, hashed, on_loop)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/ping")
+        done, latencies, queued = asyncio.Event(), [], 0
+
+        pinger = asyncio.create_task(ping_until(client, done, latencies))
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(client.post("/login")) for _ in range(logins)]
+
+        while not all(task.done() for task in tasks):
+            queued = max(queued, hasher.stats().queued)
+            await asyncio.sleep(0.01)
+
+        elapsed = time.perf_counter() - start
+        done.set()
+        await pinger
+
+    assert all(task.result().json()["valid"] for task in tasks)
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{name:>8}: {logins / elapsed:7.1f} logins/s, "
+        f"ping p50 {statistics.median(latencies) * 1000:8.2f} ms, p99 {p99 * 1000:8.2f} ms "
+        f"({len(latencies)} pings), max queued {queued}"
+    )
+
+
+def main(logins: int, workers: int, rounds: int) -> None:
+    hasher = Hasher(max_workers=workers)
+    hashed = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds).hash(PASSWORD)
+
+    print(f"{logins} concurrent logins, bcrypt rounds {rounds}, {workers} hasher workers")
+    asyncio.run(measure("on loop", hasher, hashed, True, logins))
+    asyncio.run(measure("pool", hasher, hashed, False, logins))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args()
+
+    main(args.logins, args.workers, args.rounds)
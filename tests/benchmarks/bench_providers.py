@@ -0,0 +1,98 @@
+"""
+Cost of dependencies of a request: Hasher, JWTAuth with JWTProvider and FilesManager built per request
+(as before scopes) vs APP scope providers. Measured on requests of a FastAPI app through TestClient,
+and on building the dependencies alone.
+
+    python -m tests.benchmarks.bench_providers --requests 2000
+"""
+import argparse
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import HTTPConnection
+from starlette.responses import Response
+
+from src.api.providers.abstract.common import fm_provider, hasher_provider
+from src.api.providers.auth import TokenAuthDep, get_jwt_provider, get_jwt_token_auth
+from src.api.providers.build_files_manager import build_fm
+from src.api.providers.common import fm_getter, hasher_getter
+from src.core.config_reader import config
+from src.infrastructure.auth.jwt import JWTAuth, JWTProvider
+from src.infrastructure.hasher import Hasher
+
+
+# hasher of the app is held by AppResources, the engine and Redis of it are not needed here
+resources = SimpleNamespace(hasher=Hasher(max_workers=config.auth.hash_workers))
+
+
+def hasher_per_request() -> Hasher:
+    return Hasher()
+
+
+def fm_per_request():
+    return build_fm(base_dir=Path(config.files_work.url_save_file), chunk_size=config.files_work.chunk_size)
+
+
+async def jwt_auth_per_request(request: HTTPConnection = None, response: Response = None) -> JWTAuth:
+    return JWTAuth(request=request, response=response, jwt_provider=JWTProvider())
+
+
+def make_app(per_request: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint(
+            auth: TokenAuthDep,
+            hasher: Hasher = Depends(hasher_provider),
+            fm=Depends(fm_provider)
+    ):
+        return {"detail": "ok"}
+
+    if per_request:
+        app.dependency_overrides[hasher_provider] = hasher_per_request
+        app.dependency_overrides[fm_provider] = fm_per_request
+        app.dependency_overrides[get_jwt_token_auth] = jwt_auth_per_request
+    else:
+        app.dependency_overrides[hasher_provider] = hasher_getter(resources)
+        app.dependency_overrides[fm_provider] = fm_getter(config)
+
+    return app
+
+
+def measure_requests(per_request: bool, requests: int) -> float:
+    with TestClient(make_app(per_request)) as client:
+        client.get("/")
+        start = time.perf_counter()
+        for _ in range(requests):
+            client.get("/")
+        return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def measure_building(per_request: bool, count: int) -> float:
+    get_hasher, get_fm = hasher_getter(resources), fm_getter(config)
+    start = time.perf_counter()
+    for _ in range(count):
+        if per_request:
+            hasher_per_request(), fm_per_request(), JWTAuth(jwt_provider=JWTProvider())
+        else:
+            get_hasher(), get_fm(), JWTAuth(jwt_provider=get_jwt_provider())
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def main(requests: int) -> None:
+    for name, per_request in (("per request", True), ("app scope", False)):
+        print(
+            f"{name:>12}: {measure_requests(per_request, requests):8.1f} us per request, "
+            f"{measure_building(per_request, requests * 10):6.2f} us building dependencies"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    main(args.requests)
@@ -0,0 +1,146 @@
+"""
+Resume search: one query with joined work experiences vs page of ids + batched hydration.
+
+Needs migrated Postgres from .env. Data is inserted in a transaction which is rolled back at the end.
+
+    python -m tests.benchmarks.bench_resume_search --resumes 5000 --experiences 12
+"""
+import argparse
+import asyncio
+import time
+from datetime import date
+
+from sqlalchemy import insert, select, asc
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import contains_eager, joinedload
+
+from src.core.config_reader import config
+from src.core.enums import GenderEnum
+from src.dto.db.resume.resume import SearchDTODAO
+from src.infrastructure.db.dao.resume.resume_dao import ResumeDAO
+from src.infrastructure.db.models import ApplicantDB, ResumeDB, UserDB, WorkExperienceDB
+from src.infrastructure.db.utils.connection_string_maker import make_connection_string
+
+
+def joined_search_query(offset: int, limit: int):
+    # how search_resumes loaded the page before: every resume repeated per work experience
+    return (
+        select(ResumeDB)
+        .join(ResumeDB.applicant)
+        .options(
+            contains_eager(ResumeDB.applicant),
+            joinedload(ResumeDB.work_experiences),
+        )
+        .where(ResumeDB.profession.ilike("%bench%"))
+        .order_by(asc(ResumeDB.name_resume), asc(ResumeDB.resume_id))
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+async def seed(session: AsyncSession, resumes: int, experiences: int) -> None:
+    # list of parameters is sent as batches of multi-row inserts (insertmanyvalues)
+    user_ids = (await session.execute(
+        insert(UserDB.__table__).returning(UserDB.__table__.c.user_id, sort_by_parameter_order=True),  # type: ignore
+        [
+            dict(
+                email=f"bench_{i}@bench.io",
+                password="bench",
+                first_name="bench",
+                last_name="bench",
+                phone_number="+000000000",
+                type="applicant",
+                is_superuser=False,
+                is_admin=False,
+            )
+            for i in range(resumes)
+        ]
+    )).scalars().all()
+
+    await session.execute(
+        insert(ApplicantDB.__table__),  # type: ignore
+        [dict(applicant_id=user_id, gender=GenderEnum.MALE.name) for user_id in user_ids]
+    )
+
+    resume_ids = (await session.execute(
+        insert(ResumeDB).returning(ResumeDB.resume_id, sort_by_parameter_order=True),
+        [
+            dict(
+                name_resume=f"bench {i:06}",
+                profession="bench developer",
+                applicant_id=user_id,
+                total_experience_months=experiences * 12,
+            )
+            for i, user_id in enumerate(user_ids)
+        ]
+    )).scalars().all()
+
+    await session.execute(
+        insert(WorkExperienceDB),
+        [
+            dict(
+                resume_id=resume_id,
+                company_name=f"company {n}",
+                start_date=date(2000 + n, 1, 1),
+                end_date=date(2001 + n, 1, 1),
+                description_work="bench " * 40,
+            )
+            for resume_id in resume_ids
+            for n in range(experiences)
+        ]
+    )
+
+
+async def measure(name: str, pages: int, load_page) -> None:
+    rows = 0
+    start = time.perf_counter()
+    for page in range(pages):
+        rows += await load_page(page)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<12} {elapsed / pages * 1000:8.2f} ms/page {rows / pages:8.1f} rows/page")
+
+
+async def main(resumes: int, experiences: int, pages: int, limit: int) -> None:
+    engine = create_async_engine(make_connection_string(config.db))
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+
+        await seed(session, resumes, experiences)
+        await session.flush()
+        print(f"{resumes} resumes with {experiences} work experiences each, limit {limit}")
+
+        async def joined_page(page: int) -> int:
+            resumes = (await session.execute(joined_search_query(page * limit, limit))).unique().scalars().all()
+            session.expunge_all()
+            # server sent a row per work experience, unique() collapsed them
+            return sum(max(len(resume.work_experiences), 1) for resume in resumes)
+
+        async def two_phase_page(page: int) -> int:
+            dtos = await ResumeDAO(session).search_resumes(
+                SearchDTODAO(profession="bench", offset=page * limit, limit=limit)
+            )
+            session.expunge_all()
+            # ids page + resumes with applicants + work experiences
+            return limit + len(dtos) + sum(len(dto.work_experiences) for dto in dtos)
+
+        await measure("joined", pages, joined_page)
+        await measure("two-phase", pages, two_phase_page)
+
+        await session.close()
+        await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=5000)
+    parser.add_argument("--experiences", type=int, default=12)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=25)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.resumes, args.experiences, args.pages, args.limit))
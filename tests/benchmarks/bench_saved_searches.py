@@ -0,0 +1,158 @@
+"""
+Alerts of new vacancy: every saved search checked vs candidates from reverse index saved_search_terms.
+
+Needs migrated Postgres from .env. Data is inserted in a transaction which is rolled back at the end.
+
+    python -m tests.benchmarks.bench_saved_searches --searches 100000 --vacancies 50
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.config_reader import config
+from src.core.enums import Currency, EmploymentType, GenderEnum
+from src.dto.db.saved_search.saved_search import SavedSearchDTODAO, AlertVacancyDTODAO
+from src.infrastructure.db.dao.saved_search.saved_search_dao import SavedSearchDAO, SAVED_SEARCH_COLUMNS
+from src.infrastructure.db.models import ApplicantDB, SavedSearchDB, SavedSearchTermDB, UserDB
+from src.infrastructure.db.utils.connection_string_maker import make_connection_string
+from src.utils.saved_search import alerts_by_email, saved_search_terms
+
+
+PROFESSIONS = [f"{level} {area} {role}" for level in ("junior", "senior") for area in (
+    "python", "java", "golang", "frontend", "data", "devops", "mobile", "qa", "sales", "support",
+    "finance", "marketing", "design", "logistics", "medical", "legal", "hr", "security", "retail", "teaching",
+) for role in ("developer", "engineer", "manager", "specialist", "analyst")]
+SEARCHES_PER_APPLICANT = 10
+
+
+def random_search(rnd: random.Random) -> dict:
+    level, area, role = rnd.choice(PROFESSIONS).split()
+    return dict(
+        # searches are a part of profession, one of twenty is without profession
+        profession=None if rnd.random() < 0.05 else rnd.choice([f"{area} {role}", f"{level} {area}", area]),
+        salary_currency=rnd.choice([None, *Currency]),
+        salary_min=rnd.choice([None, rnd.randrange(500, 3000, 100)]),
+        type_of_employment=rnd.choice([None, [rnd.choice(list(EmploymentType))]]),
+    )
+
+
+def random_vacancy(rnd: random.Random, vacancy_id: int) -> AlertVacancyDTODAO:
+    salary_min = rnd.randrange(500, 4000, 100)
+    return AlertVacancyDTODAO(
+        vacancy_id=vacancy_id,
+        title="bench",
+        profession=rnd.choice(PROFESSIONS),
+        company_name="bench",
+        salary_min=salary_min,
+        salary_max=salary_min + 1000,
+        salary_currency=rnd.choice(list(Currency)),
+        salary_min_base=salary_min,
+        salary_max_base=salary_min + 1000,
+        type_of_employment=rnd.sample(list(EmploymentType), 2),
+    )
+
+
+async def seed(session: AsyncSession, searches: int, rnd: random.Random) -> None:
+    applicants = max(searches // SEARCHES_PER_APPLICANT, 1)
+    user_ids = (await session.execute(
+        insert(UserDB.__table__).returning(UserDB.__table__.c.user_id, sort_by_parameter_order=True),  # type: ignore
+        [
+            dict(
+                email=f"bench_{i}@bench.io",
+                password="bench",
+                first_name="bench",
+                last_name="bench",
+                phone_number="+000000000",
+                type="applicant",
+                is_superuser=False,
+                is_admin=False,
+            )
+            for i in range(applicants)
+        ]
+    )).scalars().all()
+
+    await session.execute(
+        insert(ApplicantDB.__table__),  # type: ignore
+        [dict(applicant_id=user_id, gender=GenderEnum.MALE.name) for user_id in user_ids]
+    )
+
+    rows = [dict(applicant_id=user_ids[i % applicants], name=f"bench {i}", **random_search(rnd)) for i in range(searches)]
+    saved_search_ids = (await session.execute(
+        insert(SavedSearchDB).returning(SavedSearchDB.saved_search_id, sort_by_parameter_order=True),
+        rows
+    )).scalars().all()
+
+    await session.execute(
+        insert(SavedSearchTermDB),
+        [
+            dict(term=term, saved_search_id=saved_search_id)
+            for saved_search_id, row in zip(saved_search_ids, rows)
+            for term in saved_search_terms(row["profession"], row["salary_currency"], row["type_of_employment"])
+        ]
+    )
+
+
+async def main(searches: int, vacancies: int, seed_value: int) -> None:
+    rnd = random.Random(seed_value)
+    engine = create_async_engine(make_connection_string(config.db))
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+
+        await seed(session, searches, rnd)
+        await session.flush()
+        await conn.exec_driver_sql("ANALYZE saved_searches, saved_search_terms")
+        print(f"{searches} saved searches, {vacancies} new vacancies")
+
+        new_vacancies = [random_vacancy(rnd, i) for i in range(vacancies)]
+        users = UserDB.__table__
+        all_sql = select(*SAVED_SEARCH_COLUMNS, users.c.email).join(
+            users, users.c.user_id == SavedSearchDB.applicant_id
+        )
+
+        async def check_all(vacancy: AlertVacancyDTODAO) -> tuple[int, int]:
+            # what re-running every search means even without SQL per search: read and check all of them
+            saved = [SavedSearchDTODAO(**row._asdict()) for row in await session.execute(all_sql)]
+            return len(saved), sum(len(names) for names in alerts_by_email(saved, vacancy).values())
+
+        async def check_candidates(vacancy: AlertVacancyDTODAO) -> tuple[int, int]:
+            candidates = await SavedSearchDAO(session).get_candidate_searches(vacancy)
+            return len(candidates), sum(len(names) for names in alerts_by_email(candidates, vacancy).values())
+
+        results = {}
+        for name, check in (("all", check_all), ("reverse", check_candidates)):
+            checked, matched = 0, 0
+            start = time.perf_counter()
+            for vacancy in new_vacancies:
+                vacancy_checked, vacancy_matched = await check(vacancy)
+                checked += vacancy_checked
+                matched += vacancy_matched
+            elapsed = time.perf_counter() - start
+            results[name] = matched
+
+            print(
+                f"{name:<8} {elapsed / vacancies * 1000:9.2f} ms/vacancy "
+                f"{checked / vacancies:10.1f} searches checked {matched / vacancies:8.1f} matched"
+            )
+
+        assert results["all"] == results["reverse"], "reverse index lost matches"
+
+        await session.close()
+        await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--searches", type=int, default=100_000)
+    parser.add_argument("--vacancies", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.searches, args.vacancies, args.seed))
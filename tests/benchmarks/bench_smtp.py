@@ -0,0 +1,134 @@
+"""
+Email throughput of worker: new SMTP connection and login per message vs pooled connection with batches.
+
+Runs against a local stand-in SMTP server, handshake and auth latency of a real server are emulated by
+--connect-ms and --auth-ms, nothing is delivered anywhere.
+
+    python -m tests.benchmarks.bench_smtp --messages 500 --connect-ms 40 --auth-ms 20 --batch 100
+"""
+import argparse
+import smtplib
+import socketserver
+import threading
+import time
+from email.message import EmailMessage
+
+from src.infrastructure.notifications.config import NotificationConfig
+from src.infrastructure.notifications.smtp_pool import SMTPPool
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Enough of SMTP for smtplib: EHLO, AUTH PLAIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT.
+    """
+    connect_delay = 0.0
+    auth_delay = 0.0
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        time.sleep(self.connect_delay)
+        self.reply("220 stand-in ESMTP")
+
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-stand-in")
+                self.reply("250 AUTH PLAIN")
+
+            elif command.startswith("AUTH"):
+                time.sleep(self.auth_delay)
+                self.reply("235 authenticated")
+
+            elif command == "DATA":
+                self.reply("354 end with .")
+                while self.rfile.readline().rstrip(b"\r\n") != b".":
+                    pass
+                self.server.delivered += 1
+                self.reply("250 queued")
+
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+
+            else:
+                self.reply("250 ok")
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    delivered = 0
+
+
+def make_messages(count: int) -> list[EmailMessage]:
+    messages = []
+    for i in range(count):
+        message = EmailMessage()
+        message["From"] = "bench@localhost"
+        message["To"] = f"user{i}@localhost"
+        message["Subject"] = "Статус отклика изменён"
+        message.set_content("Вам пришло сообщение от компании.\nСсылка на чат")
+        messages.append(message)
+    return messages
+
+
+def send_per_message(config: NotificationConfig, messages: list[EmailMessage]) -> None:
+    # the way worker sent emails before the pool: connection and login for every message
+    for message in messages:
+        with smtplib.SMTP(config.smtp_server, config.smtp_port, timeout=config.smtp_timeout) as smtp:
+            smtp.login(config.smtp_user, config.smtp_password)
+            smtp.send_message(message)
+
+
+def send_pooled(config: NotificationConfig, messages: list[EmailMessage], batch: int) -> None:
+    pool = SMTPPool(config)
+    for start in range(0, len(messages), batch):
+        pool.send_messages(messages[start:start + batch])
+    pool.close()
+
+
+def measure(name: str, server: StandInSMTPServer, count: int, send) -> None:
+    server.delivered = 0
+    start = time.perf_counter()
+    send()
+    elapsed = time.perf_counter() - start
+
+    assert server.delivered == count, f"{name}: delivered {server.delivered} of {count}"
+    print(f"{name:>12}: {count / elapsed:8.1f} messages/s, {elapsed / count * 1000:7.2f} ms per message")
+
+
+def main(messages: int, connect_ms: float, auth_ms: float, batch: int) -> None:
+    StandInSMTPHandler.connect_delay = connect_ms / 1000
+    StandInSMTPHandler.auth_delay = auth_ms / 1000
+
+    with StandInSMTPServer(("127.0.0.1", 0), StandInSMTPHandler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        config = NotificationConfig(
+            smtp_server="127.0.0.1",
+            smtp_port=server.server_address[1],
+            smtp_user="bench",
+            smtp_password="bench",
+            mail_from="bench@localhost",
+            smtp_use_ssl=False,
+        )
+        emails = make_messages(messages)
+
+        print(f"{messages} messages, connect {connect_ms} ms, auth {auth_ms} ms, batch {batch}")
+        measure("per message", server, messages, lambda: send_per_message(config, emails))
+        measure("pooled", server, messages, lambda: send_pooled(config, emails, batch))
+
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--connect-ms", type=float, default=40)
+    parser.add_argument("--auth-ms", type=float, default=20)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.messages, args.connect_ms, args.auth_ms, args.batch)
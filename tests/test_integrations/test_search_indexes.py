@@ -0,0 +1,95 @@
+import pytest
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.config_reader import config
+from src.core.enums import Currency, SkillsMatch
+from src.infrastructure.db.dao.company.company_dao import CompanyQueryBuilder
+from src.infrastructure.db.dao.resume.resume_dao import ResumeQueryBuilder
+from src.infrastructure.db.dao.vacancy.vacancy_dao import VacancyQueryBuilder
+from src.infrastructure.db.utils.connection_string_maker import make_connection_string
+
+
+RESUME_FILTERS = dict.fromkeys((
+    "name_resume", "location", "profession", "gender", "type_of_employment", "salary_min",
+    "salary_max", "salary_currency", "min_age", "max_age", "start_experience_years", "end_experience_years",
+))
+VACANCY_FILTERS = dict.fromkeys((
+    "profession", "location", "salary_min", "salary_max", "salary_currency",
+    "type_of_employment", "type_work_schedule", "experience_start", "experience_end",
+))
+
+
+def resume_query(**filters) -> Select:
+    return ResumeQueryBuilder().get_query(**{**RESUME_FILTERS, **filters})
+
+
+def vacancy_query(**filters) -> Select:
+    return VacancyQueryBuilder().get_query(**{**VACANCY_FILTERS, **filters})
+
+
+async def explain(query: Select) -> str:
+    engine = create_async_engine(make_connection_string(config.db))
+
+    try:
+        async with engine.connect() as conn:
+            # test database is tiny, so seq scan is always cheaper; here is checked that index CAN be used
+            await conn.execute(text("SET enable_seqscan = off"))
+            await conn.execute(text("SET enable_indexscan = off"))
+            # dialect knows how to escape literals only after it was connected
+            sql = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+            result = await conn.exec_driver_sql(f"EXPLAIN {sql}")
+            return "\n".join(result.scalars().all())
+
+    except OSError as exc:
+        pytest.skip(f"Postgres is not available: {exc}")
+
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query, index_name",
+    [
+        (resume_query(name_resume="Dev"), "ix_resumes_name_resume_trgm"),
+        (resume_query(location="Minsk"), "ix_resumes_location_trgm"),
+        (resume_query(profession="python"), "ix_resumes_profession_trgm"),
+        (CompanyQueryBuilder().get_query(company_name="soft", limit=25), "ix_companies_company_name_trgm"),
+        (vacancy_query(profession="python"), "ix_vacancies_profession_trgm"),
+        (vacancy_query(location="Minsk"), "ix_vacancies_location_trgm"),
+    ]
+)
+async def test_substring_filter_uses_trigram_index(query, index_name):
+    plan = await explain(query)
+
+    assert index_name in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query, index_name",
+    [
+        (resume_query(skills=["python", "sql"]), "ix_resume_skills_skill_id_resume_id"),
+        (vacancy_query(skills=["python", "sql"], skills_match=SkillsMatch.ANY), "ix_vacancy_skills_skill_id_vacancy_id"),
+    ]
+)
+async def test_skills_filter_uses_skill_index(query, index_name):
+    plan = await explain(query)
+
+    assert index_name in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query, index_name",
+    [
+        (resume_query(salary_min=2000, salary_currency=Currency.USD), "ix_resumes_salary_range_base"),
+        (vacancy_query(salary_min=1000, salary_max=6000, salary_currency=Currency.BYN), "ix_vacancies_salary_range_base"),
+    ]
+)
+async def test_salary_filter_uses_range_index(query, index_name):
+    plan = await explain(query)
+
+    assert index_name in plan
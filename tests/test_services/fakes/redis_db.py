@@ -16,3 +16,10 @@ class FakeRedisDB(IRedisDB):
 
     async def exists(self, key: str) -> bool:
         return key in self._redis.get
+
+    async def incr(self, key: str) -> int:
+        self._redis[key] = int(self._redis.get(key, 0)) + 1
+        return self._redis[key]
+
+    async def delete(self, key: str) -> None:
+        self._redis.pop(key, None)
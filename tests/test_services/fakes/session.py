@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+from typing import Any
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict]):
+        self._rows = [SimpleNamespace(**row) for row in rows]
+        self._scalars = [next(iter(row.values())) for row in rows]
+
+    def one_or_none(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def scalar_one_or_none(self) -> Any:
+        return self._scalars[0] if self._scalars else None
+
+    def all(self) -> list[Any]:
+        return self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class CountingSession:
+    """
+    Session of DAO which counts round trips to database, every execute returns the next of results.
+    """
+
+    def __init__(self, *results: list[dict]):
+        self.statements = []
+        self._results = list(results)
+
+    async def execute(self, statement, *args, **kwargs) -> FakeResult:
+        self.statements.append(statement)
+        return FakeResult(self._results.pop(0) if self._results else [])
@@ -0,0 +1,78 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.handlers.company.company import company_router
+from src.api.handlers.exceptions.common_exc_handlers import search_exception_handler
+from src.api.handlers.resume.resume import resume_router
+from src.api.handlers.vacancy.vacancy import vacancy_router
+from src.api.providers.abstract.services import (
+    company_service_provider,
+    resume_service_provider,
+    vacancy_service_provider
+)
+from src.exceptions.services.search import InvalidCursor, SearchException
+from src.infrastructure.db.dao.company.company_dao import CompanyDAO
+from src.infrastructure.db.dao.resume.resume_dao import ResumeDAO
+from src.infrastructure.db.dao.vacancy.vacancy_dao import VacancyDAO
+from src.services.company.company import CompanyService
+from src.services.resume.resume import ResumeService
+from src.services.vacancy.vacancy import VacancyService
+from src.utils.cursor import decode_cursor, encode_cursor
+from test_services.fakes.session import CountingSession
+
+
+def test_cursor_round_trip():
+    updated_at = datetime(2026, 3, 1, 12, 30, 15, 123456)
+
+    cursor = encode_cursor(updated_at, Decimal("1234.50"), 42)
+
+    assert decode_cursor(cursor, datetime.fromisoformat, Decimal, int) == [updated_at, Decimal("1234.50"), 42]
+    assert cursor.isascii() and "=" not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor("python", 42)[:-1] + "A",  # tampered: last key is no longer an int
+        encode_cursor("not a number", 42),  # tampered: first key can't be converted
+        encode_cursor("python", 42)[:-4],  # truncated
+        encode_cursor("python", 42, 7),  # wrong arity
+        encode_cursor(42),  # wrong arity
+        "курсор",  # non-ASCII
+        "%%%",
+    ]
+)
+def test_broken_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, int, int)
+
+
+def search_app() -> FastAPI:
+    tm = SimpleNamespace(
+        vacancy_dao=VacancyDAO(CountingSession()),
+        resume_dao=ResumeDAO(CountingSession()),
+        company_dao=CompanyDAO(CountingSession()),
+    )
+    app = FastAPI()
+    for router in (vacancy_router, resume_router, company_router):
+        app.include_router(router)
+    app.add_exception_handler(SearchException, search_exception_handler)  # type: ignore
+    app.dependency_overrides[vacancy_service_provider] = lambda: VacancyService(tm)
+    app.dependency_overrides[resume_service_provider] = lambda: ResumeService(tm)
+    app.dependency_overrides[company_service_provider] = lambda: CompanyService(tm, None, None, None)
+    return app
+
+
+@pytest.mark.parametrize("path", ["/vacancies/search", "/resumes/search", "/companies"])
+@pytest.mark.parametrize("cursor", [encode_cursor(42)[:-2], encode_cursor("python", 42, 7), "курсор"])
+def test_search_endpoints_reject_broken_cursor(path, cursor):
+    with TestClient(search_app()) as client:
+        response = client.get(path, params={"cursor": cursor})
+
+    assert response.status_code == 400
+    assert "Cursor" in response.json()["message"]
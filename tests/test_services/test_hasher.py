@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.hasher import Hasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_in_pool():
+    hasher = Hasher(max_workers=1)
+
+    hashed = await hasher.hash("password")
+
+    assert await hasher.verify("password", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.stats().queued == 0
+
+
+@pytest.mark.asyncio
+async def test_stats_count_queued_calls():
+    hasher = Hasher(max_workers=1)
+    hasher.hasher.verify = lambda row, hashed_row: time.sleep(0.05) or True
+
+    checks = [asyncio.create_task(hasher.verify("password", "hash")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    stats = hasher.stats()
+
+    assert (stats.max_workers, stats.running, stats.queued) == (1, 1, 2)
+    assert await asyncio.gather(*checks) == [True, True, True]
+    assert hasher.stats().running == 0
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_down_pool():
+    hasher = Hasher(max_workers=1)
+    await hasher.hash("password")
+    [thread] = hasher._executor._threads
+
+    hasher.close()
+
+    assert not thread.is_alive()
+    with pytest.raises(RuntimeError):
+        await hasher.hash("password")
@@ -0,0 +1,24 @@
+from src.api.providers.lifecycle import Scope, scoped
+
+
+def test_app_scope_builds_once():
+    built = []
+
+    @scoped(Scope.APP)
+    def get_object():
+        built.append(object())
+        return built[-1]
+
+    assert get_object() is get_object()
+    assert len(built) == 1
+    assert get_object.scope is Scope.APP
+
+
+def test_request_scope_is_left_to_fastapi_cache():
+    def get_object():
+        return object()
+
+    provider = scoped(Scope.REQUEST)(get_object)
+
+    assert provider is get_object
+    assert provider() is not provider()
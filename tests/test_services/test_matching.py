@@ -0,0 +1,55 @@
+import numpy as np
+
+from src.dto.db.recommendation.recommendation import MatchResumeDTODAO, MatchVacancyDTODAO
+from src.utils.matching import Vocabulary, resume_features, vacancy_features, score_matrix, top_n_by_group
+
+
+VACANCIES = [
+    MatchVacancyDTODAO(
+        vacancy_id=10, profession="Python developer", location="Minsk",
+        salary_min_base=1500, salary_max_base=2500, experience_start=2, experience_end=5, skill_ids=[1, 2, 3],
+    ),
+    MatchVacancyDTODAO(
+        vacancy_id=20, profession="Accountant", location="Brest",
+        salary_min_base=500, salary_max_base=700, experience_start=5, experience_end=None, skill_ids=[7],
+    ),
+    MatchVacancyDTODAO(vacancy_id=30, profession="Python team lead", skill_ids=[]),
+]
+
+
+def test_score_matrix_prefers_matching_vacancy():
+    vocabulary = Vocabulary()
+    resumes = resume_features(
+        [
+            MatchResumeDTODAO(
+                resume_id=1, applicant_id=1, profession="python developer", location="minsk ",
+                salary_min_base=2000, total_experience_months=36, skill_ids=[1, 2],
+            ),
+            MatchResumeDTODAO(resume_id=2, applicant_id=2, profession="accountant", skill_ids=None),
+        ],
+        vocabulary
+    )
+
+    scores = score_matrix(resumes, vacancy_features(VACANCIES, vocabulary))
+
+    assert scores.shape == (2, 3)
+    assert scores.min() >= 0 and scores.max() <= 1
+    assert scores[0].argmax() == 0
+    assert scores[1].argmax() == 1
+
+
+def test_top_n_by_group_takes_best_resume_of_applicant():
+    scores = np.array(
+        [
+            [0.1, 0.9, 0.2],
+            [0.8, 0.1, 0.3],  # second resume of applicant 5
+            [0.2, 0.3, 0.4],
+        ],
+        dtype=np.float32
+    )
+
+    groups, columns, top = top_n_by_group(scores, np.array([5, 5, 7]), n=2)
+
+    assert groups.tolist() == [5, 5, 7, 7]
+    assert columns.tolist() == [1, 0, 2, 1]
+    assert np.allclose(top, [0.9, 0.8, 0.4, 0.3])
@@ -0,0 +1,59 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.handlers.metrics.metrics import metrics_router
+from src.api.providers.abstract.services import metrics_service_provider
+from src.dto.web.auth import ActiveUser, AnonymousUser
+from src.infrastructure.redis_db.search_cache import SearchCache
+from src.services.metrics.metrics import MetricsService
+from test_services.fakes.redis_db import FakeRedisDB
+
+
+def active_user(is_admin: bool = False, is_superuser: bool = False) -> ActiveUser:
+    return ActiveUser(
+        user_id=1,
+        first_name="Ivan",
+        last_name="Ivanov",
+        email="ivan@example.com",
+        is_admin=is_admin,
+        is_superuser=is_superuser,
+        type="company"
+    )
+
+
+def metrics_app(user: ActiveUser | AnonymousUser) -> FastAPI:
+    app = FastAPI()
+    app.include_router(metrics_router)
+    app.dependency_overrides[metrics_service_provider] = lambda: MetricsService(
+        search_cache=SearchCache(FakeRedisDB({}), ttl=30)
+    )
+
+    # stands for AuthenticationMiddleware
+    @app.middleware("http")
+    async def authenticate(request: Request, call_next):
+        request.state.user = user
+        return await call_next(request)
+
+    return app
+
+
+@pytest.mark.parametrize("path", ["/metrics/search-cache", "/metrics/pools", "/metrics/hasher"])
+@pytest.mark.parametrize(
+    ("user", "status_code"),
+    [(AnonymousUser(), 401), (active_user(), 403)]
+)
+def test_metrics_are_closed_to_non_admins(path, user, status_code):
+    with TestClient(metrics_app(user)) as client:
+        response = client.get(path)
+
+    assert response.status_code == status_code
+
+
+@pytest.mark.parametrize("user", [active_user(is_admin=True), active_user(is_superuser=True)])
+def test_metrics_are_open_to_admins(user):
+    with TestClient(metrics_app(user)) as client:
+        response = client.get("/metrics/search-cache")
+
+    assert response.status_code == 200
+    assert {stats["hits"] for stats in response.json()} == {0}
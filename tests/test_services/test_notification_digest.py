@@ -0,0 +1,59 @@
+import pytest
+
+from src.utils.notification_digest import DIGEST_SEPARATOR, digest_email
+
+
+def test_single_notification_is_sent_as_is():
+    notification = {"subject": "С Вами хотят связаться", "body": "Вам пришло сообщение от компании."}
+
+    assert digest_email([notification]) == notification
+
+
+def test_notifications_are_merged_in_order():
+    email = digest_email([
+        {"subject": "Статус", "body": "просмотрен"},
+        {"subject": "Статус", "body": "отклонён"},
+    ])
+
+    assert email["subject"] == "У вас 2 новых уведомлений"
+    assert email["body"].split(DIGEST_SEPARATOR) == ["Статус\nпросмотрен", "Статус\nотклонён"]
+
+
+@pytest.mark.asyncio
+async def test_unsent_digests_of_every_template_are_put_back(monkeypatch):
+    from src.infrastructure.celery import tasks
+
+    item = {"subject": "Статус", "body": "просмотрен"}
+    added = []
+
+    class FakeRedis:
+        async def aclose(self):
+            pass
+
+    class FakeDigest:
+        def __init__(self, redis, window):
+            self._due = [[
+                ("send_message_about_change_status", "a@mail.ru", [item]),
+                ("send_respond_notification", "b@mail.ru", [item, item]),
+            ]]
+
+        async def pop_due(self, limit):
+            return self._due.pop() if self._due else []
+
+        async def add(self, template, messages):
+            added.append((template, messages))
+
+    class FailingEmailNotifications:
+        def send_many(self, template, messages):
+            raise ConnectionError("broker is down")
+
+    monkeypatch.setattr(tasks, "get_redis_connections", lambda redis_config: FakeRedis())
+    monkeypatch.setattr(tasks, "NotificationDigest", FakeDigest)
+    monkeypatch.setattr(tasks, "EmailNotifications", FailingEmailNotifications)
+
+    await tasks._flush_notification_digests(limit=10)
+
+    assert added == [
+        ("send_message_about_change_status", [("a@mail.ru", item)]),
+        ("send_respond_notification", [("b@mail.ru", item), ("b@mail.ru", item)]),
+    ]
@@ -0,0 +1,65 @@
+import smtplib
+
+from src.infrastructure.db.models import NotificationOutboxDB
+from src.infrastructure.notifications.outbox import OutboxNotifications
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    def add_all(self, instances):
+        self.added.extend(instances)
+
+
+def test_send_adds_row_to_session_of_transaction():
+    session = FakeSession()
+
+    OutboxNotifications(session).send(
+        destination="user@mail.ru",
+        template="confirm_email",
+        data={"subject": "Подтвердите регистрацию", "body": "link"}
+    )
+
+    assert len(session.added) == 1
+    row = session.added[0]
+    assert isinstance(row, NotificationOutboxDB)
+    assert (row.destination, row.template, row.subject, row.body) == (
+        "user@mail.ru", "confirm_email", "Подтвердите регистрацию", "link"
+    )
+
+
+def test_send_many_adds_row_per_message():
+    session = FakeSession()
+
+    OutboxNotifications(session).send_many(
+        template="send_message_about_change_status",
+        messages=[
+            ("first@mail.ru", {"subject": "s", "body": "b"}),
+            ("second@mail.ru", {"subject": "s", "body": "b"}),
+        ]
+    )
+
+    assert [row.destination for row in session.added] == ["first@mail.ru", "second@mail.ru"]
+    assert {row.template for row in session.added} == {"send_message_about_change_status"}
+
+
+def test_email_is_retried_after_smtp_error(monkeypatch):
+    from src.infrastructure.celery import tasks
+
+    attempts = []
+
+    class FakeEmailNotifications:
+        def send_(self, destination, subject, body):
+            attempts.append(destination)
+            if len(attempts) == 1:
+                raise smtplib.SMTPServerDisconnected("connection closed")
+
+    monkeypatch.setattr(tasks, "EmailNotifications", FakeEmailNotifications)
+
+    tasks.send_respond_notification.apply(args=("a@mail.ru", "subject", "body")).get()
+
+    assert attempts == ["a@mail.ru", "a@mail.ru"]
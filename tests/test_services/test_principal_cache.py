@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config_reader import config
+from src.dto.db.user.user import AuthUserDTODAO
+from src.dto.services.user.user import UpdateUserDTO
+from src.exceptions.services.auth import RefreshTokenNotValid
+from src.infrastructure.auth import principal_cache as principal_cache_module
+from src.infrastructure.auth.principal_cache import PrincipalCache
+from src.services.user.auth import RefreshAccessToken
+from src.services.user.user import UserService
+
+
+def make_principal(user_id: int, is_admin: bool = False) -> AuthUserDTODAO:
+    return AuthUserDTODAO(
+        user_id=user_id,
+        email=f"user{user_id}@mail.ru",
+        first_name="first",
+        last_name="last",
+        is_admin=is_admin,
+        is_superuser=False,
+        type="applicant"
+    )
+
+
+class FakeUserDAO:
+    def __init__(self, *principals: AuthUserDTODAO):
+        self._principals = {principal.user_id: principal for principal in principals}
+        self.loaded = 0
+
+    async def get_auth_user_by_id(self, user_id: int) -> AuthUserDTODAO | None:
+        self.loaded += 1
+        return self._principals.get(user_id)
+
+
+class FakeAuth:
+    def __init__(self, token_data: dict | None):
+        self._token_data = token_data
+        self.access_token_data = None
+
+    async def read_token(self, token_type: str) -> dict | None:
+        assert token_type == config.auth.refresh_token_name
+        return self._token_data
+
+    async def set_access_token(self, user: dict) -> None:
+        self.access_token_data = user
+
+
+def test_principal_expires_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", lambda: now[0])
+    cache = PrincipalCache(ttl=30, max_size=10)
+
+    cache.set(make_principal(1))
+    now[0] += 29
+
+    assert cache.get(1).user_id == 1
+
+    now[0] += 1
+
+    assert cache.get(1) is None
+
+
+def test_least_recently_used_principal_is_evicted():
+    cache = PrincipalCache(ttl=30, max_size=2)
+
+    cache.set(make_principal(1))
+    cache.set(make_principal(2))
+    cache.get(1)
+    cache.set(make_principal(3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None and cache.get(3) is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_issues_access_token_with_current_principal():
+    user_dao = FakeUserDAO(make_principal(1, is_admin=False))
+    tm = SimpleNamespace(user_dao=user_dao)
+    cache = PrincipalCache(ttl=30, max_size=10)
+    refresh = RefreshAccessToken(tm, hasher=None)
+
+    for _ in range(3):
+        auth = FakeAuth({"user_id": 1, "is_admin": True})
+        await refresh(auth, cache)
+
+        assert auth.access_token_data["is_admin"] is False
+
+    assert user_dao.loaded == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_of_deleted_user_is_rejected():
+    tm = SimpleNamespace(user_dao=FakeUserDAO())
+
+    with pytest.raises(RefreshTokenNotValid):
+        await RefreshAccessToken(tm, hasher=None)(FakeAuth({"user_id": 1}), PrincipalCache(ttl=30, max_size=10))
+
+
+@pytest.mark.asyncio
+async def test_update_of_user_drops_cached_principal():
+    class FakeUpdateUserDAO:
+        async def update_user(self, user):
+            pass
+
+    class FakeTM:
+        user_dao = FakeUpdateUserDAO()
+        committed = False
+
+        async def commit(self):
+            self.committed = True
+
+    tm = FakeTM()
+    cache = PrincipalCache(ttl=30, max_size=10)
+    cache.set(make_principal(1))
+
+    await UserService(tm, hasher=None, principal_cache=cache).update_user(
+        UpdateUserDTO(user_id=1, first_name="new")
+    )
+
+    assert tm.committed
+    assert cache.get(1) is None
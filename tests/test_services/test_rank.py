@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, select, text
+
+from src.infrastructure.db.utils.rank import RANK_TIER_STEP, raised_rank_score, retiered_rank_score
+
+
+RAISED_IN_2000 = int(datetime(2000, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def _extract(field: str, value: str) -> float:
+    # EXTRACT(epoch FROM now()) of Postgres, CURRENT_TIMESTAMP of SQLite is UTC text
+    assert field == "epoch"
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def register_extract(dbapi_connection, _):
+        dbapi_connection.create_function("extract", 2, _extract)
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE vacancies (vacancy_id INTEGER PRIMARY KEY, rank_score BIGINT)"))
+        yield conn
+
+
+def retiered(connection, rank_score: int, vacancy_type_name: str | None) -> int:
+    connection.execute(text("DELETE FROM vacancies"))
+    connection.execute(text("INSERT INTO vacancies VALUES (1, :rank_score)"), {"rank_score": rank_score})
+    return connection.execute(select(retiered_rank_score(vacancy_type_name))).scalar()
+
+
+def test_tier_outranks_time_of_raise(connection):
+    free_now = connection.execute(select(raised_rank_score("free"))).scalar()
+    paid_now = connection.execute(select(raised_rank_score("paid"))).scalar()
+    paid_in_2000 = retiered(connection, RAISED_IN_2000, "paid")
+    premium_in_2000 = retiered(connection, RAISED_IN_2000, "premium")
+
+    assert premium_in_2000 > paid_now > paid_in_2000 > free_now
+    assert free_now % RANK_TIER_STEP > RAISED_IN_2000
+
+
+def test_change_of_tier_keeps_time_of_last_raise(connection):
+    premium = 2 * RANK_TIER_STEP + RAISED_IN_2000
+
+    assert retiered(connection, premium, "free") == RAISED_IN_2000
+    assert retiered(connection, premium, "paid") == RANK_TIER_STEP + RAISED_IN_2000
+    assert retiered(connection, RAISED_IN_2000, "premium") == premium
+    # unknown type is ranked as free
+    assert retiered(connection, premium, None) == RAISED_IN_2000
@@ -0,0 +1,56 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.dto.db.recommendation.recommendation import RecommendationDTODAO
+from src.infrastructure.db.dao.recommendation.recommendation_dao import RecommendationDAO
+from src.infrastructure.db.models import VacancyRecommendationDB
+
+
+@asynccontextmanager
+async def recommendation_session(applicant_ids: list[int]):
+    """
+    SQLite with one recommendation of vacancy 1 for each of applicant_ids.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(VacancyRecommendationDB.__table__.create)
+        for applicant_id in applicant_ids:
+            await conn.execute(
+                text("INSERT INTO vacancy_recommendations VALUES (:applicant_id, 1, 0.5, CURRENT_TIMESTAMP)"),
+                {"applicant_id": applicant_id}
+            )
+
+    async with AsyncSession(engine) as session:
+        yield session
+
+    await engine.dispose()
+
+
+async def recommended(session: AsyncSession) -> dict[int, int]:
+    result = await session.execute(text("SELECT applicant_id, vacancy_id FROM vacancy_recommendations"))
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_applicants_left_out_of_run_lose_recommendations():
+    async with recommendation_session([1, 2, 3, 5]) as session:
+        dao = RecommendationDAO(session)
+
+        # applicants 2 and 5 unpublished every resume, so chunks hold only 1 and 3
+        await dao.replace_recommendations(0, [1], [RecommendationDTODAO(applicant_id=1, vacancy_id=7, score=0.9)])
+        await dao.replace_recommendations(1, [3], [RecommendationDTODAO(applicant_id=3, vacancy_id=8, score=0.8)])
+        await dao.delete_recommendations_after(3)
+
+        assert await recommended(session) == {1: 7, 3: 8}
+
+
+@pytest.mark.asyncio
+async def test_run_without_resumes_drops_all_recommendations():
+    async with recommendation_session([1, 2]) as session:
+        await RecommendationDAO(session).delete_recommendations_after(0)
+
+        assert await recommended(session) == {}
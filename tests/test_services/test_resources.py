@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from redis.asyncio import BlockingConnectionPool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from src.dto.services.metrics.metrics import PoolStatsDTO
+from src.infrastructure.connections import _connect_args, create_db_engine, get_redis_connections
+from src.infrastructure.db.pool import MeteredQueuePool
+from src.infrastructure.db_config import DBConfig
+from src.infrastructure.redis_db.config import RedisConfig
+from src.infrastructure.resources import AppResources
+from src.interfaces.infrastructure.resources import IResources
+from src.services.metrics.metrics import MetricsService
+
+
+class FakeResources(IResources):
+    def __init__(self):
+        self.closed = False
+
+    def pool_stats(self) -> list[PoolStatsDTO]:
+        return [PoolStatsDTO(name="db", size=5, in_use=1, idle=4)]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_requests_share_redis_client_of_app():
+    from src.api.providers.common import redis_pool_getter
+
+    resources = SimpleNamespace(redis=object())
+    get_pool_redis = redis_pool_getter(resources)
+
+    assert get_pool_redis() is get_pool_redis() is resources.redis
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_of_app_resources():
+    metrics_service = MetricsService(search_cache=None, resources=FakeResources())
+
+    stats = await metrics_service.get_pool_stats()
+
+    assert [(s.name, s.in_use, s.idle) for s in stats] == [("db", 1, 4)]
+
+
+@pytest.mark.asyncio
+async def test_db_pool_counts_checkouts():
+    pool = MeteredQueuePool(MagicMock, pool_size=1, max_overflow=1, timeout=0.01)
+
+    connections = [await greenlet_spawn(pool.connect) for _ in range(2)]
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    assert (pool.checkouts, pool.overflow_checkouts, pool.checkout_timeouts) == (2, 1, 1)
+    assert pool.checkout_wait_max >= 0
+
+    for connection in connections:
+        connection.close()
+
+    assert pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_db_pool_counts_timeouts_without_overflow():
+    pool = MeteredQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+
+    connection = await greenlet_spawn(pool.connect)
+    for _ in range(2):
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+
+    assert (pool.checkouts, pool.overflow_checkouts, pool.checkout_timeouts) == (1, 0, 2)
+    assert 0 <= pool.checkout_wait_max <= pool.checkout_wait_total
+
+    connection.close()
+    connection = await greenlet_spawn(pool.connect)
+
+    assert (pool.checkouts, pool.checkout_timeouts) == (2, 2)
+    connection.close()
+
+
+def db_config(**kwargs) -> DBConfig:
+    return DBConfig(
+        host="localhost", user="user", password="password", db_name="db", port=5432, **kwargs
+    )
+
+
+def test_asyncpg_gets_statement_cache_and_timeout():
+    config = db_config(driver="postgresql+asyncpg", statement_cache_size=0, statement_timeout_ms=5000)
+
+    assert _connect_args(config) == {
+        "statement_cache_size": 0,
+        "server_settings": {"statement_timeout": "5000"},
+    }
+    assert _connect_args(db_config(driver="postgresql+asyncpg")) == {"statement_cache_size": 100}
+
+
+def test_connect_args_are_left_out_for_other_drivers():
+    config = db_config(driver="postgresql+psycopg", statement_cache_size=0, statement_timeout_ms=5000)
+
+    assert _connect_args(config) == {}
+
+
+@pytest.mark.asyncio
+async def test_db_engine_uses_metered_pool():
+    engine = create_db_engine(db_config(driver="postgresql+asyncpg", pool_size=3, max_overflow=2))
+
+    assert isinstance(engine.pool, MeteredQueuePool)
+    assert (engine.pool.size(), engine.pool._max_overflow) == (3, 2)
+    await engine.dispose()
+
+
+def test_redis_pool_waits_for_connections():
+    redis = get_redis_connections(RedisConfig(host="localhost", port=6379, db=0, max_connections=7, pool_timeout=3))
+    pool = redis.connection_pool
+
+    assert isinstance(pool, BlockingConnectionPool)
+    assert (pool.max_connections, pool.timeout) == (7, 3)
+
+
+@pytest.mark.asyncio
+async def test_app_resources_close_shuts_down_hasher():
+    resources = AppResources(SimpleNamespace(
+        db=db_config(driver="postgresql+asyncpg"),
+        redis=RedisConfig(host="localhost", port=6379, db=0),
+        auth=SimpleNamespace(hash_workers=1),
+    ))
+    await resources.hasher.hash("password")
+
+    await resources.close()
+
+    with pytest.raises(RuntimeError):
+        await resources.hasher.hash("password")
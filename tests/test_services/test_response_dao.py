@@ -0,0 +1,112 @@
+from datetime import datetime
+
+import pytest
+
+from src.core.enums import ActorType, StatusRespond
+from src.dto.db.response.response import BaseResponseDTODAO
+from src.dto.db.resume.resume import BaseResumeDTODAO
+from src.dto.db.vacancy.vacancy import BaseVacancyDTODAO
+from src.exceptions.infrascructure.response.response import ResponsePermissionError
+from src.infrastructure.db.dao.response.response import ResponseDAO
+from test_services.fakes.session import CountingSession
+
+
+def applicant_respond() -> BaseResponseDTODAO:
+    return BaseResponseDTODAO(
+        user_id=1,
+        vacancy=BaseVacancyDTODAO(company=None, vacancy_id=2),
+        resume=BaseResumeDTODAO(applicant=None, resume_id=3),
+        responder_type=ActorType.APPLICANT,
+        status=StatusRespond.SENT,
+        message="hello"
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_respond_is_one_round_trip():
+    session = CountingSession([
+        dict(
+            response_id=10,
+            response_date=datetime(2026, 1, 1),
+            vacancy_title="Python developer",
+            company_name="Soft",
+            company_email="company@mail.ru",
+            applicant_email="applicant@mail.ru",
+        )
+    ])
+
+    respond = await ResponseDAO(session).create_respond(applicant_respond())
+
+    assert len(session.statements) == 1
+    assert respond.response_id == 10
+    assert respond.vacancy.company.user.email == "company@mail.ru"
+    assert respond.resume.applicant.user.email == "applicant@mail.ru"
+
+
+@pytest.mark.asyncio
+async def test_create_respond_on_foreign_resume_is_denied():
+    session = CountingSession([])
+
+    with pytest.raises(ResponsePermissionError):
+        await ResponseDAO(session).create_respond(applicant_respond())
+
+    assert len(session.statements) == 1
+
+
+def change_status_respond(responder_type: ActorType) -> BaseResponseDTODAO:
+    return BaseResponseDTODAO(
+        user_id=1,
+        response_id=10,
+        vacancy=BaseVacancyDTODAO(company=None),
+        resume=BaseResumeDTODAO(applicant=None),
+        responder_type=responder_type,
+        status=StatusRespond.ACCEPTED,
+        message="hello"
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_status_respond_is_one_round_trip():
+    session = CountingSession([dict(response_id=10, email="company@mail.ru")])
+
+    respond = await ResponseDAO(session).change_status_respond(change_status_respond(ActorType.APPLICANT))
+
+    assert len(session.statements) == 1
+    assert respond.vacancy.company.user.email == "company@mail.ru"
+
+
+@pytest.mark.asyncio
+async def test_change_status_of_foreign_respond_is_denied():
+    session = CountingSession([])
+
+    with pytest.raises(ResponsePermissionError):
+        await ResponseDAO(session).change_status_respond(change_status_respond(ActorType.COMPANY))
+
+    assert len(session.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_change_status_responds_is_one_round_trip():
+    session = CountingSession([
+        dict(response_id=10, email="first@mail.ru"),
+        dict(response_id=11, email="second@mail.ru"),
+    ])
+
+    responds = await ResponseDAO(session).change_status_responds(
+        change_status_respond(ActorType.COMPANY),
+        [10, 11, 11]
+    )
+
+    assert len(session.statements) == 1
+    assert [(respond.response_id, respond.resume.applicant.user.email) for respond in responds] == [
+        (10, "first@mail.ru"),
+        (11, "second@mail.ru"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_change_status_responds_with_foreign_respond_is_denied():
+    session = CountingSession([dict(response_id=10, email="first@mail.ru")])
+
+    with pytest.raises(ResponsePermissionError):
+        await ResponseDAO(session).change_status_responds(change_status_respond(ActorType.COMPANY), [10, 11])
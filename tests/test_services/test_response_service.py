@@ -0,0 +1,61 @@
+import pytest
+
+from src.core.enums import ActorType
+from src.dto.db.applicant.applicant import BaseApplicantDTODAO
+from src.dto.db.company.company import BaseCompanyDTODAO
+from src.dto.db.response.response import BaseResponseDTODAO
+from src.dto.db.resume.resume import BaseResumeDTODAO
+from src.dto.db.user.user import BaseUserDTODAO
+from src.dto.db.vacancy.vacancy import BaseVacancyDTODAO
+from src.dto.services.response.response import CreateResponseDTO
+from src.services.response.response import CreateResponseByApplicant, CreateResponseByCompany
+from test_services.fakes.notification import FakeNotifications
+
+
+class FakeResponseDAO:
+    async def create_respond(self, respond: BaseResponseDTODAO) -> BaseResponseDTODAO:
+        respond.response_id = 10
+        respond.vacancy.title = "Python developer"
+        respond.vacancy.company = BaseCompanyDTODAO(
+            user=BaseUserDTODAO(email="company@example.com"),
+            company_name="Soft"
+        )
+        respond.resume.applicant = BaseApplicantDTODAO(user=BaseUserDTODAO(email="applicant@example.com"))
+        return respond
+
+
+class FakeResponseTM:
+    def __init__(self):
+        self.committed = False
+        self.respond_dao = FakeResponseDAO()
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+
+def create_response_dto(responder_type: ActorType) -> CreateResponseDTO:
+    return CreateResponseDTO(user_id=1, vacancy_id=2, resume_id=3, responder_type=responder_type, message="hello")
+
+
+@pytest.mark.asyncio
+async def test_response_of_company_is_sent_to_applicant():
+    tm, notifications = FakeResponseTM(), FakeNotifications()
+
+    await CreateResponseByCompany(tm)(create_response_dto(ActorType.COMPANY), notifications)
+
+    assert list(notifications.sent) == ["applicant@example.com"]
+    assert "Soft" in notifications.sent["applicant@example.com"]["subject"]
+    assert tm.committed
+
+
+@pytest.mark.asyncio
+async def test_response_of_applicant_is_sent_to_company():
+    tm, notifications = FakeResponseTM(), FakeNotifications()
+
+    await CreateResponseByApplicant(tm)(create_response_dto(ActorType.APPLICANT), notifications)
+
+    assert list(notifications.sent) == ["company@example.com"]
+    assert tm.committed
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.core.enums import Currency
+from src.dto.db.resume.resume import ResumeFacetsDTODAO
+from src.dto.services.resume.resume import SearchResumeDTO
+from src.infrastructure.db.dao.resume.resume_dao import RESUME_FACETS_BY_GROUPING, ResumeQueryBuilder
+from src.infrastructure.redis_db.search_cache import SearchCache
+from src.services.resume.resume import ResumeService
+from test_services.fakes.redis_db import FakeRedisDB
+
+
+def test_grouping_of_every_grouping_set_is_its_facet():
+    sql = str(ResumeQueryBuilder().get_facets_query(*[None] * 12).compile(dialect=postgresql.dialect()))
+
+    selected = re.search(r"SELECT (.*?), grouping\(", sql).group(1).split(", ")
+    facet_of_column = {
+        column.split(" AS ")[0]: column.split(" AS ")[-1].split(".")[-1]
+        for column in selected
+    }
+    grouping_args = re.search(r"grouping\((.*?)\) AS grouping", sql).group(1).split(", ")
+    grouping_sets = re.findall(r"\(([^()]*)\)", re.search(r"GROUPING SETS\((.*)\)", sql).group(1))
+
+    groupings = {}
+    for grouping_set in grouping_sets:
+        # GROUPING() sets the bit of every argument outside of the set, the first argument is the highest bit
+        grouping = sum(
+            1 << (len(grouping_args) - 1 - i)
+            for i, arg in enumerate(grouping_args)
+            if arg not in grouping_set.split(", ")
+        )
+        groupings[grouping] = facet_of_column[grouping_set]
+
+    assert groupings == RESUME_FACETS_BY_GROUPING
+    assert sorted(groupings.values()) == sorted(ResumeFacetsDTODAO.__dataclass_fields__)
+
+
+class FakeResumeDAO:
+    def __init__(self):
+        self.facets_calls = 0
+
+    async def search_resumes(self, search_dto):
+        return []
+
+    async def get_resume_facets(self, search_dto):
+        self.facets_calls += 1
+        return ResumeFacetsDTODAO(type_of_employment={}, salary_currency={Currency.USD: 3}, gender={}, experience={})
+
+
+class FakeResumeTM:
+    def __init__(self):
+        self.resume_dao = FakeResumeDAO()
+
+
+@pytest.mark.asyncio
+async def test_facets_are_cached_once_for_all_pages():
+    tm = FakeResumeTM()
+    service = ResumeService(tm, SearchCache(FakeRedisDB({}), ttl=30))
+
+    first = await service.search_resumes(SearchResumeDTO(profession="python", limit=25), facets=True)
+    second = await service.search_resumes(
+        SearchResumeDTO(profession="python", limit=50, cursor="next-page"), facets=True
+    )
+
+    assert tm.resume_dao.facets_calls == 1
+    assert first.facets == second.facets
+    assert second.facets.salary_currency == {Currency.USD: 3}
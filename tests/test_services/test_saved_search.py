@@ -0,0 +1,76 @@
+from src.core.enums import Currency, EmploymentType
+from src.dto.db.saved_search.saved_search import SavedSearchDTODAO, AlertVacancyDTODAO
+from src.utils.saved_search import PREDICATES_COUNT, saved_search_terms, vacancy_terms, alerts_by_email
+
+
+VACANCY = AlertVacancyDTODAO(
+    vacancy_id=1, title="Backend", profession="Senior Python developer", location="Minsk",
+    salary_min=2000, salary_max=3000, salary_currency=Currency.USD, salary_min_base=2000, salary_max_base=3000,
+    type_of_employment=[EmploymentType.FULL_TIME, EmploymentType.REMOTE],
+)
+
+
+def search(**kwargs) -> SavedSearchDTODAO:
+    kwargs.setdefault("salary_rate", 1)
+    return SavedSearchDTODAO(applicant_id=1, name=kwargs.pop("name", "search"), email="a@a.io", **kwargs)
+
+
+def test_reverse_index_finds_every_matching_search():
+    matching = [
+        search(),
+        search(profession="python developer", salary_currency=Currency.USD, salary_min=2500),
+        search(type_of_employment=[EmploymentType.REMOTE], location="minsk"),
+    ]
+    other = [
+        search(profession="java engineer"),
+        search(salary_currency=Currency.EUR),
+        search(type_of_employment=[EmploymentType.PART_TIME]),
+    ]
+    terms = set(vacancy_terms(VACANCY))
+
+    for saved_search in matching:
+        indexed = saved_search_terms(
+            saved_search.profession,
+            saved_search.salary_currency,
+            saved_search.type_of_employment,
+            has_salary_bounds=saved_search.salary_min is not None or saved_search.salary_max is not None
+        )
+        assert len(indexed) == PREDICATES_COUNT
+        assert set(indexed) <= terms
+
+    for saved_search in other:
+        indexed = saved_search_terms(
+            saved_search.profession, saved_search.salary_currency, saved_search.type_of_employment
+        )
+        assert not set(indexed) <= terms
+
+
+def test_alerts_check_predicates_out_of_index():
+    alerts = alerts_by_email(
+        [
+            search(name="fits", profession="python developer", salary_max=2500),
+            search(name="salary", profession="python", salary_min=5000),
+            search(name="words", profession="python team lead"),
+            search(name="location", location="Brest"),
+            search(name="employment", type_of_employment=[EmploymentType.REMOTE, EmploymentType.FREELANCE]),
+        ],
+        VACANCY
+    )
+
+    assert alerts == {"a@a.io": ["fits"]}
+
+
+def test_salary_bounds_are_compared_in_base_currency():
+    rub_vacancy = AlertVacancyDTODAO(
+        vacancy_id=2, title="Backend", profession="Python developer",
+        salary_min=200_000, salary_max=300_000, salary_currency=Currency.RUB,
+        salary_min_base=2000, salary_max_base=3000,
+    )
+    # search in EUR with rate 1.1: 2000..2500 EUR is 2200..2750 USD
+    eur_search = search(name="eur", salary_currency=Currency.EUR, salary_min=2000, salary_max=2500, salary_rate=1.1)
+    too_high = search(name="high", salary_currency=Currency.EUR, salary_min=3000, salary_rate=1.1)
+    no_rate = search(name="no rate", salary_currency=Currency.BYN, salary_min=1, salary_rate=None)
+    only_currency = search(name="currency", salary_currency=Currency.EUR)
+
+    assert set(saved_search_terms(None, Currency.EUR, None, has_salary_bounds=True)) <= set(vacancy_terms(rub_vacancy))
+    assert alerts_by_email([eur_search, too_high, no_rate, only_currency], rub_vacancy) == {"a@a.io": ["eur"]}
@@ -0,0 +1,105 @@
+import json
+from datetime import date, datetime
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.enums import Currency, EmploymentType, GenderEnum
+from src.dto.db.applicant.applicant import BaseApplicantDTODAO
+from src.dto.db.resume.resume import BaseResumeDTODAO, SearchDTODAO
+from src.dto.db.user.user import BaseUserDTODAO
+from src.dto.db.work_experience.work_experience import BaseWorkExperienceDTODAO
+from src.infrastructure.redis_db.search_cache import SearchCache, search_hash
+from src.interfaces.infrastructure.search_cache import RESUMES_SEARCH
+from test_services.fakes.redis_db import FakeRedisDB
+
+
+def test_search_hash_is_normalized():
+    first = SearchDTODAO(
+        profession=" Python Developer",
+        location="Minsk",
+        type_of_employment=[EmploymentType.REMOTE, EmploymentType.FULL_TIME],
+    )
+    second = SearchDTODAO(
+        profession="python developer",
+        location="MINSK",
+        type_of_employment=[EmploymentType.FULL_TIME, EmploymentType.REMOTE],
+        salary_min=None,
+    )
+
+    assert search_hash(first) == search_hash(second)
+    assert search_hash(first) != search_hash(SearchDTODAO(profession="python developer"))
+
+
+@pytest.mark.asyncio
+async def test_search_cache_hit_and_invalidate():
+    cache = SearchCache(FakeRedisDB({}), ttl=30)
+    search_dto = SearchDTODAO(profession="python")
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return ["resume"]
+
+    assert await cache.get_or_load(RESUMES_SEARCH, search_dto, loader, list[str]) == ["resume"]
+    assert await cache.get_or_load(RESUMES_SEARCH, search_dto, loader, list[str]) == ["resume"]
+    assert len(loads) == 1
+
+    await cache.invalidate(RESUMES_SEARCH)
+    await cache.get_or_load(RESUMES_SEARCH, search_dto, loader, list[str])
+    assert len(loads) == 2
+
+    stats = await cache.get_stats(RESUMES_SEARCH)
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["generation"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_cache_stores_json_and_rebuilds_dtos():
+    redis = {}
+    cache = SearchCache(FakeRedisDB(redis), ttl=30)
+    search_dto = SearchDTODAO(profession="python")
+    resumes = [
+        BaseResumeDTODAO(
+            applicant=BaseApplicantDTODAO(
+                user=BaseUserDTODAO(user_id=1, first_name="Ivan", created_at=datetime(2024, 5, 1, 12, 30)),
+                gender=GenderEnum.MALE,
+                date_born=date(1999, 1, 2),
+            ),
+            resume_id=10,
+            profession="python developer",
+            salary_min=1000.0,
+            salary_currency=Currency.USD,
+            type_of_employment=EmploymentType.REMOTE,
+            work_experiences=[
+                BaseWorkExperienceDTODAO(resume_id=10, company_name="Acme", start_date=date(2020, 3, 1))
+            ],
+        )
+    ]
+
+    async def loader():
+        return resumes
+
+    await cache.get_or_load(RESUMES_SEARCH, search_dto, loader, list[BaseResumeDTODAO])
+    [cached] = [value for key, value in redis.items() if key.endswith(search_hash(search_dto))]
+    assert json.loads(cached)[0]["applicant"]["user"]["first_name"] == "Ivan"
+
+    hit = await cache.get_or_load(RESUMES_SEARCH, search_dto, loader, list[BaseResumeDTODAO])
+    assert hit == resumes
+    assert hit[0].applicant.gender is GenderEnum.MALE
+    assert hit[0].work_experiences[0].start_date == date(2020, 3, 1)
+
+
+class DownRedisDB(FakeRedisDB):
+    async def get(self, key: str):
+        raise RedisConnectionError("Connection refused")
+
+
+@pytest.mark.asyncio
+async def test_stats_without_redis():
+    cache = SearchCache(DownRedisDB({}), ttl=30)
+
+    stats = await cache.get_stats(RESUMES_SEARCH)
+
+    assert stats == {"scope": RESUMES_SEARCH, "hits": 0, "misses": 0, "generation": 0}
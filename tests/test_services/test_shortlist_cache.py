@@ -0,0 +1,46 @@
+import pytest
+
+from src.dto.db.recommendation.recommendation import MatchResumeDTODAO, MatchVacancyDTODAO
+from src.infrastructure.redis_db.shortlist_cache import ShortlistCache
+from src.utils.matching import SHORTLIST_WEIGHTS, Vocabulary, resume_features, score_matrix, vacancy_features
+from test_services.fakes.redis_db import FakeRedisDB
+
+
+VACANCY = MatchVacancyDTODAO(
+    vacancy_id=10, profession="Python developer", location="Minsk",
+    salary_min_base=1500, salary_max_base=2500, experience_start=2, experience_end=5, skill_ids=[1, 2, 3],
+)
+
+
+def test_shortlist_scores_skills_salary_and_experience_only():
+    vocabulary = Vocabulary()
+    resumes = resume_features(
+        [
+            MatchResumeDTODAO(
+                resume_id=1, applicant_id=1, profession="cook", location="Brest",
+                salary_min_base=2000, total_experience_months=36, skill_ids=[1, 2, 3],
+            ),
+            MatchResumeDTODAO(
+                resume_id=2, applicant_id=2, profession="python developer", location="Minsk",
+                salary_min_base=5000, total_experience_months=0, skill_ids=[1],
+            ),
+        ],
+        vocabulary
+    )
+    scores = score_matrix(resumes, vacancy_features([VACANCY], vocabulary), SHORTLIST_WEIGHTS)[:, 0]
+
+    assert scores[0] == pytest.approx(1.0)
+    assert scores[0] > scores[1]
+
+
+@pytest.mark.asyncio
+async def test_shortlist_cache_set_get_and_invalidate():
+    cache = ShortlistCache(FakeRedisDB({}), ttl=30)
+
+    assert await cache.get(10) is None
+
+    await cache.set(10, [(3, 0.9), (1, 0.5)])
+    assert await cache.get(10) == [(3, 0.9), (1, 0.5)]
+
+    await cache.invalidate(10)
+    assert await cache.get(10) is None
@@ -0,0 +1,121 @@
+import smtplib
+from email.message import EmailMessage
+
+import pytest
+
+from src.infrastructure.notifications import smtp_pool
+from src.infrastructure.notifications.config import NotificationConfig
+from src.infrastructure.notifications.smtp_pool import SMTPPool, SMTPBatchInterrupted
+
+
+class FakeSMTP:
+    connections: list["FakeSMTP"] = []
+    # count of next send_message calls which find the connection dropped
+    disconnects = 0
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.logged_in = False
+        FakeSMTP.connections.append(self)
+
+    def login(self, user, password):
+        self.logged_in = True
+
+    def send_message(self, message):
+        if FakeSMTP.disconnects:
+            FakeSMTP.disconnects -= 1
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.sent.append(message["To"])
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def config() -> NotificationConfig:
+    return NotificationConfig(
+        smtp_server="localhost",
+        smtp_port=25,
+        smtp_user="user",
+        smtp_password="password",
+        mail_from="user@mail.ru",
+        smtp_use_ssl=False
+    )
+
+
+def messages(*destinations: str) -> list[EmailMessage]:
+    result = []
+    for destination in destinations:
+        message = EmailMessage()
+        message["To"] = destination
+        message.set_content("body")
+        result.append(message)
+    return result
+
+
+def test_connection_is_reused_by_batches(monkeypatch):
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", FakeSMTP)
+    FakeSMTP.connections, FakeSMTP.disconnects = [], 0
+    pool = SMTPPool(config())
+
+    assert pool.send_messages(messages("a@mail.ru", "b@mail.ru")) == 2
+    assert pool.send_messages(messages("c@mail.ru")) == 1
+
+    assert len(FakeSMTP.connections) == 1
+    assert FakeSMTP.connections[0].logged_in
+    assert FakeSMTP.connections[0].sent == ["a@mail.ru", "b@mail.ru", "c@mail.ru"]
+
+
+def test_dropped_connection_is_replaced(monkeypatch):
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", FakeSMTP)
+    FakeSMTP.connections, FakeSMTP.disconnects = [], 0
+    pool = SMTPPool(config())
+    pool.send_messages(messages("a@mail.ru"))
+
+    FakeSMTP.disconnects = 1
+    assert pool.send_messages(messages("b@mail.ru", "c@mail.ru")) == 2
+
+    assert len(FakeSMTP.connections) == 2
+    assert FakeSMTP.connections[1].sent == ["b@mail.ru", "c@mail.ru"]
+
+
+def test_dead_connection_reports_sent_messages(monkeypatch):
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", FakeSMTP)
+    FakeSMTP.connections, FakeSMTP.disconnects = [], 0
+    pool = SMTPPool(config())
+    sent = []
+
+    def send_message(smtp, message):
+        if len(sent) == 1:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        sent.append(message["To"])
+
+    monkeypatch.setattr(FakeSMTP, "send_message", send_message)
+
+    with pytest.raises(SMTPBatchInterrupted) as exc:
+        pool.send_messages(messages("a@mail.ru", "b@mail.ru", "c@mail.ru"))
+
+    assert (exc.value.sent, exc.value.total) == (1, 3)
+    assert isinstance(exc.value.__cause__, smtplib.SMTPServerDisconnected)
+
+
+def test_interrupted_batch_is_retried_without_sent_messages(monkeypatch):
+    from src.infrastructure.celery import tasks
+
+    batches = []
+
+    class FakeEmailNotifications:
+        def send_batch(self, emails):
+            batches.append(emails)
+            if len(batches) == 1:
+                raise SMTPBatchInterrupted(sent=1, total=len(emails))
+            return len(emails)
+
+    monkeypatch.setattr(tasks, "EmailNotifications", FakeEmailNotifications)
+    emails = [(f"{name}@mail.ru", "subject", "body") for name in "abc"]
+
+    tasks.send_emails.apply(args=(emails,)).get()
+
+    assert batches == [emails, emails[1:]]
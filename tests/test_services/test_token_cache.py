@@ -0,0 +1,53 @@
+import time
+
+from src.api.middleware.auth import read_cookie
+from src.infrastructure.auth.jwt import JWTProvider
+from src.infrastructure.auth.token_cache import VerifiedTokenCache
+
+
+def test_verified_token_is_decoded_once():
+    token_cache = VerifiedTokenCache(max_size=10)
+    provider = JWTProvider(token_cache=token_cache)
+    token = provider.create_access_token({"user_id": 1})
+    decoded = []
+    decode_token = provider.decode_token
+    provider.decode_token = lambda t: decoded.append(t) or decode_token(t)
+
+    assert provider.read_token(token)["user_id"] == 1
+    assert provider.read_token(token)["user_id"] == 1
+    assert len(decoded) == 1
+
+
+def test_expired_and_invalid_tokens_are_not_returned():
+    token_cache = VerifiedTokenCache(max_size=10)
+    token_cache.set("expired", {"user_id": 1, "exp": time.time() - 1})
+    token_cache.set("no exp", {"user_id": 1})
+
+    assert token_cache.get("expired") is None
+    assert token_cache.get("no exp") is None
+    assert JWTProvider(token_cache=token_cache).read_token("not a token") is None
+
+
+def test_least_recently_used_token_is_evicted():
+    token_cache = VerifiedTokenCache(max_size=2)
+    exp = time.time() + 60
+
+    token_cache.set("first", {"exp": exp})
+    token_cache.set("second", {"exp": exp})
+    token_cache.get("first")
+    token_cache.set("third", {"exp": exp})
+
+    assert token_cache.get("second") is None
+    assert token_cache.get("first") is not None and token_cache.get("third") is not None
+
+
+def test_read_cookie_from_raw_headers():
+    headers = [
+        (b"host", b"localhost"),
+        (b"cookie", b"theme=dark; access_token=abc.def"),
+        (b"cookie", b"refresh_token=xyz"),
+    ]
+
+    assert read_cookie(headers, "access_token") == "abc.def"
+    assert read_cookie(headers, "refresh_token") == "xyz"
+    assert read_cookie(headers, "missing") is None
@@ -0,0 +1,88 @@
+from sqlalchemy.dialects import postgresql
+from starlette.routing import Match
+
+from src.api.handlers.vacancy.vacancy import vacancy_router
+from src.core.enums import Currency, EmploymentType, WorkScheduleType
+from src.infrastructure.db.dao.vacancy.vacancy_dao import VacancyQueryBuilder
+
+
+def compile_query(**filters) -> tuple[str, dict]:
+    search = dict(
+        profession=None,
+        location=None,
+        salary_min=None,
+        salary_max=None,
+        salary_currency=None,
+        type_of_employment=None,
+        type_work_schedule=None,
+        experience_start=None,
+        experience_end=None,
+    )
+    search.update(filters)
+    compiled = VacancyQueryBuilder().get_query(**search).compile(dialect=postgresql.dialect())
+    return " ".join(str(compiled).split()), compiled.params
+
+
+def test_only_published_vacancies_with_active_access():
+    sql, _ = compile_query()
+
+    assert "JOIN vacancy_access ON vacancy_access.vacancy_id = vacancies.vacancy_id" in sql
+    assert (
+        "WHERE vacancies.is_published AND vacancy_access.is_active AND vacancy_access.end_date > now()"
+    ) in sql
+    assert "ORDER BY vacancies.rank_score DESC, vacancies.vacancy_id DESC" in sql
+
+
+def test_profession_and_location_are_escaped_for_ilike():
+    sql, params = compile_query(profession="50%_dev", location="C:\\Minsk")
+
+    assert "vacancies.profession ILIKE %(profession_1)s ESCAPE '\\\\'" in sql
+    assert "vacancies.location ILIKE %(location_1)s ESCAPE '\\\\'" in sql
+    assert params["profession_1"] == "%50\\%\\_dev%"
+    assert params["location_1"] == "%C:\\\\Minsk%"
+
+
+def test_salary_range_is_compared_in_base_currency():
+    sql, params = compile_query(salary_min=3000, salary_max=1000, salary_currency=Currency.USD)
+
+    assert "numrange(vacancies.salary_min_base, vacancies.salary_max_base, '[]') && numrange(" in sql
+    assert "WHERE exchange_rates.currency = %(currency_1)s" in sql
+    # swapped bounds are put in order
+    assert (params["param_1"], params["param_2"], params["currency_1"]) == (1000, 3000, Currency.USD)
+
+
+def test_currency_without_salary_range_matches_currency_of_vacancy():
+    sql, params = compile_query(salary_currency=Currency.USD)
+
+    assert "vacancies.salary_currency = %(salary_currency_1)s" in sql
+    assert "numrange" not in sql
+    assert params["salary_currency_1"] == "USD"
+
+
+def test_employment_and_schedule_overlap():
+    sql, params = compile_query(
+        type_of_employment=[EmploymentType.REMOTE, EmploymentType.FULL_TIME],
+        type_work_schedule=[WorkScheduleType.ONE_BY_ONE],
+    )
+
+    assert "vacancies.type_of_employment && %(type_of_employment_1)s::employment_type[]" in sql
+    assert "vacancies.type_work_schedule && %(type_work_schedule_1)s::type_work_schedule[]" in sql
+    assert params["type_of_employment_1"] == [EmploymentType.REMOTE, EmploymentType.FULL_TIME]
+    assert params["type_work_schedule_1"] == [WorkScheduleType.ONE_BY_ONE]
+
+
+def test_experience_window_overlaps_with_requested_one():
+    sql, params = compile_query(experience_start=5, experience_end=1)
+
+    assert "(vacancies.experience_start IS NULL OR vacancies.experience_start <= %(experience_start_1)s)" in sql
+    assert "(vacancies.experience_end IS NULL OR vacancies.experience_end >= %(experience_end_1)s)" in sql
+    # swapped window is put in order: vacancy starts before 5 years and ends after 1 year
+    assert (params["experience_start_1"], params["experience_end_1"]) == (5, 1)
+
+
+def test_search_route_is_matched_before_vacancy_id():
+    scope = {"type": "http", "method": "GET", "path": "/vacancies/search"}
+
+    route = next(route for route in vacancy_router.routes if route.matches(scope)[0] == Match.FULL)
+
+    assert route.name == "search_vacancy"
@@ -0,0 +1,86 @@
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.dto.db.work_experience.work_experience import BaseWorkExperienceDTODAO
+from src.infrastructure.db.dao.work_experience.work_experience import WorkExperienceDAO
+from src.infrastructure.db.models import WorkExperienceDB
+
+
+def _extract(field: str, value: str) -> int:
+    # EXTRACT(year|month FROM date) of Postgres, dates are ISO strings in SQLite
+    return getattr(date.fromisoformat(value), field)
+
+
+@asynccontextmanager
+async def experience_session():
+    """
+    SQLite with resume 1 of applicant 7, only columns which the DAO touches.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def register_extract(dbapi_connection, _):
+        dbapi_connection.create_function("extract", 2, _extract)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE resumes ("
+            "resume_id INTEGER PRIMARY KEY, applicant_id INTEGER, total_experience_months INTEGER, updated_at TIMESTAMP"
+            ")"
+        ))
+        await conn.run_sync(WorkExperienceDB.__table__.create)
+        await conn.execute(text("INSERT INTO resumes (resume_id, applicant_id, total_experience_months) VALUES (1, 7, 0)"))
+
+    async with AsyncSession(engine) as session:
+        yield session
+
+    await engine.dispose()
+
+
+async def total_months(session: AsyncSession) -> int:
+    return (await session.execute(text("SELECT total_experience_months FROM resumes WHERE resume_id = 1"))).scalar()
+
+
+def job(start_date: date, end_date: date | None) -> BaseWorkExperienceDTODAO:
+    return BaseWorkExperienceDTODAO(resume_id=1, company_name="Soft", start_date=start_date, end_date=end_date)
+
+
+@pytest.mark.asyncio
+async def test_open_ended_and_overlapping_jobs():
+    today = date.today()
+
+    async with experience_session() as session:
+        dao = WorkExperienceDAO(session)
+        await dao.create_work_experience(job(date(2020, 1, 1), date(2021, 3, 1)))  # 14 months
+        await dao.create_work_experience(job(date(2021, 1, 1), date(2021, 7, 1)))  # 6 months, overlaps the first
+        await dao.create_work_experience(job(date(today.year - 1, today.month, 1), None))  # till today, 12 months
+
+        # every job counts in full, as the aggregate of resume search counted them
+        assert await total_months(session) == 14 + 6 + 12
+
+
+@pytest.mark.asyncio
+async def test_total_is_recalculated_on_create_update_and_delete():
+    async with experience_session() as session:
+        dao = WorkExperienceDAO(session)
+
+        created = await dao.create_work_experience(job(date(2020, 1, 1), date(2021, 3, 1)))
+        assert await total_months(session) == 14
+
+        await dao.update_work_experience(BaseWorkExperienceDTODAO(
+            resume_id=1,
+            work_experience_id=created.work_experience_id,
+            company_name="Soft",
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 7, 1),
+        ))
+        assert await total_months(session) == 6
+
+        await dao.delete_work_experience(
+            applicant_id=7, resume_id=1, work_experience_id=created.work_experience_id
+        )
+        assert await total_months(session) == 0